@@ -0,0 +1,147 @@
+# attribution.py
+# 목적: 공정 시간 로그(rx_air_work_duration_log)를 work_srl 순서로 한 줄씩 읽으면서
+#       백업 시간을 메인 담당자에게 붙이고 Section3-Speed 행을 바로 만들기
+#   - run_all.py 의 SQL(log_norm → main_map / agg CTE)과 같은 규칙:
+#       group   = wdl_group_label 이 있으면 그것, 없으면 wdl_label
+#       메인    = wdl_group_label 이 없고 wdl_label 이 메인 라벨인 행의 member_srl 중 가장 작은 값
+#       시간    = 같은 (work, group) 의 모든 행(메인 + 백업) 시간 합
+#   - 한 work 의 행만 메모리에 들고 있다가 work_srl 이 바뀌면 내보냄 → 1년치 로그도 한 번에
+#   - SQL 이 조용히 버리던 행은 counters 로 셈 (메인 없는 백업, group 없는 백업 라벨 등)
+#   - attach_by_label=True: group 없는 백업 라벨을 run_all_251223.py 규칙으로 메인에 붙임
+#       소닉백업존N → 소닉N, 라바백업 → 라바, 로보캅백업 → 로보캅
+#       (251223 의 베큠백업 → 베큠 은 없음: 베큠은 MAIN_LABELS 가 아니라 SQL 경로에도 행이 없음,
+#        메인으로 넣으면 stream 만 베큠 행을 더 만들게 됨)
+# 사용: run_all.fetch_section3_speed (config "process_rules": {"speed_engine": "stream"})
+
+import re
+from collections import Counter
+from decimal import ROUND_HALF_UP, Decimal
+
+MAIN_LABELS = ("소닉1", "소닉2", "소닉3", "소닉4", "소닉5", "소닉6", "라바", "로보캅")
+BACKUP_LABELS = (
+    "소닉백업존1",
+    "소닉백업존2",
+    "소닉백업존3",
+    "소닉백업존4",
+    "소닉백업존5",
+    "소닉백업존6",
+    "라바백업",
+    "로보캅백업",
+)
+
+_MAIN = frozenset(MAIN_LABELS)
+_SONIC_BACKUP = re.compile(r"^소닉백업존(\d+)$")
+_BACKUP_TARGET = {"라바백업": "라바", "로보캅백업": "로보캅"}
+
+
+def backup_target(label: str):
+    # 백업 라벨 -> 메인 라벨 (백업이 아니면 None)
+    t = _BACKUP_TARGET.get(label)
+    if t:
+        return t
+    m = _SONIC_BACKUP.match(label)
+    return f"소닉{m.group(1)}" if m else None
+
+
+def parse_duration(v) -> int:
+    """
+    wdl_duration -> 초 (SQL 의 CASE 와 같은 규칙)
+      "123" → 123 / "1:02:03" → 3723 / "02:03" → 123 / 그 외 → 0
+    """
+    if v is None:
+        return 0
+    if isinstance(v, int):
+        return v
+    s = str(v)
+    if s.isdigit():
+        return int(s)
+    parts = s.split(":")
+    if len(parts) == 3:
+        h, m, sec = parts
+    elif len(parts) == 2:
+        h, (m, sec) = "0", parts
+    else:
+        return 0
+    if not (h.isdigit() and len(h) <= 2 and len(m) == 2 and len(sec) == 2 and m.isdigit() and sec.isdigit()):
+        return 0
+    if int(m) > 59 or int(sec) > 59:
+        return 0  # MySQL TIME_TO_SEC 도 잘못된 시각은 값이 안 나옴
+    return int(h) * 3600 + int(m) * 60 + int(sec)
+
+
+def round_min(total_sec: int) -> Decimal:
+    # SQL ROUND(total_sec / 60, 1) 과 같은 반올림
+    return (Decimal(total_sec) / 60).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
+
+
+def attribute_backups(rows, attach_by_label: bool = False, counters: Counter = None):
+    """
+    rows: work_srl 순서로 정렬된
+      (work_srl, date, airline, flight_title, wdl_label, wdl_group_label, member_srl, wdl_duration[, 추가 열...])
+    yield: (date, airline, flight_title, role_label, main_member_srl, total_sec, total_min[, 추가 열...])
+      추가 열(예: work_type)은 work 의 첫 행 것을 그대로 붙임
+    counters: 넘기면 셈을 채움
+      logs / works / rows_out / backup_rows / backup_attached
+      unattached_backup(메인 없는 group 의 백업 행) / unattached_sec
+      orphan_label(group 없는 백업 라벨, attach_by_label=False 일 때 버려짐)
+      no_main_member(메인 행은 있는데 member_srl 이 모두 비어 있음, SQL 경로는 member NULL 행으로 내보냄 → 여기서는 뺌)
+    """
+    c = counters if counters is not None else Counter()
+    current = None
+    head = None
+    # group -> [합계 초, 메인 member 최솟값, 메인 행 있음, 백업 행 수]
+    groups = {}
+
+    def flush():
+        for role, (total, main_member, has_main, backups) in groups.items():
+            if role not in _MAIN:
+                continue
+            if not has_main:
+                c["unattached_backup"] += backups
+                c["unattached_sec"] += total
+                continue
+            if main_member is None:
+                c["no_main_member"] += 1
+                continue
+            c["backup_attached"] += backups
+            c["rows_out"] += 1
+            yield (head[1], head[2], head[3], role, main_member, total, round_min(total)) + tuple(head[8:])
+
+    for r in rows:
+        work = r[0]
+        if work != current:
+            if current is not None:
+                yield from flush()
+            current = work
+            head = r
+            groups = {}
+            c["works"] += 1
+        c["logs"] += 1
+
+        label, group_label, member = r[4], r[5], r[6]
+        role = group_label
+        if role is None:
+            role = label
+            if label not in _MAIN:
+                target = backup_target(label or "")
+                if target and attach_by_label:
+                    role = target
+                elif target:
+                    c["orphan_label"] += 1
+        is_main = group_label is None and label in _MAIN
+        sec = parse_duration(r[7])
+
+        g = groups.get(role)
+        if g is None:
+            g = groups[role] = [0, None, False, 0]
+        g[0] += sec
+        if is_main:
+            g[2] = True
+            if member is not None and (g[1] is None or member < g[1]):
+                g[1] = member
+        else:
+            g[3] += 1
+            c["backup_rows"] += 1
+
+    if current is not None:
+        yield from flush()
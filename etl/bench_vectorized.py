@@ -0,0 +1,91 @@
+# bench_vectorized.py
+# 목적: 파이썬 루프 경로 vs NumPy 벡터 경로 속도 비교 (합성 데이터, DB 불필요)
+# 실행(etl 폴더에서):
+#   python bench_vectorized.py            # 기본 100만 행
+#   python bench_vectorized.py 200000     # 행 수 지정
+# 두 경로의 결과가 같은지도 같이 확인한다
+
+import random
+import sys
+import time
+
+from compact import SpeedTable
+from run_all import role_to_process_zone, section1_saved_py
+from vectorized import HAS_NUMPY, section1_saved_np, speed_summary_np
+
+
+# =========================
+# 합성 데이터
+# =========================
+AIRLINES = ["HH", "RF", "8M"]
+AIRCRAFT = ["A320", "A321", "B737", "B777", "A330", None]
+ROLES = ["소닉1", "소닉2", "소닉3", "소닉4", "소닉5", "소닉6", "라바", "로보캅"]
+
+
+def make_section1_rows(n: int, rnd: random.Random):
+    # (work_id, airline, aircraft, actual_sec), work_id 1~50 중 일부만 기내청소
+    return [
+        (rnd.randint(1, 50), rnd.choice(AIRLINES), rnd.choice(AIRCRAFT), rnd.randint(300, 3600))
+        for _ in range(n)
+    ]
+
+
+def make_speed_table(n: int, rnd: random.Random) -> SpeedTable:
+    table = SpeedTable(role_to_process_zone)
+    for _ in range(n):
+        msrl = rnd.randint(1, 400)
+        table.append(
+            f"2025-01-{rnd.randint(1, 28):02d}",
+            rnd.choice(AIRLINES),
+            f"FL{rnd.randint(1, 3000)}",
+            rnd.choice(ROLES),
+            msrl,
+            f"user{msrl}",
+            f"작업자{msrl}",
+            rnd.randint(60, 1800),
+            0,
+        )
+    return table
+
+
+def timed(label: str, fn):
+    t0 = time.perf_counter()
+    out = fn()
+    sec = time.perf_counter() - t0
+    print(f"  {label:<8} {sec:8.3f}s")
+    return out, sec
+
+
+# =========================
+# main
+# =========================
+def main():
+    if not HAS_NUMPY:
+        print("numpy 가 설치돼 있지 않습니다 (pip install numpy)")
+        return
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rnd = random.Random(42)
+
+    work_type_map = {wid: (10 if wid % 3 else 20) for wid in range(1, 51)}
+    work_type_ids = {10}
+    allowed = {wid for wid, wt in work_type_map.items() if wt in work_type_ids}
+    standard_map = {"HH|A320": 1800, "HH|B737": 2100, "RF|A321": 1900, "8M|B777": 3000}
+
+    print(f"### 행 수: {n:,}")
+
+    rows = make_section1_rows(n, rnd)
+    print("Section1 절감시간 points/stats")
+    py_out, py_sec = timed("python", lambda: section1_saved_py(rows, work_type_map, work_type_ids, standard_map, 2400))
+    np_out, np_sec = timed("numpy", lambda: section1_saved_np(rows, allowed, standard_map, 2400))
+    print(f"  같은 결과: {py_out == np_out}, 속도 x{py_sec / np_sec:.1f}")
+
+    table = make_speed_table(n, rnd)
+    print("Section3 속도 요약 (count/mean/median/p90)")
+    py_out, py_sec = timed("python", table.summarize)
+    np_out, np_sec = timed("numpy", lambda: speed_summary_np(table))
+    print(f"  같은 결과: {py_out == np_out}, 속도 x{py_sec / np_sec:.1f}")
+
+
+if __name__ == "__main__":
+    main()
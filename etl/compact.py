@@ -0,0 +1,275 @@
+# compact.py
+# 목적: ETL 변환 루프에서 행마다 dict/문자열 key를 만들지 않도록
+#       차원(항공사/기종/역할/작업자 등)을 작은 정수로 바꾸고, 값은 array 열로 보관
+# 사용: run_all.py 의 etl_section1 / etl_section3_speed
+#       dict 는 JSON 저장 직전(to_dicts / summarize)에만 만든다
+
+from array import array
+
+# section3_speed_rows_dict.json 형식 이름 (app.js decodeDictRows 와 같이 바꿀 것)
+DICT_ROWS_FORMAT = "dict-v1"
+DICT_ROWS_COLUMNS = ["date", "airline", "flight", "role", "member", "time_sec", "total_min"]
+
+
+class DimCodes:
+    """
+    문자열(또는 tuple) 값 -> 0,1,2... 정수 코드 (사전 인코딩)
+      codes.code("HH") -> 0
+      codes.values[0]  -> "HH"
+    """
+
+    __slots__ = ("index", "values")
+
+    def __init__(self, values=()):
+        self.index = {}
+        self.values = []
+        for v in values:
+            self.code(v)
+
+    def code(self, value) -> int:
+        c = self.index.get(value)
+        if c is None:
+            c = len(self.values)
+            self.index[value] = c
+            self.values.append(value)
+        return c
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def quantile(sorted_vals, q: float) -> float:
+    # 선형 보간 분위수 (numpy 기본값과 동일), sorted_vals 는 오름차순
+    if not sorted_vals:
+        return 0.0
+    pos = (len(sorted_vals) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_vals) - 1)
+    return float(sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (pos - lo))
+
+
+def num_out(v: float):
+    # array('d') 에서 꺼낸 값: 정수면 int 로 (기존 JSON 과 같은 모양 유지)
+    return int(v) if float(v).is_integer() else v
+
+
+class SpeedTable:
+    """
+    Section3-Speed 행을 열(array) 단위로 보관
+      - 차원: date / airline / flight_title / role_label / member_srl(+ user_id, name)
+      - 값: time_sec(int), total_min(float)
+      - role_label -> (process, zone) 은 역할 코드당 한 번만 계산
+    """
+
+    __slots__ = (
+        "classify",
+        "dates",
+        "airlines",
+        "titles",
+        "roles",
+        "members",
+        "member_info",
+        "role_pz",
+        "c_date",
+        "c_airline",
+        "c_title",
+        "c_role",
+        "c_member",
+        "time_sec",
+        "total_min",
+    )
+
+    def __init__(self, classify):
+        # classify(role_label) -> (process, zone)
+        self.classify = classify
+
+        self.dates = DimCodes()
+        self.airlines = DimCodes()
+        self.titles = DimCodes()
+        self.roles = DimCodes()
+        self.members = DimCodes()  # member_srl
+        self.member_info = []  # member code -> (user_id, name), rx_member 기준이라 srl당 하나
+        self.role_pz = []  # role code -> (process, zone)
+
+        self.c_date = array("I")
+        self.c_airline = array("B")
+        self.c_title = array("I")
+        self.c_role = array("H")
+        self.c_member = array("I")
+        self.time_sec = array("q")
+        self.total_min = array("d")
+
+    def __len__(self) -> int:
+        return len(self.time_sec)
+
+    def append(self, d, airline, title, role_label, member_srl, user_id, name, time_sec, total_min) -> None:
+        role = self.roles.code(role_label)
+        if role == len(self.role_pz):
+            process, zone = self.classify(role_label)
+            self.role_pz.append((process, str(zone)))
+
+        self.c_date.append(self.dates.code(str(d)))
+        self.c_airline.append(self.airlines.code(airline))
+        self.c_title.append(self.titles.code(title))
+        self.c_role.append(role)
+        m = self.members.code(int(member_srl))
+        if m == len(self.member_info):
+            self.member_info.append((user_id or "", name or ""))
+
+        self.c_member.append(m)
+        self.time_sec.append(int(time_sec or 0))
+        self.total_min.append(float(total_min or 0))
+
+    def to_dicts(self):
+        # JSON 저장용: 기존 section3_speed_rows.json 과 같은 행 모양
+        dates = self.dates.values
+        airlines = self.airlines.values
+        titles = self.titles.values
+        roles = self.roles.values
+        members = self.members.values
+        member_info = self.member_info
+        role_pz = self.role_pz
+
+        for i in range(len(self.time_sec)):
+            role = self.c_role[i]
+            process, zone = role_pz[role]
+            m = self.c_member[i]
+            user_id, name = member_info[m]
+            yield {
+                "date": dates[self.c_date[i]],
+                "airline": airlines[self.c_airline[i]],
+                "flight_title": titles[self.c_title[i]],
+                "role_label": roles[role],      # 소닉1/2/.. 라바/로보캅
+                "process": process,             # 소닉/라바/로보캅
+                "zone": zone,                   # 소닉은 1~6, 그 외 0
+                "member_srl": members[m],
+                "member_user_id": user_id,
+                "member_name": name,
+                "time_sec": self.time_sec[i],
+                "backup_sec_attached": 0,       # 이미 SQL에서 합산했으므로 0
+                "total_min": self.total_min[i],
+            }
+
+    def to_dict_payload(self) -> dict:
+        """
+        문자열 테이블 + index 행 (section3_speed_rows_dict.json)
+          tables: airlines / dates / flights / roles[label, process, zone] / members[srl, user_id, name]
+          rows:   [date, airline, flight, role, member, time_sec, total_min] (앞 5개는 테이블 index)
+        이미 정수 코드로 들고 있으므로 코드 그대로 쓴다
+        """
+        return {
+            "format": DICT_ROWS_FORMAT,
+            "columns": DICT_ROWS_COLUMNS,
+            "tables": {
+                "airlines": list(self.airlines.values),
+                "dates": list(self.dates.values),
+                "flights": list(self.titles.values),
+                "roles": [[label, p, z] for label, (p, z) in zip(self.roles.values, self.role_pz)],
+                "members": [[srl, uid, name] for srl, (uid, name) in zip(self.members.values, self.member_info)],
+            },
+            "rows": [
+                [
+                    self.c_date[i],
+                    self.c_airline[i],
+                    self.c_title[i],
+                    self.c_role[i],
+                    self.c_member[i],
+                    self.time_sec[i],
+                    self.total_min[i],
+                ]
+                for i in range(len(self.time_sec))
+            ],
+        }
+
+    def summarize(self, sample_n: int = 3) -> list:
+        """
+        (airline, process, zone, member) 단위 요약
+          - count / sum / mean / median / p90 (time_sec 기준)
+          - sample: 첫 번째 행(날짜/편명/time_sec), sample_flights: 편명 최대 sample_n개
+        정렬: airline, process, zone, mean 오름차순(빠른 사람 먼저)
+        """
+        role_pz = self.role_pz
+
+        # 그룹 key = (airline 코드, process, zone, member 코드) → 그룹 번호
+        group_of = {}
+        first_row = []  # group -> 첫 행 index
+        times = []  # group -> array('q')
+        flights = []  # group -> [title 코드...]
+
+        for i in range(len(self.time_sec)):
+            process, zone = role_pz[self.c_role[i]]
+            key = (self.c_airline[i], process, zone, self.c_member[i])
+            g = group_of.get(key)
+            if g is None:
+                g = group_of[key] = len(first_row)
+                first_row.append(i)
+                times.append(array("q"))
+                flights.append([])
+            times[g].append(self.time_sec[i])
+            t = self.c_title[i]
+            if len(flights[g]) < sample_n and t not in flights[g]:
+                flights[g].append(t)
+
+        out = []
+        for (a, process, zone, m), g in group_of.items():
+            ts = sorted(times[g])
+            total = sum(ts)
+            i = first_row[g]
+            user_id, name = self.member_info[m]
+            out.append(
+                {
+                    "airline": self.airlines.values[a],
+                    "process": process,
+                    "zone": zone,
+                    "member_srl": self.members.values[m],
+                    "member_user_id": user_id,
+                    "member_name": name,
+                    "count": len(ts),
+                    "sum_sec": int(total),
+                    "mean_sec": round(total / len(ts), 1),
+                    "median_sec": round(quantile(ts, 0.5), 1),
+                    "p90_sec": round(quantile(ts, 0.9), 1),
+                    "sample": {
+                        "date": self.dates.values[self.c_date[i]],
+                        "flight_title": self.titles.values[self.c_title[i]],
+                        "time_sec": self.time_sec[i],
+                    },
+                    "sample_flights": [self.titles.values[t] for t in flights[g]],
+                }
+            )
+
+        out.sort(key=lambda r: (r["airline"], r["process"], r["zone"], r["mean_sec"]))
+        return out
+
+
+def dict_rows_shard(payload: dict, airline: str) -> dict:
+    """
+    to_dict_payload() 결과에서 한 항공사 몫만 남기고,
+    테이블도 그 항공사 행이 쓰는 값만 남도록 index 를 다시 매긴다
+    """
+    tables = payload["tables"]
+    a = tables["airlines"].index(airline) if airline in tables["airlines"] else -1
+    rows = [r for r in payload["rows"] if r[1] == a]
+
+    # 열 번호 -> 테이블 이름 (airline 열은 항상 0 하나)
+    table_cols = {0: "dates", 2: "flights", 3: "roles", 4: "members"}
+    codes = {col: DimCodes(r[col] for r in rows) for col in table_cols}
+
+    out = {k: v for k, v in payload.items() if k not in ("tables", "rows")}
+    out["tables"] = {"airlines": [airline]}
+    for col, name in table_cols.items():
+        out["tables"][name] = [tables[name][c] for c in codes[col].values]
+    out["rows"] = [
+        [
+            codes[0].index[r[0]],
+            0,
+            codes[2].index[r[2]],
+            codes[3].index[r[3]],
+            codes[4].index[r[4]],
+            r[5],
+            r[6],
+        ]
+        for r in rows
+    ]
+    out["airline"] = airline
+    return out
@@ -0,0 +1,421 @@
+# etl_daemon.py
+# 목적: run_all.py 를 상주 프로세스로 돌리기 (cron 으로 매번 새로 실행하는 대신)
+#   - DB 연결 / 표준시간을 메모리에 유지 (run_all.DIM_CACHE_TTL_SEC)
+#     work_type 매핑은 갱신마다 새 work(ex_srl > 지금까지 본 최댓값)만 덧붙임 (없으면 Section1 에서 빠지므로)
+#   - 원본 행을 날짜별로 들고 있다가
+#       hot  갱신(자주): 최근 hot_days 일만 DB 에서 다시 받아 교체
+#       cold 갱신(가끔): 전체 기간을 다시 받음 (지난 날짜 수정분 반영)
+#     → 둘 다 같은 JSON 파일 전체를 다시 만듦 (대시보드는 그대로)
+#   - 잠금(run_all.etl_lock): 갱신은 한 번에 하나 (cron 의 run_all.py 와도 겹치지 않음)
+#   - 수동 갱신: SIGUSR1 또는 cache/refresh.trigger 파일 수정(touch)
+#       갱신 중에 여러 번 요청해도 끝난 뒤 한 번만 더 실행 (요청 합치기)
+#       trigger 파일 내용이 "cold" 면 전체 기간 갱신
+#   - 변경 감지(watch_interval_sec 마다): rx_air_work.ex_srl / rx_air_work_duration_log.wdl_srl 의
+#     최댓값(high-water mark)만 확인 → 늘었으면 새 행이 걸린 (날짜, 항공사)만 다시 받아 교체
+#     (기존 행 수정은 id 가 안 늘어서 못 잡음 → hot/cold 갱신이 챙김)
+#   - 갱신이 끝나면 바뀐 파일 목록을 열린 대시보드에 SSE 로 보냄 (live_events.py)
+#   - perf_collect 를 켜면 같은 포트의 POST /perf 로 대시보드 성능 요약(app.js perfSend)을 받아
+#     cache/frontend_perf.jsonl 에 한 줄씩 쌓음 (perf_log_max_mb 를 넘으면 .1 로 돌리고 새로 시작)
+#
+# 실행(etl 폴더에서): python etl_daemon.py
+# config.json (선택, 기본값):
+#   "daemon": {"hot_days": 3, "hot_interval_min": 10, "cold_interval_min": 360, "dim_ttl_min": 60,
+#              "watch_interval_sec": 30, "wdl_id_column": "wdl_srl",
+#              "sse_host": "127.0.0.1", "sse_port": 8765, "sse_allow_origin": "*",
+#              "perf_collect": false, "perf_log_max_mb": 20}
+#   sse_port 0 이면 SSE 끔 / 대시보드 쪽은 index.html 의 <meta name="etl-events"> 에 주소를 넣음
+#   sse_host 기본은 이 PC 에서만 접속 (다른 PC 의 대시보드도 받으려면 "0.0.0.0" + sse_allow_origin 을 대시보드 주소로)
+#   성능 수집은 perf_collect: true + index.html 의 <meta name="perf-collector"> 에 http://<호스트>:<sse_port>/perf
+
+import json
+import os
+import signal
+import threading
+import time
+from datetime import date, timedelta
+from operator import itemgetter
+
+import run_all
+from live_events import LiveEvents
+from run_all import (
+    ROW_AIRLINE_COL,
+    assert_cfg,
+    connect_db,
+    day_int,
+    ensure_out_dir,
+    etl_lock,
+    etl_section1,
+    etl_section2,
+    etl_section3_speed,
+    fetch_section1,
+    fetch_section2,
+    fetch_section3_speed,
+    finish_outputs,
+    load_config,
+    load_manifest,
+    now_iso,
+    scope_range,
+)
+
+TRIGGER_PATH = os.path.join("cache", "refresh.trigger")
+FRONTEND_PERF_PATH = os.path.join("cache", "frontend_perf.jsonl")
+DEFAULT_PERF_LOG_MAX_MB = 20
+POLL_SEC = 5
+
+# (이름, 원본 받기, JSON 만들기)
+SECTIONS = [
+    ("section1", fetch_section1, etl_section1),
+    ("section2", fetch_section2, etl_section2),
+    ("section3_speed", fetch_section3_speed, etl_section3_speed),
+]
+
+# 하루 안에서 SQL ORDER BY 순서를 다시 맞출 열 (speed: flight_title, role_label, member)
+DAY_SORT_KEY = {"speed": itemgetter(2, 3, 4)}
+
+
+def log(msg: str) -> None:
+    print(f"[{now_iso()}] {msg}", flush=True)
+
+
+# =========================
+# 변경 감지 (high-water mark)
+# =========================
+def read_watermarks(conn, wdl_col: str) -> tuple:
+    # PK 최댓값 두 개 → 인덱스만 보므로 몇 ms
+    with conn.cursor() as cur:
+        cur.execute("SELECT COALESCE(MAX(ex_srl), 0) FROM rx_air_work;")
+        work = cur.fetchone()[0]
+        cur.execute(f"SELECT COALESCE(MAX({wdl_col}), 0) FROM rx_air_work_duration_log;")
+        wdl = cur.fetchone()[0]
+    return int(work), int(wdl)
+
+
+def touched_days(conn, wdl_col: str, prev: tuple, cur_marks: tuple) -> set:
+    """
+    prev < id <= cur_marks 인 새 행이 걸린 {(yyyymmdd, airline)}
+      - rx_air_work: 새 작업 자체
+      - rx_air_work_duration_log: 기존 작업에 새로 붙은 공정 시간 → 그 작업의 날짜
+    """
+    sql_work = """
+    SELECT DISTINCT w.date, o.airline_code
+    FROM rx_air_work w
+    JOIN rx_air_operation o ON o.ex_srl = w.operation_srl
+    WHERE w.ex_srl > %s AND w.ex_srl <= %s;
+    """
+    sql_wdl = f"""
+    SELECT DISTINCT w.date, o.airline_code
+    FROM rx_air_work_duration_log dl
+    JOIN rx_air_work w ON w.ex_srl = dl.work_srl
+    JOIN rx_air_operation o ON o.ex_srl = w.operation_srl
+    WHERE dl.{wdl_col} > %s AND dl.{wdl_col} <= %s;
+    """
+    out = set()
+    with conn.cursor() as cur:
+        if cur_marks[0] > prev[0]:
+            cur.execute(sql_work, (prev[0], cur_marks[0]))
+            out.update((day_int(d), a) for d, a in cur.fetchall() if d)
+        if cur_marks[1] > prev[1]:
+            cur.execute(sql_wdl, (prev[1], cur_marks[1]))
+            out.update((day_int(d), a) for d, a in cur.fetchall() if d)
+    return out
+
+
+def merge_rows(cached: dict, fresh: dict, keep: tuple, replace: tuple, airlines: list) -> dict:
+    """
+    날짜별 원본 행 캐시에 새로 받은 행을 합침
+      keep:    (from, to) 이 범위 밖 날짜는 버림
+      replace: (from, to) 이 범위 날짜에서 airlines 행은 새로 받은 것으로 교체
+    """
+    replace_set = set(airlines)
+    merged = {}
+    for part, by_day in fresh.items():
+        col = ROW_AIRLINE_COL[part]
+        out = {}
+        for d, rs in cached.get(part, {}).items():
+            if not keep[0] <= d <= keep[1]:
+                continue
+            if replace[0] <= d <= replace[1]:
+                rs = [r for r in rs if r[col] not in replace_set]
+                if not rs:
+                    continue
+            out[d] = rs
+        for d, rs in by_day.items():
+            if d in out:
+                rs = out[d] + list(rs)
+                if part in DAY_SORT_KEY:
+                    rs.sort(key=DAY_SORT_KEY[part])
+            out[d] = rs
+        merged[part] = out
+    return merged
+
+
+class EtlDaemon:
+    def __init__(self, cfg: dict):
+        self.cfg = cfg
+        d = cfg.get("daemon", {})
+        self.hot_days = int(d.get("hot_days", 3))
+        self.hot_interval = float(d.get("hot_interval_min", 10)) * 60
+        self.cold_interval = float(d.get("cold_interval_min", 360)) * 60
+        self.watch_interval = float(d.get("watch_interval_sec", 30))
+        self.wdl_col = d.get("wdl_id_column", "wdl_srl")
+        run_all.DIM_CACHE_TTL_SEC = float(d.get("dim_ttl_min", 60)) * 60
+
+        self.airlines = cfg["scope"]["airlines"]
+        self.out_dir = ensure_out_dir()
+
+        self.conn = None
+        # section -> {데이터 이름 -> {yyyymmdd: [rows]}}
+        self.rows = {name: None for name, _, _ in SECTIONS}
+        self.last_hot = 0.0
+        self.last_cold = 0.0
+        self.last_watch = 0.0
+        # (max ex_srl, max wdl id): cold 갱신 때 처음 잡고, 변경 감지가 올려감
+        self.marks = None
+
+        # 수동 요청: set() 이 여러 번이어도 한 번 처리 (Event 가 요청 합치기 역할)
+        self.wake = threading.Event()
+        self.manual_kind = None
+        self.stopping = False
+        self.trigger_mtime = self._trigger_mtime()
+
+        # 열린 대시보드에 바뀐 파일 알림 (SSE)
+        self.live = None
+        sse_port = int(d.get("sse_port", 8765))
+        if sse_port:
+            self.live = LiveEvents(
+                d.get("sse_host", "127.0.0.1"),
+                sse_port,
+                snapshot=self.manifest_snapshot,
+                allow_origin=d.get("sse_allow_origin", "*"),
+                on_perf=self.save_frontend_perf if d.get("perf_collect", False) else None,
+            )
+        self.perf_lock = threading.Lock()
+        self.perf_log_max = float(d.get("perf_log_max_mb", DEFAULT_PERF_LOG_MAX_MB)) * 1024 * 1024
+
+    # ---- 연결 ----
+    def db(self):
+        if self.conn is None:
+            self.conn = connect_db(self.cfg)
+        else:
+            self.conn.ping(reconnect=True)
+        return self.conn
+
+    def drop_db(self) -> None:
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+        self.conn = None
+
+    # ---- 수동 요청 ----
+    def request(self, kind: str = "hot") -> None:
+        # cold 요청이 하나라도 있으면 cold 로 합침
+        if kind == "cold" or self.manual_kind is None:
+            self.manual_kind = kind
+        self.wake.set()
+
+    def _trigger_mtime(self):
+        try:
+            return os.path.getmtime(TRIGGER_PATH)
+        except OSError:
+            return None
+
+    def poll_trigger_file(self) -> None:
+        m = self._trigger_mtime()
+        if m is None or m == self.trigger_mtime:
+            return
+        self.trigger_mtime = m
+        try:
+            with open(TRIGGER_PATH, "r", encoding="utf-8") as f:
+                kind = "cold" if f.read().strip() == "cold" else "hot"
+        except OSError:
+            kind = "hot"
+        self.request(kind)
+
+    # ---- 대시보드 알림 ----
+    def manifest_snapshot(self) -> dict:
+        m = load_manifest(self.out_dir)
+        return {"generated_at": m.get("generated_at"), "files": m.get("files", {})}
+
+    def push_changes(self, before: dict) -> None:
+        # manifest 해시가 달라진 파일만 보냄 (write_json 이 같은 내용은 다시 안 씀)
+        after = self.manifest_snapshot()
+        changed = {
+            f: e for f, e in after["files"].items() if before.get(f, {}).get("sha256") != e.get("sha256")
+        }
+        if not changed or self.live is None:
+            return
+        n = self.live.broadcast({"generated_at": after["generated_at"], "files": changed})
+        log(f"📡 바뀐 파일 {len(changed)}개 → 대시보드 {n}개")
+
+    def save_frontend_perf(self, payload: dict, client_ip: str) -> None:
+        # SSE 서버 스레드에서 불림 → 파일 쓰기만 잠금 (기기별 추이는 device_id 로 묶어서 봄)
+        line = json.dumps({"received_at": now_iso(), "client_ip": client_ip, **payload}, ensure_ascii=False)
+        with self.perf_lock:
+            os.makedirs(os.path.dirname(FRONTEND_PERF_PATH), exist_ok=True)
+            # 크기 상한: 넘으면 .1 로 돌려 두고 새 파일 (디스크가 계속 차지 않게, 직전 분량은 남김)
+            try:
+                if os.path.getsize(FRONTEND_PERF_PATH) >= self.perf_log_max:
+                    os.replace(FRONTEND_PERF_PATH, FRONTEND_PERF_PATH + ".1")
+            except OSError:
+                pass  # 아직 파일 없음
+            with open(FRONTEND_PERF_PATH, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    # ---- 갱신 ----
+    def refresh(self, kind: str, touched: set = None, marks: tuple = None) -> None:
+        """
+        kind:
+          cold  전체 기간 다시 받기 (처음 한 번은 항상 cold)
+          hot   최근 hot_days 일, 모든 항공사
+          delta 변경 감지가 찾은 (날짜, 항공사)만 → touched, 끝나면 marks 로 올림
+        """
+        date_from, date_to = scope_range(self.cfg)
+        fetch_to = date_to
+        fetch_airlines = self.airlines
+        if kind == "cold" or any(v is None for v in self.rows.values()):
+            kind = "cold"
+            fetch_from = date_from
+            run_all.DIM_CACHE.clear()  # 전체 갱신 때는 차원도 새로
+        elif kind == "delta":
+            hits = [(d, a) for d, a in touched if date_from <= d <= date_to and a in self.airlines]
+            if not hits:
+                self.marks = marks  # 범위 밖 날짜만 바뀜 → 표시할 것 없음
+                return
+            fetch_from = min(d for d, _ in hits)
+            fetch_to = max(d for d, _ in hits)
+            fetch_airlines = sorted({a for _, a in hits})
+        else:
+            hot_from = int((date.today() - timedelta(days=self.hot_days)).strftime("%Y%m%d"))
+            fetch_from = max(date_from, hot_from)
+
+        t0 = time.perf_counter()
+        with etl_lock():
+            conn = self.db()
+            if kind != "cold":
+                # hot / delta 가 새로 받는 행에는 새 work(ex_srl)가 섞임 → 매핑에 새 work 만 덧붙임
+                run_all.extend_work_type_map(conn)
+            if kind == "cold":
+                # 받기 전에 잡아야 받는 도중 들어온 행을 다음 감지에서 놓치지 않음
+                marks = read_watermarks(conn, self.wdl_col)
+            before = self.manifest_snapshot()["files"]
+
+            for name, fetch, build in SECTIONS:
+                fresh = fetch(conn, self.cfg, fetch_from, fetch_to, fetch_airlines)
+                merged = merge_rows(
+                    self.rows[name] or {},
+                    fresh,
+                    keep=(date_from, date_to),
+                    replace=(fetch_from, fetch_to),
+                    airlines=fetch_airlines,
+                )
+                self.rows[name] = merged
+                build(conn, self.cfg, date_from, date_to, self.out_dir, self.airlines, data=merged)
+
+            finish_outputs(self.out_dir, self.airlines)
+
+        # hot 은 marks 를 올리지 않음 (hot 범위 밖 날짜에 붙은 새 행을 감지가 계속 잡도록)
+        if marks is not None:
+            self.marks = marks
+        now = time.monotonic()
+        if kind != "delta":
+            self.last_hot = now
+        if kind == "cold":
+            self.last_cold = now
+        log(
+            f"✅ {kind} 갱신 완료 ({fetch_from}~{fetch_to} {','.join(fetch_airlines)}, "
+            f"{time.perf_counter() - t0:.1f}s)"
+        )
+        self.push_changes(before)
+
+    def watch(self) -> None:
+        # 최댓값 두 개만 보고, 늘었을 때만 어떤 날짜/항공사인지 확인
+        conn = self.db()
+        marks = read_watermarks(conn, self.wdl_col)
+        if marks == self.marks:
+            return
+        touched = touched_days(conn, self.wdl_col, self.marks, marks)
+        log(f"변경 감지 {self.marks} → {marks}: {sorted(touched)}")
+        self.refresh("delta", touched=touched, marks=marks)
+
+    def next_due(self):
+        # (종류, 남은 초)
+        now = time.monotonic()
+        cold_left = self.last_cold + self.cold_interval - now
+        hot_left = self.last_hot + self.hot_interval - now
+        if cold_left <= hot_left:
+            return "cold", cold_left
+        return "hot", hot_left
+
+    def run_safely(self, label: str, fn, *args) -> bool:
+        try:
+            fn(*args)
+            return True
+        except BlockingIOError as e:
+            # cron 의 run_all.py 등이 실행 중 → 잠시 뒤 다시
+            log(f"⏩ {e}")
+            time.sleep(POLL_SEC)
+        except Exception as e:
+            # DB 끊김 등: 연결을 버리고 다음 주기에 다시 연결
+            log(f"❌ {label} 실패: {e!r}")
+            self.drop_db()
+        return False
+
+    def run_forever(self) -> None:
+        log(
+            f"### ETL 데몬 시작 (hot {self.hot_days}일/{self.hot_interval / 60:.0f}분, "
+            f"cold {self.cold_interval / 60:.0f}분, 감지 {self.watch_interval:.0f}초) ###"
+        )
+        if self.live is not None:
+            self.live.start()
+            log(f"SSE: http://{self.live.host}:{self.live.port}/events")
+
+        while not self.stopping:
+            kind, left = self.next_due()
+            if self.wake.is_set():
+                self.wake.clear()
+                kind = "cold" if self.manual_kind == "cold" or left <= 0 and kind == "cold" else "hot"
+                self.manual_kind = None
+                left = 0
+                log(f"수동 갱신 요청 → {kind}")
+
+            if left <= 0:
+                if not self.run_safely(f"{kind} 갱신", self.refresh, kind):
+                    self.last_hot = time.monotonic()  # 실패해도 바로 다시 돌지 않게
+                continue
+
+            watch_left = self.last_watch + self.watch_interval - time.monotonic()
+            if self.marks is not None and watch_left <= 0:
+                self.last_watch = time.monotonic()
+                self.run_safely("변경 감지", self.watch)
+                continue
+
+            self.wake.wait(timeout=max(0.0, min(left, watch_left, POLL_SEC)))
+            self.poll_trigger_file()
+
+        if self.live is not None:
+            self.live.stop()
+        self.drop_db()
+        log("### ETL 데몬 종료 ###")
+
+
+def main():
+    cfg = load_config()
+    assert_cfg(cfg)
+    daemon = EtlDaemon(cfg)
+
+    def stop(signum, frame):
+        daemon.stopping = True
+        daemon.wake.set()
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    if hasattr(signal, "SIGUSR1"):  # 윈도우에는 없음 → trigger 파일 사용
+        signal.signal(signal.SIGUSR1, lambda signum, frame: daemon.request("hot"))
+
+    daemon.run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# export_facts.py
+# 목적: 긴 기간(예: 분기)의 원본 사실 데이터를 CSV / Parquet 로 내보내기 (운영팀 요청용)
+#   - speed: 작업자 공정 속도 행 (section3_speed_rows 와 같은 SQL / process·zone 분류)
+#            process_rules.speed_engine 이 "stream" 이면 ETL 과 같이 run_all.fetch_speed_stream
+#            (attach_backup_by_label 포함, 로그는 흘려 받고 결과 행만 메모리에 둔 뒤 나눠 씀)
+#   - saved: 절감시간 행 (section1_saved_points 와 같은 SQL / work_type 필터 / 표준시간)
+# 특징: DB 서버 측 커서(SSCursor)에서 BATCH_SIZE 행씩 받아 바로 파일에 씀 → 메모리 일정
+#
+# 실행(etl 폴더에서, config.json 의 db 사용):
+#   python export_facts.py speed --from 2025-01-01 --to 2025-03-31 --out speed_2025Q1.csv
+#   python export_facts.py saved --from 2025-01-01 --to 2025-03-31 --airline HH --out saved_HH.parquet
+#   python export_facts.py speed --from 2025-01-01 --to TODAY --process 소닉 --process 라바 --out sonic.csv
+# Parquet 는 pyarrow 가 있어야 함 (pip install pyarrow), 형식은 --format 또는 확장자로 결정
+
+import argparse
+import csv
+import os
+import sys
+from collections import Counter
+
+from run_all import (
+    build_saved_sql,
+    build_speed_sql,
+    connect_db,
+    fetch_speed_stream,
+    load_config,
+    load_standard_times,
+    role_to_process_zone,
+    today_yyyymmdd,
+    yyyymmdd_from_dash,
+)
+
+BATCH_SIZE = 20_000
+
+# (컬럼, Arrow 타입) — CSV 는 컬럼 이름만, Parquet 는 이 타입으로 스키마를 고정
+#   (첫 배치에서 추론하면 값이 전부 None 인 컬럼이 null 타입이 되어 다음 배치에서 깨짐)
+SPEED_SCHEMA = [
+    ("date", "string"),
+    ("airline", "string"),
+    ("flight_title", "string"),
+    ("role_label", "string"),
+    ("process", "string"),
+    ("zone", "string"),
+    ("member_srl", "int64"),
+    ("member_user_id", "string"),
+    ("member_name", "string"),
+    ("time_sec", "int64"),
+    ("total_min", "float64"),
+]
+
+SAVED_SCHEMA = [
+    ("work_yyyymmdd", "int64"),
+    ("work_id", "int64"),
+    ("airline", "string"),
+    ("aircraft", "string"),
+    ("actual_sec", "float64"),
+    ("standard_sec", "float64"),
+    ("saved_sec", "float64"),
+]
+
+SPEED_COLUMNS = [c for c, _ in SPEED_SCHEMA]
+SAVED_COLUMNS = [c for c, _ in SAVED_SCHEMA]
+
+
+# =========================
+# 출력 (CSV / Parquet)
+# =========================
+class CsvSink:
+    def __init__(self, path: str, schema: list):
+        # utf-8-sig: 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        self.f = open(path, "w", encoding="utf-8-sig", newline="")
+        self.w = csv.writer(self.f)
+        self.w.writerow([c for c, _ in schema])
+
+    def write(self, rows: list) -> None:
+        self.w.writerows(rows)
+
+    def close(self) -> None:
+        self.f.close()
+
+
+class ParquetSink:
+    def __init__(self, path: str, schema: list):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("❌ Parquet 출력에는 pyarrow 가 필요합니다 (pip install pyarrow) — CSV 는 그냥 됩니다")
+        self.pa = pa
+        self.columns = [c for c, _ in schema]
+        self.schema = pa.schema([(c, pa.type_for_alias(t)) for c, t in schema])
+        # 행이 하나도 없어도 빈 파일(컬럼만)은 만들어지도록 처음부터 연다
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, rows: list) -> None:
+        # 배치 하나 = row group 하나
+        table = self.pa.Table.from_pylist([dict(zip(self.columns, r)) for r in rows], schema=self.schema)
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def open_sink(path: str, fmt: str, schema: list):
+    if fmt == "parquet":
+        return ParquetSink(path, schema)
+    return CsvSink(path, schema)
+
+
+# =========================
+# 행 변환 (ETL 과 같은 규칙)
+# =========================
+def cursor_batches(cur):
+    # 서버 측 커서에서 BATCH_SIZE 행씩
+    while True:
+        batch = cur.fetchmany(BATCH_SIZE)
+        if not batch:
+            return
+        yield batch
+
+
+def list_batches(rows: list):
+    # 이미 받아 둔 행(speed_engine "stream")을 BATCH_SIZE 행씩
+    for i in range(0, len(rows), BATCH_SIZE):
+        yield rows[i : i + BATCH_SIZE]
+
+
+def speed_facts(batches, processes: set, counters: Counter):
+    # build_speed_sql / fetch_speed_stream 결과 한 행 -> SPEED_COLUMNS
+    #   SQL 경로는 메인 담당자의 member_srl 이 비어 있으면 NULL 로 내보냄 → stream 과 같이 빼고 셈
+    for batch in batches:
+        out = []
+        for d, airline, title, role_label, msrl, user_id, name, total_sec, total_min in batch:
+            if msrl is None:
+                counters["no_main_member"] += 1
+                continue
+            process, zone = role_to_process_zone(role_label)
+            if processes and process not in processes:
+                continue
+            out.append(
+                (
+                    str(d),
+                    airline,
+                    title,
+                    role_label,
+                    process,
+                    str(zone),
+                    int(msrl),
+                    user_id or "",
+                    name or "",
+                    int(total_sec or 0),
+                    float(total_min or 0),
+                )
+            )
+        yield out
+
+
+def saved_facts(batches, work_type_map: dict, work_type_ids: set):
+    # build_saved_sql(with_date=True) 결과 한 행 -> SAVED_COLUMNS
+    standard_cfg = load_standard_times()
+    default_standard_sec = standard_cfg["default_standard_sec"]
+    standard_map = standard_cfg.get("by_airline_aircraft", {})
+
+    for batch in batches:
+        out = []
+        for work_id, airline, aircraft, actual_sec, ymd in batch:
+            if work_type_map.get(work_id) not in work_type_ids:
+                continue
+            # float: DB 드라이버에 따라 actual_sec 이 Decimal 로 올 수 있음 → Parquet float64 / CSV 표기를 맞춤
+            actual = float(actual_sec)
+            std = float(standard_map.get(f"{airline}|{aircraft}", default_standard_sec))
+            out.append((int(ymd), int(work_id), airline, aircraft, actual, std, std - actual))
+        yield out
+
+
+# =========================
+# main
+# =========================
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="속도/절감시간 원본 행을 CSV 또는 Parquet 로 내보내기")
+    ap.add_argument("kind", choices=["speed", "saved"])
+    ap.add_argument("--from", dest="date_from", required=True, help="YYYY-MM-DD")
+    ap.add_argument("--to", dest="date_to", required=True, help="YYYY-MM-DD 또는 TODAY")
+    ap.add_argument("--airline", action="append", help="여러 번 지정 가능 (없으면 config scope.airlines 전체)")
+    ap.add_argument("--process", action="append", help="speed 전용: 소닉/라바/로보캅 (여러 번 지정 가능)")
+    ap.add_argument("--format", choices=["csv", "parquet"], help="없으면 --out 확장자로 판단")
+    ap.add_argument("--out", required=True)
+    return ap.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cfg = load_config()
+
+    airlines = args.airline or cfg["scope"]["airlines"]
+    date_from = yyyymmdd_from_dash(args.date_from)
+    date_to = today_yyyymmdd() if args.date_to == "TODAY" else yyyymmdd_from_dash(args.date_to)
+    fmt = args.format or ("parquet" if args.out.lower().endswith(".parquet") else "csv")
+
+    if args.process and args.kind != "speed":
+        sys.exit("❌ --process 는 speed 에서만 쓸 수 있습니다")
+
+    # 작업 유형 매핑은 작아서 일반 커서로 먼저 받음 (saved 필터용)
+    work_type_ids = set(cfg["work_types"]["cabin_cleaning"])
+    work_type_map = {}
+    if args.kind == "saved":
+        conn = connect_db(cfg)
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT ex_srl, work_type FROM rx_air_work WHERE work_type IS NOT NULL;")
+                work_type_map = {r[0]: r[1] for r in cur.fetchall()}
+        finally:
+            conn.close()
+
+    stream_speed = args.kind == "speed" and cfg.get("process_rules", {}).get("speed_engine", "sql") == "stream"
+    if args.kind == "speed":
+        sql, params = build_speed_sql(cfg, date_from, date_to, airlines)
+        schema = SPEED_SCHEMA
+    else:
+        sql, params = build_saved_sql(date_from, date_to, airlines, with_date=True)
+        schema = SAVED_SCHEMA
+
+    # 다 쓴 다음에 이름을 바꿔서, 중간에 실패하면 반쯤 쓴 파일이 남지 않게
+    tmp_path = f"{args.out}.part"
+    sink = open_sink(tmp_path, fmt, schema)
+    n = 0
+    counters = Counter()
+
+    # stream: 로그는 fetch_speed_stream 안의 RowStream 이 받고, conn 은 이름 조회에만 씀
+    conn = connect_db(cfg, streaming=not stream_speed)
+    try:
+        with conn.cursor() as cur:
+            if stream_speed:
+                batches = list_batches(fetch_speed_stream(conn, cfg, date_from, date_to, airlines))
+            else:
+                cur.execute(sql, params)
+                batches = cursor_batches(cur)
+            if args.kind == "speed":
+                batches = speed_facts(batches, set(args.process or []), counters)
+            else:
+                batches = saved_facts(batches, work_type_map, work_type_ids)
+            for rows in batches:
+                if rows:
+                    sink.write(rows)
+                    n += len(rows)
+                    print(f"... {n:,} 행", end="\r", flush=True)
+        sink.close()
+        os.replace(tmp_path, args.out)
+    except BaseException:
+        sink.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        conn.close()
+
+    if counters["no_main_member"]:
+        print(f"⚠️ 메인 담당자 member_srl 이 없는 행 {counters['no_main_member']:,} 개 제외")
+    print(f"✅ {args.kind} {n:,} 행 → {args.out} ({fmt})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# live_events.py
+# 목적: 열려 있는 대시보드에 "바뀐 파일 목록"을 바로 알려주기 (Server-Sent Events)
+#   - etl_daemon.py 가 갱신을 끝낼 때마다 broadcast({"files": {파일명: manifest 항목}})
+#   - 브라우저(app.js)는 바뀐 파일만 ?v=<해시> 로 다시 받아서 그 섹션 차트만 다시 그림
+#   - 새로 연결된 브라우저에는 현재 manifest 전체를 먼저 보냄
+#     → 연결이 끊겼다 다시 붙어도, 그 사이 바뀐 파일을 브라우저가 해시 비교로 찾아냄
+# 표준 라이브러리만 사용 (http.server), 대시보드와 포트가 달라서 CORS 헤더를 붙임
+#
+# 연결: GET http://<호스트>:<sse_port>/events
+#   event: update
+#   data: {"generated_at": "...", "files": {"section1_counts.json": {"sha256": ..., ...}}}
+# 같은 포트로 대시보드 성능 요약도 받음 (app.js perfSend, on_perf 를 넘긴 경우만)
+#   POST http://<호스트>:<sse_port>/perf  (본문: JSON, text/plain 으로 와도 됨) → 204
+
+import json
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+KEEPALIVE_SEC = 15  # 프록시가 유휴 연결을 끊지 않게 주석 줄(ping)을 보냄
+RETRY_MS = 5000  # 끊겼을 때 브라우저 재연결 간격
+MAX_PERF_BYTES = 256 * 1024  # 성능 요약 한 건 최대 크기
+
+
+def sse_message(event: str, payload: dict) -> bytes:
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {data}\n\n".encode("utf-8")
+
+
+class LiveEvents:
+    """
+    start() 로 백그라운드 스레드에서 서버 실행
+    broadcast(payload) 는 연결된 모든 브라우저 큐에 넣기만 함 (ETL 스레드를 막지 않음)
+    snapshot: 새 연결에 먼저 보낼 payload 를 돌려주는 함수 (현재 manifest)
+    on_perf: POST /perf 로 받은 (payload, 클라이언트 IP) 를 넘길 함수 (None 이면 404)
+    """
+
+    def __init__(self, host: str, port: int, snapshot, allow_origin: str = "*", on_perf=None):
+        self.host = host
+        self.port = port
+        self.snapshot = snapshot
+        self.allow_origin = allow_origin
+        self.on_perf = on_perf
+        self.clients = set()
+        self.lock = threading.Lock()
+        self.server = None
+
+    def broadcast(self, payload: dict) -> int:
+        msg = sse_message("update", payload)
+        with self.lock:
+            clients = list(self.clients)
+        for q in clients:
+            q.put(msg)
+        return len(clients)
+
+    def start(self) -> None:
+        live = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, fmt, *args):
+                pass  # 접속 로그는 생략 (데몬 로그가 묻히지 않게)
+
+            def do_GET(self):
+                if self.path.split("?")[0] != "/events":
+                    self.send_error(404)
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "keep-alive")
+                self.send_header("Access-Control-Allow-Origin", live.allow_origin)
+                self.end_headers()
+
+                q = queue.Queue()
+                with live.lock:
+                    live.clients.add(q)
+                try:
+                    self.wfile.write(f"retry: {RETRY_MS}\n\n".encode("ascii"))
+                    self.wfile.write(sse_message("update", live.snapshot()))
+                    self.wfile.flush()
+                    while True:
+                        try:
+                            msg = q.get(timeout=KEEPALIVE_SEC)
+                        except queue.Empty:
+                            msg = b": ping\n\n"
+                        self.wfile.write(msg)
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError, OSError):
+                    pass  # 브라우저가 탭을 닫음
+                finally:
+                    with live.lock:
+                        live.clients.discard(q)
+
+            def do_POST(self):
+                if self.path.split("?")[0] != "/perf" or live.on_perf is None:
+                    self.send_error(404)
+                    return
+
+                # 본문 길이를 모르거나(chunked 등) 상한을 넘으면 읽지 않음
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                except ValueError:
+                    length = 0
+                if length > MAX_PERF_BYTES:
+                    self.send_error(413)
+                    return
+                if length <= 0:
+                    self.send_error(411)
+                    return
+                try:
+                    payload = json.loads(self.rfile.read(length).decode("utf-8"))
+                except ValueError:
+                    payload = None
+                if not isinstance(payload, dict):
+                    self.send_error(400)
+                    return
+
+                live.on_perf(payload, self.client_address[0])
+                self.send_response(204)
+                self.send_header("Access-Control-Allow-Origin", live.allow_origin)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+        self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="live-events", daemon=True).start()
+
+    def stop(self) -> None:
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
@@ -0,0 +1,762 @@
+# regress.py
+# 목적: ETL 을 고친 뒤 "숫자가 몰래 바뀌지 않았는지 / 느려지지 않았는지" 확인
+#   - fixture: 실제 DB 에서 한 번 받아 둔 쿼리 결과 → 이후에는 DB 없이 재생
+#              키 = 쿼리 이름(QUERY_NAMES, "섹션.쿼리") + SQL(주석/공백 정리)과 파라미터의 해시
+#              → 버전마다 SQL(조건/정렬/기간)이 다르면 각자 받은 행을 재생 (버전 사이 차이가 그대로 드러남)
+#              SQL 이나 기간을 고치면 재생할 행이 없으므로 record 를 다시 해야 함
+#   - golden:  어떤 ETL 버전(VARIANTS)의 출력 JSON + 섹션별 시간/메모리
+#   - check:   같은 fixture 로 다시 돌려서 golden 과 비교 (숫자는 허용 오차), 시간/메모리가 기준보다
+#              많이 늘면 실패 (종료 코드 1)
+# 각 버전은 임시 폴더(etl/ + web/data/)에서 main() 그대로 실행 → 진짜 web/data 는 건드리지 않음
+# 섹션 구분은 ETL 이 찍는 "====SectionX ETL 완료" 줄 기준 (없는 버전은 전체가 한 구간)
+# 시간은 --repeat 번 중 가장 빠른 값, 메모리는 tracemalloc 으로 한 번 더 돌려서 구간별 최대치
+#   (재생이라 DB 시간은 빠짐 → 파이썬 쪽 처리 시간만 비교)
+#
+# 실행(etl 폴더에서):
+#   python regress.py record --fixture dec2025                      # config.json 의 DB/scope 로 받아 두기
+#   python regress.py golden --fixture dec2025 --variant run_all    # 기준 출력/성능 저장
+#   python regress.py check  --fixture dec2025 --variant run_all    # 비교 (CI/배포 전)
+#   python regress.py check  --fixture dec2025 --variant run_all --against run_all_251223 --no-perf
+#       → 다른 버전의 golden 과 비교 (두 버전이 같이 만드는 파일만)
+# fixture 에는 실제 작업자 이름 등이 들어가므로 regress_fixtures/ 는 저장소에 올리지 않음
+#   예외: regress_fixtures/sample (가짜 작업자/편명으로 만든 2개 항공사 x 7일 fixture + 버전별 golden)
+#         → DB 없이 바로 실행 (perf.json 은 기기마다 달라서 안 올림 → --no-perf)
+#         SQL 을 고쳤으면 sample/make_sample.py 로 다시 만들고 golden 도 다시 저장
+#   python regress.py check --fixture sample --variant run_all --no-perf
+#   python regress.py check --fixture sample --variant run_all_stream --against run_all --no-perf
+#   python regress.py export --fixture sample   # export_facts 의 CSV / Parquet 가 같은지 (actual_sec 가 Decimal 일 때도)
+
+import argparse
+import csv
+import fnmatch
+import gzip
+import hashlib
+import importlib
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pymysql
+
+ETL_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_ROOT = os.path.join(ETL_DIR, "regress_fixtures")
+# 버전 이름 -> (모듈, config 덮어쓰기)
+VARIANTS = {
+    "run_all": ("run_all", {}),
+    "run_all_stream": ("run_all", {"process_rules": {"speed_engine": "stream"}}),
+    "run_all_251226": ("run_all_251226", {}),
+    "run_all_251223": ("run_all_251223", {}),
+}
+
+STANDARD_TIMES = "section2_standard_times.json"
+SKIP_FILES = {"manifest.json", "perf.json", STANDARD_TIMES}  # 시각이 들어가거나 입력/기록 파일이라 비교 안 함
+
+PHASE_RE = re.compile(r"^====(.+?) ETL 완료")
+
+
+# =========================
+# fixture (쿼리 결과 저장/재생)
+# =========================
+def encode_value(v):
+    # JSON 에 없는 DB 타입은 태그를 붙여 저장 → 재생 때 같은 타입으로 (출력이 같아야 하므로)
+    if isinstance(v, Decimal):
+        return {"$dec": str(v)}
+    if isinstance(v, datetime):
+        return {"$dt": v.isoformat()}
+    if isinstance(v, date):
+        return {"$date": v.isoformat()}
+    if isinstance(v, timedelta):
+        return {"$td": v.total_seconds()}
+    if isinstance(v, bytes):
+        return {"$str": v.decode("utf-8", "replace")}
+    return v
+
+
+def decode_value(v):
+    if isinstance(v, dict):
+        if "$dec" in v:
+            return Decimal(v["$dec"])
+        if "$dt" in v:
+            return datetime.fromisoformat(v["$dt"])
+        if "$date" in v:
+            return date.fromisoformat(v["$date"])
+        if "$td" in v:
+            return timedelta(seconds=v["$td"])
+        if "$str" in v:
+            return v["$str"]
+    return v
+
+
+class FixtureMiss(KeyError):
+    pass
+
+
+# 쿼리 이름 규칙: (이름, normalize_sql 한 SQL 에서 찾을 정규식), 위에서부터 처음 맞는 것
+#   이름은 fixture 를 사람이 읽고 재생 실패를 설명하기 위한 것 → 실제 키는 이름 + SQL/파라미터 해시
+#   조건만 조금 다른 버전별 SQL(예: ORDER BY, actual_sec IS NOT NULL)도 같은 이름, 해시는 다름
+QUERY_NAMES = [
+    ("dim.work_type_map_new", r"SELECT ex_srl, work_type FROM rx_air_work WHERE work_type IS NOT NULL AND ex_srl >"),
+    ("dim.work_type_map", r"SELECT ex_srl, work_type FROM rx_air_work WHERE work_type IS NOT NULL"),
+    ("dim.member_name", r"SELECT member_srl, user_id, COALESCE\(NULLIF\(nick_name,''\), user_name\) FROM rx_member"),
+    ("dim.member_nick_user", r"SELECT member_srl, nick_name, user_name FROM rx_member"),
+    ("section1.counts_by_day", r"SELECT v\.work_id, o\.airline_code, v\.work_yyyymmdd FROM v_work_time_clean"),
+    ("section1.counts", r"SELECT v\.work_id, o\.airline_code FROM v_work_time_clean"),
+    (
+        "section1.saved_by_day",
+        r"SELECT b\.work_id, b\.airline_code, b\.aircraft_version_name, b\.actual_sec, b\.work_yyyymmdd FROM",
+    ),
+    ("section1.saved", r"SELECT b\.work_id, b\.airline_code, b\.aircraft_version_name, b\.actual_sec FROM"),
+    ("section2.aircraft_list", r"AS aircraft, COUNT\(\*\) AS n FROM v_dashboard_base"),
+    ("section2.aircraft_ts", r"AS aircraft, b\.work_yyyymmdd, COUNT\(\*\)"),
+    ("section2.ops_by_day", r"COUNT\(DISTINCT w\.operation_srl\) AS ops FROM rx_air_work_member"),
+    ("section2.process_members", r"wm\.wm_srl, wm\.total_time, d\.wdl_label FROM rx_air_work_duration_log"),
+    ("section3.worker_labels", r"w\.ex_srl AS work_id, wm\.wm_srl, wm\.member_srl, d\.wdl_label FROM"),
+    ("section3_speed.member_labels", r"wm\.total_time AS time_sec, 0 AS backup_sec, d\.wdl_label FROM"),
+    ("section3_speed.rows", r"WITH target_work AS .* FROM target_work tw JOIN agg a"),
+    ("section3_speed.logs", r"SELECT dl\.work_srl, w\.date, o\.airline_code, w\.title AS flight_title, dl\.wdl_label"),
+]
+_QUERY_RES = [(name, re.compile(pat)) for name, pat in QUERY_NAMES]
+
+_SQL_COMMENT = re.compile(r"/\*.*?\*/|(?:#|-- )[^\n]*", re.S)
+
+
+def normalize_sql(sql: str) -> str:
+    # 주석(/* */, #, -- ) 빼고 공백을 한 칸으로, 끝의 ; 제거 → 줄바꿈/들여쓰기/주석만 바꾼 SQL 은 같은 키
+    #   (ETL SQL 의 문자열 상수에는 #, --, /* 가 없음)
+    return " ".join(_SQL_COMMENT.sub(" ", sql).split()).rstrip(";").rstrip()
+
+
+def query_name(sql: str) -> str:
+    text = normalize_sql(sql)
+    for name, rx in _QUERY_RES:
+        if rx.search(text):
+            return name
+    raise FixtureMiss(f"이름 규칙이 없는 쿼리입니다 (QUERY_NAMES 에 추가하세요): {text[:160]}…")
+
+
+def params_list(params) -> list:
+    if params is None:
+        return []
+    if not isinstance(params, (list, tuple)):
+        return [params]
+    return list(params)
+
+
+def query_key(name: str, sql: str, params) -> str:
+    # "이름@해시": 해시는 정리한 SQL + 파라미터(JSON) 기준
+    text = normalize_sql(sql) + "\n" + json.dumps([encode_value(p) for p in params_list(params)], ensure_ascii=False)
+    return f"{name}@{hashlib.sha1(text.encode('utf-8')).hexdigest()[:12]}"
+
+
+class ReplayCursor:
+    """pymysql 커서에서 ETL 이 쓰는 부분만 (execute / fetchall / fetchone / fetchmany)"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+        self.pos = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        pass
+
+    def load(self, key: str, sql, params):
+        entry = self.conn.queries.get(key)
+        if entry is None:
+            name = key.split("@")[0]
+            have = sum(1 for q in self.conn.queries.values() if q["name"] == name)
+            raise FixtureMiss(
+                f"fixture 에 없는 쿼리입니다: {key} (같은 이름 {have}개는 SQL/파라미터가 다름"
+                " → 이 버전으로 record 를 다시 하세요)"
+            )
+        return entry["rows"]
+
+    def execute(self, sql, params=None):
+        self.rows = self.load(query_key(query_name(sql), sql, params), sql, params)
+        self.pos = 0
+        return len(self.rows)
+
+    def fetchall(self):
+        out = self.rows[self.pos:]
+        self.pos = len(self.rows)
+        return list(out)
+
+    def fetchone(self):
+        if self.pos >= len(self.rows):
+            return None
+        self.pos += 1
+        return self.rows[self.pos - 1]
+
+    def fetchmany(self, size=1):
+        out = self.rows[self.pos : self.pos + size]
+        self.pos += len(out)
+        return list(out)
+
+
+class RecordCursor(ReplayCursor):
+    """
+    실제 DB 에서 실행하고 결과를 fixture 에 넣은 뒤, 재생과 똑같이 돌려줌
+      - 키(이름 + SQL/파라미터 해시)마다 한 번만 실행 → 버전마다 자기 SQL 의 결과가 저장됨
+        (SQL 과 파라미터가 완전히 같은 버전끼리만 같은 행을 나눠 씀)
+    """
+
+    def load(self, key: str, sql, params):
+        entry = self.conn.queries.get(key)
+        if entry is not None:
+            return entry["rows"]
+
+        with self.conn.real.cursor() as cur:
+            cur.execute(sql, params)
+            rows = [tuple(r) for r in cur.fetchall()]
+        self.conn.queries[key] = {
+            "name": key.split("@")[0],
+            "sql": normalize_sql(sql),
+            "params": params_list(params),
+            "rows": rows,
+        }
+        return rows
+
+
+class FixtureConnection:
+    def __init__(self, queries: dict, real=None):
+        # queries: 키("이름@해시") -> {"name", "sql"(참고용), "params"(참고용), "rows": [행]}
+        self.queries = queries
+        self.real = real
+
+    def cursor(self, *args, **kwargs):
+        return RecordCursor(self) if self.real is not None else ReplayCursor(self)
+
+    def ping(self, reconnect=True):
+        pass
+
+    def commit(self):
+        pass
+
+    def close(self):
+        if self.real is not None:
+            self.real.close()
+
+
+def fixture_dir(name: str) -> str:
+    return os.path.join(FIXTURE_ROOT, name)
+
+
+def save_queries(path: str, queries: dict) -> None:
+    # queries.json.gz (record 결과) 또는 queries.json (저장소에 올리는 sample: 쿼리 하나가 한 줄 → diff 가 읽힘)
+    items = [
+        json.dumps(
+            {
+                "key": key,
+                "name": q["name"],
+                "sql": q["sql"],
+                "params": [encode_value(p) for p in q["params"]],
+                "rows": [[encode_value(v) for v in r] for r in q["rows"]],
+            },
+            ensure_ascii=False,
+        )
+        for key, q in sorted(queries.items())
+    ]
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "wt", encoding="utf-8") as f:
+        f.write('{"queries": [\n' + ",\n".join(items) + "\n]}\n")
+
+
+def load_queries(path: str) -> dict:
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        payload = json.load(f)
+    if any("key" not in q for q in payload["queries"]):
+        raise SystemExit(f"❌ 예전 형식(이름만 키) fixture 입니다: {path} (record 를 다시 하세요)")
+    return {
+        q["key"]: {
+            "name": q["name"],
+            "sql": q.get("sql", ""),
+            "params": [decode_value(v) for v in q.get("params", [])],
+            "rows": [tuple(decode_value(v) for v in r) for r in q["rows"]],
+        }
+        for q in payload["queries"]
+    }
+
+
+# =========================
+# 버전 실행 (임시 폴더 + 가짜 연결)
+# =========================
+class PhaseMeter(io.TextIOBase):
+    """
+    ETL 의 print 를 받아서 "====... ETL 완료" 줄마다 구간을 끊음
+      phases: [{"phase", "sec", "peak_mb"?}]
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.phases = []
+        self.buf = ""
+        self.t0 = time.perf_counter()
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        self.buf += s
+        while "\n" in self.buf:
+            line, self.buf = self.buf.split("\n", 1)
+            self.lines.append(line)
+            m = PHASE_RE.match(line)
+            if m:
+                self.mark(m.group(1).strip())
+        return len(s)
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        rec = {"phase": name, "sec": now - self.t0}
+        if tracemalloc.is_tracing():
+            rec["peak_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.reset_peak()
+        self.phases.append(rec)
+        self.t0 = now
+
+
+def merge_cfg(base: dict, over: dict) -> dict:
+    out = dict(base)
+    for k, v in over.items():
+        out[k] = merge_cfg(out.get(k) or {}, v) if isinstance(v, dict) else v
+    return out
+
+
+def make_sandbox(fx_dir: str, cfg_over: dict) -> str:
+    # <tmp>/etl/config.json + <tmp>/web/data/section2_standard_times.json (ETL 들이 상대 경로로 읽음)
+    #   config 는 fixture 것 + 버전별 덮어쓰기 (예: speed_engine)
+    root = tempfile.mkdtemp(prefix="etl_regress_")
+    os.makedirs(os.path.join(root, "etl", "cache"))
+    os.makedirs(os.path.join(root, "web", "data"))
+    with open(os.path.join(fx_dir, "config.json"), "r", encoding="utf-8") as f:
+        cfg = merge_cfg(json.load(f), cfg_over)
+    with open(os.path.join(root, "etl", "config.json"), "w", encoding="utf-8") as f:
+        json.dump(cfg, f, ensure_ascii=False, indent=2)
+    shutil.copy(os.path.join(fx_dir, STANDARD_TIMES), os.path.join(root, "web", "data", STANDARD_TIMES))
+    return root
+
+
+@contextmanager
+def in_sandbox(root: str, conn_factory, module_name: str):
+    """
+    <root>/etl 에서 pymysql.connect 를 conn_factory 로 바꿔 둔 채 module_name 을 새로 import 해서 돌려줌
+      모듈 상태(manifest 항목, 차원 캐시 등)가 이전 실행에서 남지 않게 매번 새로 import
+      (예전 버전들 / export_facts 도 run_all 의 함수를 쓰므로 run_all 도 같이)
+    """
+    cwd = os.getcwd()
+    real_connect = pymysql.connect
+    fresh = {module_name, "run_all"}
+    for m in fresh:
+        sys.modules.pop(m, None)
+    if ETL_DIR not in sys.path:
+        sys.path.insert(0, ETL_DIR)
+
+    pymysql.connect = lambda *a, **kw: conn_factory(real_connect, *a, **kw)
+    os.chdir(os.path.join(root, "etl"))
+    try:
+        yield importlib.import_module(module_name)
+    finally:
+        os.chdir(cwd)
+        pymysql.connect = real_connect
+        for m in fresh:
+            sys.modules.pop(m, None)
+
+
+def run_variant(variant: str, fx_dir: str, conn_factory, track_memory: bool = False):
+    """
+    variant.main() 을 임시 폴더에서 실행
+    return: (출력 폴더, phases, 로그 줄)
+    """
+    if variant not in VARIANTS:
+        raise SystemExit(f"❌ 모르는 버전: {variant} (가능: {', '.join(VARIANTS)})")
+    module_name, cfg_over = VARIANTS[variant]
+
+    root = make_sandbox(fx_dir, cfg_over)
+    meter = PhaseMeter()
+    if track_memory:
+        tracemalloc.start()
+    try:
+        with redirect_stdout(meter), in_sandbox(root, conn_factory, module_name) as module:
+            meter.t0 = time.perf_counter()
+            module.main()
+            meter.mark("finish")  # shard / manifest 저장 등 마지막 구간
+    except BaseException:
+        sys.stdout.write("\n".join(meter.lines[-30:]) + "\n")
+        raise
+    finally:
+        if track_memory:
+            tracemalloc.stop()
+
+    return os.path.join(root, "web", "data"), meter.phases, meter.lines
+
+
+def measure(variant: str, fx_dir: str, queries: dict, repeat: int):
+    """
+    repeat 번 돌려서 구간별 가장 빠른 시간 + tracemalloc 한 번으로 구간별 최대 메모리
+    return: (출력 폴더, perf)
+    """
+    replay = lambda real_connect, *a, **kw: FixtureConnection(queries)
+    best = {}
+    order = []
+    out_dir = None
+    for i in range(max(1, repeat)):
+        if out_dir:
+            shutil.rmtree(os.path.dirname(os.path.dirname(out_dir)), ignore_errors=True)
+        out_dir, phases, _ = run_variant(variant, fx_dir, replay)
+        for p in phases:
+            if p["phase"] not in best:
+                order.append(p["phase"])
+                best[p["phase"]] = p["sec"]
+            else:
+                best[p["phase"]] = min(best[p["phase"]], p["sec"])
+
+    mem_dir, mem_phases, _ = run_variant(variant, fx_dir, replay, track_memory=True)
+    shutil.rmtree(os.path.dirname(os.path.dirname(mem_dir)), ignore_errors=True)
+    peak = {p["phase"]: p["peak_mb"] for p in mem_phases}
+
+    perf = {
+        "variant": variant,
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "phases": {name: {"sec": round(best[name], 4), "peak_mb": round(peak.get(name, 0.0), 2)} for name in order},
+        "total_sec": round(sum(best.values()), 4),
+    }
+    return out_dir, perf
+
+
+# =========================
+# export_facts (CSV / Parquet)
+# =========================
+# Decimal 로 바꿔서 다시 돌려 볼 열: 쿼리 이름 -> 열 번호
+#   (MySQL 은 SUM/AVG/ROUND 나 DECIMAL 컬럼을 Decimal 로 돌려줌 → 뷰 정의가 바뀌면 actual_sec 도 그럴 수 있음)
+EXPORT_DECIMAL_COLS = {"section1.saved_by_day": [3], "section3_speed.rows": [7, 8]}
+
+
+def as_decimal(queries: dict) -> dict:
+    out = {}
+    for key, q in queries.items():
+        cols = EXPORT_DECIMAL_COLS.get(q["name"], [])
+        rows = [
+            tuple(Decimal(str(v)) if i in cols and v is not None else v for i, v in enumerate(r)) for r in q["rows"]
+        ]
+        out[key] = {**q, "rows": rows}
+    return out
+
+
+def run_export(fx_dir: str, queries: dict, kind: str, fmt: str) -> list:
+    """
+    export_facts.main() 을 임시 폴더에서 fixture config 의 기간/항공사로 실행
+    return: 행 목록 (모든 값을 CSV 에 쓰이는 문자열로)
+    """
+    with open(os.path.join(fx_dir, "config.json"), "r", encoding="utf-8") as f:
+        scope = json.load(f)["scope"]
+    root = make_sandbox(fx_dir, {})
+    out = os.path.join(root, f"{kind}.{fmt}")
+    replay = lambda real_connect, *a, **kw: FixtureConnection(queries)
+    try:
+        with redirect_stdout(io.StringIO()), in_sandbox(root, replay, "export_facts") as module:
+            module.main([kind, "--from", scope["date_from"], "--to", scope["date_to"], "--out", out])
+        if fmt == "csv":
+            with open(out, "r", encoding="utf-8-sig", newline="") as f:
+                return list(csv.reader(f))
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(out)
+        return [table.column_names] + [
+            ["" if v is None else str(v) for v in r] for r in zip(*(c.to_pylist() for c in table.columns))
+        ]
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+# =========================
+# 비교 (숫자 허용 오차)
+# =========================
+def diff_json(a, b, path: str, rtol: float, atol: float, out: list, limit: int = 20) -> None:
+    # a: 이번 출력, b: golden
+    if len(out) >= limit:
+        return
+    num = (int, float)
+    if isinstance(a, num) and isinstance(b, num) and not isinstance(a, bool) and not isinstance(b, bool):
+        if abs(a - b) > atol + rtol * abs(b):
+            out.append(f"{path}: {a} != {b} (차이 {a - b:+g})")
+        return
+    if type(a) is not type(b):
+        out.append(f"{path}: 타입 {type(a).__name__} != {type(b).__name__}")
+        return
+    if isinstance(a, dict):
+        for k in sorted(set(a) | set(b), key=str):
+            if k not in a:
+                out.append(f"{path}.{k}: 없음 (golden 에는 있음)")
+            elif k not in b:
+                out.append(f"{path}.{k}: 새로 생김")
+            else:
+                diff_json(a[k], b[k], f"{path}.{k}", rtol, atol, out, limit)
+        return
+    if isinstance(a, list):
+        if len(a) != len(b):
+            out.append(f"{path}: 길이 {len(a)} != {len(b)}")
+        for i, (x, y) in enumerate(zip(a, b)):
+            diff_json(x, y, f"{path}[{i}]", rtol, atol, out, limit)
+        return
+    if a != b:
+        out.append(f"{path}: {a!r} != {b!r}")
+
+
+def output_files(d: str, pattern: str) -> set:
+    return {
+        f
+        for f in os.listdir(d)
+        if f.endswith(".json") and f not in SKIP_FILES and fnmatch.fnmatch(f, pattern)
+    }
+
+
+def compare_outputs(out_dir: str, golden_dir: str, args, cross: bool) -> list:
+    problems = []
+    got = output_files(out_dir, args.files)
+    want = output_files(golden_dir, args.files)
+
+    if cross:
+        # 다른 버전과 비교: 둘 다 만드는 파일만
+        names = sorted(got & want)
+        print(f"  (다른 버전 비교: 공통 파일 {len(names)}개, 한쪽만 {len(got ^ want)}개는 건너뜀)")
+    else:
+        names = sorted(want)
+        problems += [f"{f}: 출력에 없음" for f in sorted(want - got)]
+        problems += [f"{f}: golden 에 없는 새 파일 (golden 을 다시 만드세요)" for f in sorted(got - want)]
+        names = [f for f in names if f in got]
+
+    for f in names:
+        with open(os.path.join(out_dir, f), "r", encoding="utf-8") as fa:
+            a = json.load(fa)
+        with open(os.path.join(golden_dir, f), "r", encoding="utf-8") as fb:
+            b = json.load(fb)
+        diffs = []
+        diff_json(a, b, "$", args.rtol, args.atol, diffs)
+        problems += [f"{f} {d}" for d in diffs]
+    return problems
+
+
+def compare_perf(perf: dict, base: dict, args) -> list:
+    # 작은 구간은 잡음이 커서 절대값 기준(min_sec / min_mb)도 같이 넘어야 실패
+    problems = []
+    for name, cur in perf["phases"].items():
+        ref = base.get("phases", {}).get(name)
+        if not ref:
+            continue
+        if cur["sec"] > ref["sec"] * (1 + args.time_tol) and cur["sec"] - ref["sec"] > args.min_sec:
+            problems.append(f"시간 {name}: {cur['sec']:.3f}s (기준 {ref['sec']:.3f}s, +{cur['sec'] / ref['sec'] - 1:.0%})")
+        if cur["peak_mb"] > ref["peak_mb"] * (1 + args.mem_tol) and cur["peak_mb"] - ref["peak_mb"] > args.min_mb:
+            problems.append(
+                f"메모리 {name}: {cur['peak_mb']:.1f}MB (기준 {ref['peak_mb']:.1f}MB, "
+                f"+{cur['peak_mb'] / ref['peak_mb'] - 1:.0%})"
+            )
+    return problems
+
+
+def print_perf(perf: dict, base: dict = None) -> None:
+    for name, cur in perf["phases"].items():
+        ref = (base or {}).get("phases", {}).get(name)
+        extra = f"  (기준 {ref['sec']:.3f}s / {ref['peak_mb']:.1f}MB)" if ref else ""
+        print(f"  {name:<18} {cur['sec']:8.3f}s {cur['peak_mb']:8.1f}MB{extra}")
+
+
+# =========================
+# 명령
+# =========================
+def cmd_record(args) -> int:
+    sys.path.insert(0, ETL_DIR)
+    from run_all import assert_cfg, load_config, today_yyyymmdd
+
+    cfg = load_config()
+    assert_cfg(cfg)
+    fx_dir = fixture_dir(args.fixture)
+    os.makedirs(fx_dir, exist_ok=True)
+
+    # TODAY 는 받은 날로 고정 (나중에 돌려도 같은 기간), DB 접속 정보는 저장하지 않음
+    fx_cfg = json.loads(json.dumps(cfg))
+    if fx_cfg["scope"]["date_to"] == "TODAY":
+        t = str(today_yyyymmdd())
+        fx_cfg["scope"]["date_to"] = f"{t[:4]}-{t[4:6]}-{t[6:]}"
+    fx_cfg["db"] = {"host": "fixture", "port": 0, "user": "", "password": "", "database": "fixture"}
+    with open(os.path.join(fx_dir, "config.json"), "w", encoding="utf-8") as f:
+        json.dump(fx_cfg, f, ensure_ascii=False, indent=2)
+    shutil.copy(os.path.join(ETL_DIR, "..", "web", "data", STANDARD_TIMES), os.path.join(fx_dir, STANDARD_TIMES))
+
+    # 실제 DB 설정으로 연결하되, 기간은 fixture config 로 (같은 SQL 이 나와야 재생됨)
+    db = cfg["db"]
+    connect = lambda real_connect: real_connect(
+        host=db["host"],
+        port=int(db["port"]),
+        user=db["user"],
+        password=db["password"],
+        database=db["database"],
+        charset="utf8mb4",
+        autocommit=True,
+    )
+    queries = record_variants(fx_dir, args.variant or list(VARIANTS), connect)
+    save_queries(os.path.join(fx_dir, "queries.json.gz"), queries)
+    n = sum(len(q["rows"]) for q in queries.values())
+    print(f"✅ fixture {args.fixture}: 쿼리 {len(queries)}개 / 행 {n:,}개 → {fx_dir}")
+    return 0
+
+
+def record_variants(fx_dir: str, variants: list, connect) -> dict:
+    """
+    variants 를 차례로 실행하면서 connect(원래 pymysql.connect) 로 연 연결에서 쿼리 결과를 받아 둠
+      (sample/make_sample.py 는 pymysql 대신 합성 sqlite 연결을 넘김)
+    return: queries (save_queries 로 저장)
+    """
+    queries = {}
+    record = lambda real_connect, *a, **kw: FixtureConnection(queries, real=connect(real_connect))
+    for variant in variants:
+        print(f"📥 {variant} 실행하며 쿼리 결과 받는 중…")
+        out_dir, _, _ = run_variant(variant, fx_dir, record)
+        shutil.rmtree(os.path.dirname(os.path.dirname(out_dir)), ignore_errors=True)
+    return queries
+
+
+def load_fixture(name: str):
+    fx_dir = fixture_dir(name)
+    for filename in ("queries.json.gz", "queries.json"):
+        path = os.path.join(fx_dir, filename)
+        if os.path.exists(path):
+            return fx_dir, load_queries(path)
+    raise SystemExit(f"❌ fixture 가 없습니다: {fx_dir}/queries.json.gz (먼저 record)")
+
+
+def cmd_golden(args) -> int:
+    fx_dir, queries = load_fixture(args.fixture)
+    out_dir, perf = measure(args.variant, fx_dir, queries, args.repeat)
+
+    golden = os.path.join(fx_dir, "golden", args.variant)
+    shutil.rmtree(golden, ignore_errors=True)
+    shutil.copytree(out_dir, golden)
+    shutil.rmtree(os.path.dirname(os.path.dirname(out_dir)), ignore_errors=True)
+    with open(os.path.join(golden, "perf.json"), "w", encoding="utf-8") as f:
+        json.dump(perf, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ golden {args.variant} → {golden}")
+    print_perf(perf)
+    return 0
+
+
+def cmd_check(args) -> int:
+    fx_dir, queries = load_fixture(args.fixture)
+    against = args.against or args.variant
+    golden = os.path.join(fx_dir, "golden", against)
+    if not os.path.isdir(golden):
+        raise SystemExit(f"❌ golden 이 없습니다: {golden} (먼저 golden --variant {against})")
+
+    out_dir, perf = measure(args.variant, fx_dir, queries, args.repeat)
+    try:
+        print(f"### {args.variant} vs golden {against} (rtol={args.rtol:g}, atol={args.atol:g})")
+        problems = compare_outputs(out_dir, golden, args, cross=against != args.variant)
+    finally:
+        shutil.rmtree(os.path.dirname(os.path.dirname(out_dir)), ignore_errors=True)
+
+    base = {}
+    perf_path = os.path.join(golden, "perf.json")
+    if os.path.exists(perf_path):
+        with open(perf_path, "r", encoding="utf-8") as f:
+            base = json.load(f)
+    print_perf(perf, base)
+    if not args.no_perf and against == args.variant:
+        problems += compare_perf(perf, base, args)
+
+    if problems:
+        print(f"❌ 실패 {len(problems)}건")
+        for p in problems[:50]:
+            print("  -", p)
+        return 1
+    print("✅ 출력/성능 모두 기준 이내")
+    return 0
+
+
+def cmd_export(args) -> int:
+    fx_dir, queries = load_fixture(args.fixture)
+    try:
+        import pyarrow  # noqa: F401
+
+        formats = ["csv", "parquet"]
+    except ImportError:
+        formats = ["csv"]
+        print("⚠️ pyarrow 가 없어서 CSV 만 확인합니다")
+
+    problems = []
+    for kind in args.kind or ["speed", "saved"]:
+        base = run_export(fx_dir, queries, kind, "csv")
+        for fmt in formats:
+            for label, qs in (("int", queries), ("Decimal", as_decimal(queries))):
+                if (fmt, label) == ("csv", "int"):
+                    continue
+                rows = run_export(fx_dir, qs, kind, fmt)
+                diffs = []
+                diff_json(rows, base, "$", 0.0, 0.0, diffs)
+                problems += [f"{kind}.{fmt} ({label}) vs {kind}.csv (int) {d}" for d in diffs]
+        print(f"  {kind:<6} {len(base) - 1:6,} 행  ({' / '.join(formats)}, int / Decimal)")
+
+    if problems:
+        print(f"❌ 실패 {len(problems)}건")
+        for p in problems[:50]:
+            print("  -", p)
+        return 1
+    print("✅ export_facts: 형식/숫자 타입과 상관없이 같은 행")
+    return 0
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="ETL 출력(golden) / 성능 회귀 확인")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    rec = sub.add_parser("record", help="config.json 의 DB 에서 쿼리 결과를 fixture 로 저장")
+    rec.add_argument("--fixture", required=True)
+    rec.add_argument("--variant", action="append", choices=list(VARIANTS), help="없으면 모든 버전")
+
+    for name, help_text in (("golden", "기준 출력/성능 저장"), ("check", "golden 과 비교")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--fixture", required=True)
+        p.add_argument("--variant", required=True, choices=list(VARIANTS))
+        p.add_argument("--repeat", type=int, default=3, help="시간 측정 반복 (가장 빠른 값 사용)")
+
+    chk = sub.choices["check"]
+    chk.add_argument("--against", choices=list(VARIANTS), help="다른 버전의 golden 과 비교 (성능은 비교 안 함)")
+    chk.add_argument("--files", default="*", help="비교할 파일 패턴 (예: section3_*)")
+    chk.add_argument("--rtol", type=float, default=1e-9, help="숫자 상대 오차")
+    chk.add_argument("--atol", type=float, default=1e-6, help="숫자 절대 오차")
+    chk.add_argument("--time-tol", type=float, default=0.25, help="구간 시간 허용 증가율 (0.25 = +25%%)")
+    chk.add_argument("--mem-tol", type=float, default=0.25, help="구간 메모리 허용 증가율")
+    chk.add_argument("--min-sec", type=float, default=0.05, help="이보다 작은 시간 차이는 무시")
+    chk.add_argument("--min-mb", type=float, default=1.0, help="이보다 작은 메모리 차이는 무시")
+    chk.add_argument("--no-perf", action="store_true", help="출력만 비교")
+
+    exp = sub.add_parser("export", help="export_facts 의 CSV / Parquet 가 같은 행인지 (DB 숫자가 Decimal 이어도)")
+    exp.add_argument("--fixture", required=True)
+    exp.add_argument("--kind", action="append", choices=["speed", "saved"], help="없으면 둘 다")
+    return ap.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    return {"record": cmd_record, "golden": cmd_golden, "check": cmd_check, "export": cmd_export}[args.cmd](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+# make_sample.py
+# 목적: regress_fixtures/sample 을 다시 만들기 (실제 DB 없이, 가짜 작업자/편명 데이터)
+#   - 합성 데이터를 sqlite 에 실제 DB 와 같은 테이블/뷰 이름으로 넣고,
+#     regress.record_variants 로 모든 VARIANTS 를 실행 → 버전마다 자기 SQL 을 sqlite 에서 실행한 결과가 저장됨
+#     (조건/정렬/기간이 다른 SQL 은 다른 행을 받음 → 버전 사이 차이가 sample 에서도 드러남)
+#   - 버전 사이 차이가 보이도록 일부러 넣은 행:
+#       기간 밖 날짜, quality != 'OK'(일부는 actual_sec NULL), 기종 ''/NULL, '무효'/'OJT'/'베큠' 라벨,
+#       group 없는 백업 라벨, duration_log.member_srl NULL (wm 쪽 member 사용)
+#   - MySQL 과 다른 부분은 SqliteConnection 이 맞춤:
+#       %s → ?, # 주석, REGEXP / TIME_TO_SEC / CONCAT / ROUND(반올림), 정수 / 정수 = 소수,
+#       결과 타입(pymysql 처럼 DATE → date, 정수의 SUM/AVG/ROUND → Decimal)
+#   - 마지막에 버전마다 golden 도 다시 저장 (perf.json 은 기기마다 달라서 저장소에 안 올림)
+# 실행(etl 폴더에서): python regress_fixtures/sample/make_sample.py
+
+import json
+import os
+import random
+import re
+import sqlite3
+import sys
+import tempfile
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+
+SAMPLE_DIR = os.path.dirname(os.path.abspath(__file__))
+ETL_DIR = os.path.dirname(os.path.dirname(SAMPLE_DIR))
+sys.path.insert(0, ETL_DIR)
+
+import regress  # noqa: E402
+
+AIRLINES = ["HH", "RF"]
+CRAFT = {"HH": ["B4", "B5", "", None], "RF": ["B3", "B3_1"]}
+DATE_FROM = date(2025, 12, 1)
+DATE_TO = date(2025, 12, 7)
+CABIN = 10
+MEMBERS = list(range(501, 511))
+# golden 을 저장소에 올리는 버전 (run_all_stream 은 run_all golden 과 비교: --against run_all)
+GOLDEN_VARIANTS = ["run_all", "run_all_251226", "run_all_251223"]
+
+CONFIG = {
+    "db": {"host": "fixture", "port": 0, "user": "", "password": "", "database": "fixture"},
+    "scope": {"airlines": AIRLINES, "date_from": str(DATE_FROM), "date_to": str(DATE_TO)},
+    "work_types": {"cabin_cleaning": [CABIN]},
+}
+STANDARD_TIMES = {
+    "default_standard_sec": 1500,
+    "by_airline_aircraft": {"HH|B4": 1450, "HH|B5": 1400, "RF|B3": 1300, "RF|B3_1": 1600},
+}
+
+SCHEMA = """
+CREATE TABLE rx_air_operation (ex_srl INTEGER PRIMARY KEY, airline_code TEXT);
+CREATE TABLE rx_air_work (ex_srl INTEGER PRIMARY KEY, operation_srl INTEGER, work_type INTEGER, date TEXT, title TEXT);
+CREATE TABLE rx_air_work_member (
+  wm_srl INTEGER PRIMARY KEY, work_srl INTEGER, member_srl INTEGER, work_date TEXT, total_time INTEGER
+);
+CREATE TABLE rx_air_work_duration_log (
+  work_srl INTEGER, wm_srl INTEGER, member_srl INTEGER, wdl_label TEXT, wdl_group_label TEXT, wdl_duration TEXT
+);
+CREATE TABLE rx_member (member_srl INTEGER PRIMARY KEY, user_id TEXT, nick_name TEXT, user_name TEXT);
+CREATE TABLE v_work_time_clean (work_id INTEGER, operation_srl INTEGER, work_yyyymmdd INTEGER, quality TEXT);
+CREATE TABLE v_dashboard_base (
+  work_id INTEGER, airline_code TEXT, aircraft_version_name TEXT, actual_sec INTEGER, work_yyyymmdd INTEGER, quality TEXT
+);
+"""
+
+
+# =========================
+# 합성 데이터
+# =========================
+def build_rows(rng: random.Random) -> dict:
+    tables = {name: [] for name in re.findall(r"CREATE TABLE (\w+)", SCHEMA)}
+    tables["rx_member"] = [
+        (m, f"user{m}", f"작업자{m - 500:02d}" if m % 3 else "", f"이름{m - 500:02d}") for m in MEMBERS
+    ]
+
+    ex = 9000
+    wm_srl = 40000
+    days = [DATE_FROM + timedelta(days=i) for i in range(-1, (DATE_TO - DATE_FROM).days + 2)]  # 앞뒤 하루는 기간 밖
+    for d in days:
+        ymd = d.strftime("%Y%m%d")
+        for airline in AIRLINES:
+            for k in range(3):
+                ex += 1
+                op = 70000 + ex
+                work_type = CABIN if k < 2 or rng.random() < 0.5 else 99
+                title = f"{airline}{100 + ex % 37:03d}"
+                craft = rng.choice(CRAFT[airline])
+                quality = "OK" if rng.random() < 0.9 else "BAD"
+                # actual_sec NULL 은 quality 가 OK 가 아닌 행에만 (OK 인데 (항공사, 기종, 날짜) 칸이 전부 NULL 이면
+                #   run_all Section2 의 AVG 가 NULL → float(None))
+                actual = None if quality != "OK" and rng.random() < 0.5 else rng.randint(900, 1900)
+                tables["rx_air_operation"].append((op, airline))
+                tables["rx_air_work"].append((ex, op, work_type, ymd, title))
+                tables["v_work_time_clean"].append((ex, op, int(ymd), quality))
+                tables["v_dashboard_base"].append((ex, airline, craft, actual, int(ymd), quality))
+                if work_type != CABIN:
+                    continue
+
+                # 공정 로그: 메인 5명 + 백업 1명, 가끔 제외 라벨 / 공정 밖 라벨 / group 없는 백업 라벨
+                staff = rng.sample(MEMBERS, 6)
+                logs = []
+                for role, m in zip(["소닉1", "소닉2", "소닉3", "라바", "로보캅"], staff):
+                    logs.append((role, None, m, rng.randint(300, 1500)))
+                    if rng.random() < 0.4:
+                        backup = {"라바": "라바백업", "로보캅": "로보캅백업"}.get(role, "소닉백업존" + role[-1])
+                        logs.append((backup, role, staff[5], rng.randint(60, 400)))
+                if rng.random() < 0.2:
+                    logs.append(("라바백업", None, staff[5], rng.randint(60, 300)))
+                if rng.random() < 0.2:
+                    logs.append((rng.choice(["무효", "OJT", "베큠"]), None, staff[5], rng.randint(60, 300)))
+
+                wm_of = {}
+                totals = {}
+                for label, group, m, sec in logs:
+                    if m not in wm_of:
+                        wm_srl += 1
+                        wm_of[m] = wm_srl
+                    totals[m] = totals.get(m, 0) + sec
+                for m, srl in wm_of.items():
+                    tables["rx_air_work_member"].append((srl, ex, m, ymd, totals[m]))
+                for label, group, m, sec in logs:
+                    dur = str(sec) if rng.random() < 0.3 else f"{sec // 3600:02d}:{sec % 3600 // 60:02d}:{sec % 60:02d}"
+                    log_member = None if rng.random() < 0.1 else m  # NULL 이면 SQL 이 wm.member_srl 로 채움
+                    tables["rx_air_work_duration_log"].append((ex, wm_of[m], log_member, label, group, dur))
+    return tables
+
+
+# =========================
+# sqlite 를 pymysql 처럼
+# =========================
+_COMMENT = re.compile(r"#[^\n]*")
+_INT_DIV = re.compile(r"(\b\w+\.\w+) / (\d+)")
+_ISO_DATE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+# 결과 열 이름 → pymysql 이 돌려주는 타입 (actual_sec 같은 정수 열은 int, 정수의 AVG / SUM / ROUND 는 DECIMAL)
+_DECIMAL_COLS = re.compile(r"^(ROUND|AVG|SUM)\(|^avg_actual_sec$|^total_sec$|^total_min$")
+_ROUND1_COLS = re.compile(r"^ROUND\(|^avg_actual_sec$|^total_min$")
+
+
+def time_to_sec(v):
+    m = re.fullmatch(r"(\d{1,2}):(\d{2}):(\d{2})", v or "")
+    if not m or int(m.group(2)) > 59 or int(m.group(3)) > 59:
+        return None
+    h, mi, s = map(int, m.groups())
+    return h * 3600 + mi * 60 + s
+
+
+def mysql_round(v, digits=0):
+    # MySQL 의 DECIMAL ROUND 처럼 반올림 (sqlite ROUND 는 float 그대로 → 0.15 가 0.1 이 될 수 있음)
+    if v is None:
+        return None
+    q = Decimal(1).scaleb(-int(digits))
+    return float(Decimal(repr(v)).quantize(q, rounding=ROUND_HALF_UP))
+
+
+def to_mysql_value(col: str, v):
+    if v is None:
+        return None
+    if col == "date":
+        return date(int(v[:4]), int(v[4:6]), int(v[6:8]))
+    if _DECIMAL_COLS.search(col):
+        if _ROUND1_COLS.search(col):
+            return Decimal(repr(float(v))).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
+        return Decimal(int(v))
+    return v
+
+
+class SqliteCursor:
+    def __init__(self, conn):
+        self.cur = conn.cursor()
+        self.cols = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.cur.close()
+
+    def execute(self, sql, params=None):
+        sql = _INT_DIV.sub(r"CAST(\1 AS REAL) / \2", _COMMENT.sub("", sql)).replace("%s", "?")
+        # w.date 는 'YYYYMMDD' 로 넣어 둠 → 'YYYY-MM-DD' 파라미터도 같은 모양으로 (MySQL 은 둘 다 DATE 로 비교)
+        args = [_ISO_DATE.sub(r"\1\2\3", p) if isinstance(p, str) else p for p in regress.params_list(params)]
+        self.cur.execute(sql, args)
+        self.cols = [c[0] for c in self.cur.description or []]
+
+    def _convert(self, rows):
+        return [tuple(to_mysql_value(c, v) for c, v in zip(self.cols, r)) for r in rows]
+
+    def fetchall(self):
+        return self._convert(self.cur.fetchall())
+
+    def fetchmany(self, size=1):
+        return self._convert(self.cur.fetchmany(size))
+
+
+class SqliteConnection:
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path)
+        self.conn.create_function("REGEXP", 2, lambda pat, v: v is not None and re.search(pat, str(v)) is not None)
+        self.conn.create_function("TIME_TO_SEC", 1, time_to_sec)
+        self.conn.create_function("CONCAT", -1, lambda *xs: None if None in xs else "".join(map(str, xs)))
+        self.conn.create_function("ROUND", 2, mysql_round)
+
+    def cursor(self, *args, **kwargs):
+        return SqliteCursor(self.conn)
+
+    def close(self):
+        self.conn.close()
+
+
+def build_db(path: str) -> None:
+    tables = build_rows(random.Random(20251201))
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    for name, rows in tables.items():
+        if rows:
+            conn.executemany(f"INSERT INTO {name} VALUES ({','.join('?' * len(rows[0]))})", rows)
+    conn.commit()
+    conn.close()
+
+
+# =========================
+# main
+# =========================
+def write_json(path: str, payload) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def main() -> int:
+    write_json(os.path.join(SAMPLE_DIR, "config.json"), CONFIG)
+    write_json(os.path.join(SAMPLE_DIR, regress.STANDARD_TIMES), STANDARD_TIMES)
+
+    with tempfile.TemporaryDirectory(prefix="etl_sample_") as tmp:
+        db_path = os.path.join(tmp, "sample.sqlite")
+        build_db(db_path)
+        # 연결마다 새 sqlite 연결 (pipeline 의 받기 스레드도 자기 연결을 씀)
+        queries = regress.record_variants(SAMPLE_DIR, list(regress.VARIANTS), lambda real_connect: SqliteConnection(db_path))
+
+    regress.save_queries(os.path.join(SAMPLE_DIR, "queries.json"), queries)
+    n = sum(len(q["rows"]) for q in queries.values())
+    print(f"✅ sample: 쿼리 {len(queries)}개 / 행 {n:,}개")
+
+    for variant in GOLDEN_VARIANTS:
+        regress.main(["golden", "--fixture", "sample", "--variant", variant, "--repeat", "1"])
+    return 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
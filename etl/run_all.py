@@ -2,14 +2,26 @@
 # 목적: 로컬 DB에서 대시보드용 JSON(Section1/2/3-Speed)을 생성
 # 구조: 초보자도 따라갈 수 있도록 "3개 함수"로 분리 (기능/출력 동일)
 
+import hashlib
 import json
 import os
+import queue
 import re
-from datetime import date
-from collections import defaultdict, Counter
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from array import array
+from collections import Counter, defaultdict
 
 import pymysql
 
+from attribution import BACKUP_LABELS, MAIN_LABELS, attribute_backups
+from compact import DICT_ROWS_FORMAT, DimCodes, SpeedTable, dict_rows_shard, num_out
+from sampling import sample_points
+from vectorized import HAS_NUMPY, section1_saved_np, speed_summary_np
+
 
 # =========================
 # helpers
@@ -27,10 +39,122 @@ def load_config() -> dict:
         return json.load(f)
 
 
+STANDARD_TIMES_PATH = os.path.join("..", "web", "data", "section2_standard_times.json")
+
+# 차원 캐시 (표준시간 / work_type 매핑)
+#   - 한 번 실행(run_all.py): TTL 0 → 부를 때마다 새로 읽음 (기존과 같음)
+#   - 데몬(etl_daemon.py): TTL 을 늘려서 갱신 사이에 재사용
+# name -> (읽은 시각, version, 값)
+DIM_CACHE = {}
+DIM_CACHE_TTL_SEC = 0
+
+
+def cached_dim(name: str, loader, version=None):
+    # version 이 바뀌면(예: 파일 수정 시각) TTL 과 상관없이 다시 읽음
+    hit = DIM_CACHE.get(name)
+    now = time.monotonic()
+    if hit and hit[1] == version and now - hit[0] < DIM_CACHE_TTL_SEC:
+        return hit[2]
+    value = loader()
+    DIM_CACHE[name] = (now, version, value)
+    return value
+
+
 def load_standard_times() -> dict:
-    path = os.path.join("..", "web", "data", "section2_standard_times.json")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    def read():
+        with open(STANDARD_TIMES_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    return cached_dim("standard_times", read, version=os.path.getmtime(STANDARD_TIMES_PATH))
+
+
+def load_work_type_map(conn) -> dict:
+    # work_id -> work_type (Section1 필터링용)
+    def read():
+        with conn.cursor() as cur:
+            cur.execute("SELECT ex_srl, work_type FROM rx_air_work WHERE work_type IS NOT NULL;")
+            return {r[0]: r[1] for r in cur.fetchall()}
+
+    return cached_dim("work_type_map", read)
+
+
+def extend_work_type_map(conn) -> int:
+    """
+    캐시된 work_type 매핑에 새 work 만 덧붙임 (데몬 hot / delta 갱신용, TTL 은 그대로)
+      - high-water mark = 매핑에 있는 가장 큰 ex_srl → 그보다 큰 것만 PK 범위로 읽음
+      - 이미 있는 work 의 work_type 이 나중에 바뀐 것은 여기서 안 잡힘 → TTL 만료 / cold 때 전체 다시 읽음
+    return: 덧붙인 개수 (캐시가 없으면 0 → 다음 load_work_type_map 이 전체를 읽음)
+    """
+    hit = DIM_CACHE.get("work_type_map")
+    if not hit:
+        return 0
+    work_type_map = hit[2]
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT ex_srl, work_type FROM rx_air_work WHERE work_type IS NOT NULL AND ex_srl > %s;",
+            (max(work_type_map, default=0),),
+        )
+        rows = cur.fetchall()
+    work_type_map.update((r[0], r[1]) for r in rows)
+    return len(rows)
+
+
+@contextmanager
+def etl_lock(path: str = os.path.join("cache", "etl.lock")):
+    """
+    web/data 를 쓰는 실행은 한 번에 하나만 (cron 겹침 / 데몬 + 수동 실행 방지)
+      - 다른 실행이 잡고 있으면 BlockingIOError
+      - OS 가 잠금을 관리하므로 프로세스가 죽으면 자동으로 풀림
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    f = open(path, "a+")
+    try:
+        if os.name == "nt":
+            import msvcrt
+
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            except OSError:
+                raise BlockingIOError(f"다른 ETL 이 실행 중입니다 ({path})")
+        else:
+            import fcntl
+
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                raise BlockingIOError(f"다른 ETL 이 실행 중입니다 ({path})")
+        f.seek(0)
+        f.truncate()
+        f.write(f"{os.getpid()} {now_iso()}\n")
+        f.flush()
+        yield
+    finally:
+        f.close()  # 닫으면 잠금도 풀림
+
+
+# 날짜별로 나눠 둔 원본 행 (데몬은 최근 날짜만 다시 받아 교체)
+#   {yyyymmdd: [row, ...]}
+def partition_by_day(rows, day_of) -> dict:
+    out = {}
+    for r in rows:
+        out.setdefault(day_of(r), []).append(r)
+    return out
+
+
+def rows_in_day_order(by_day: dict) -> list:
+    out = []
+    for d in sorted(by_day):
+        out.extend(by_day[d])
+    return out
+
+
+# fetch_* 결과 행에서 항공사 열 위치 (데몬/배치가 항공사별로 행을 고를 때)
+ROW_AIRLINE_COL = {"counts": 1, "saved": 1, "ts": 0, "speed": 1}
+
+
+def day_int(v) -> int:
+    # DATE / "2025-12-06" / 20251206 -> 20251206
+    return int(str(v).replace("-", "")[:8])
 
 
 def ensure_out_dir() -> str:
@@ -39,11 +163,172 @@ def ensure_out_dir() -> str:
     return out_dir
 
 
-def write_json(out_dir: str, filename: str, payload: dict) -> None:
+# 이번 실행에서 write_json 으로 만든 파일 정보 (manifest.json 용)
+# filename -> {"sha256": str, "size": int, "generated_at": str}
+MANIFEST_ENTRIES = {}
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+def now_iso() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    # 임시파일에 다 쓴 뒤 os.replace 로 교체 → 읽는 쪽은 항상 "완성된 파일"만 봄
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_manifest(out_dir: str) -> dict:
+    path = os.path.join(out_dir, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return {"files": {}}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}}
+
+
+def write_json(out_dir: str, filename: str, payload: dict, compact: bool = False) -> None:
+    # compact=True: 들여쓰기/공백 없이 (행이 많은 index 배열 파일용)
     path = os.path.join(out_dir, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
-    print("✅ wrote", path)
+    if compact:
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    else:
+        data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    digest = sha256_hex(data)
+
+    # 내용이 같으면 다시 쓰지 않음 (브라우저도 재다운로드 안 함)
+    prev = load_manifest(out_dir).get("files", {}).get(filename)
+    unchanged = False
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            unchanged = sha256_hex(f.read()) == digest
+
+    if unchanged:
+        generated_at = prev["generated_at"] if prev and prev.get("sha256") == digest else now_iso()
+        print("⏩ unchanged", path)
+    else:
+        atomic_write_bytes(path, data)
+        generated_at = now_iso()
+        print("✅ wrote", path)
+
+    MANIFEST_ENTRIES[filename] = {
+        "sha256": digest,
+        "size": len(data),
+        "generated_at": generated_at,
+    }
+
+
+def write_manifest(out_dir: str) -> None:
+    """
+    manifest.json:
+      - out_dir 의 모든 *.json 파일에 대해 sha256 / size / generated_at 기록
+      - 이번 실행에서 안 만든 파일(예: section2_standard_times.json)은 디스크 내용으로 해시
+      - 임시파일 + os.replace 로 한 번에 교체
+    """
+    prev_files = load_manifest(out_dir).get("files", {})
+    files = {}
+
+    for filename in sorted(os.listdir(out_dir)):
+        if not filename.endswith(".json") or filename == MANIFEST_FILENAME:
+            continue
+
+        if filename in MANIFEST_ENTRIES:
+            files[filename] = MANIFEST_ENTRIES[filename]
+            continue
+
+        with open(os.path.join(out_dir, filename), "rb") as f:
+            data = f.read()
+        digest = sha256_hex(data)
+        prev = prev_files.get(filename)
+        files[filename] = {
+            "sha256": digest,
+            "size": len(data),
+            "generated_at": prev["generated_at"] if prev and prev.get("sha256") == digest else now_iso(),
+        }
+
+    manifest = {"generated_at": now_iso(), "files": files}
+    data = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+    atomic_write_bytes(os.path.join(out_dir, MANIFEST_FILENAME), data)
+    print("✅ wrote", os.path.join(out_dir, MANIFEST_FILENAME))
+
+
+# 항공사별로 쪼개서 따로 쓰는 파일 (대시보드는 탭을 처음 열 때 해당 항공사 파일만 받음)
+SHARDED_FILES = [
+    "section2_aircraft_timeseries.json",
+    "section2_process_timeseries.json",
+    "section3_speed_rows.json",
+    "section3_speed_rows_dict.json",
+    "section3_speed_summary.json",
+    "section3_worker_process_counts.json",
+]
+
+
+def shard_filename(filename: str, airline: str) -> str:
+    # section3_speed_rows.json -> section3_speed_rows.HH.json
+    base, ext = os.path.splitext(filename)
+    return f"{base}.{airline}{ext}"
+
+
+def row_airline(r: dict) -> str:
+    # airline 필드가 없으면 flight_title 앞 2글자 사용 (app.js와 동일)
+    return r.get("airline") or str(r.get("flight_title") or "")[:2]
+
+
+def airline_shard(payload: dict, airline: str) -> dict:
+    """
+    전체 payload에서 한 항공사 몫만 남긴다.
+      - rows: airline 필드로 필터 (dict-v1 형식은 dict_rows_shard)
+      - series / period_avg_min / rollups.*: "airline|..." key로 필터
+      - 나머지(range, meta 등)는 그대로
+    """
+    if payload.get("format") == DICT_ROWS_FORMAT:
+        return dict_rows_shard(payload, airline)
+
+    prefix = f"{airline}|"
+    out = {}
+    for k, v in payload.items():
+        if k == "rows" and isinstance(v, list):
+            out[k] = [r for r in v if row_airline(r) == airline]
+        elif k in ("series", "period_avg_min") and isinstance(v, dict):
+            out[k] = {sk: sv for sk, sv in v.items() if sk.startswith(prefix)}
+        elif k == "rollups" and isinstance(v, dict):
+            out[k] = {
+                res: {sk: sv for sk, sv in by_key.items() if sk.startswith(prefix)}
+                for res, by_key in v.items()
+            }
+        else:
+            out[k] = v
+    out["airline"] = airline
+    return out
+
+
+def write_airline_shards(out_dir: str, airlines: list) -> None:
+    """
+    SHARDED_FILES 를 항공사별 파일로 나눠서 저장.
+    디스크에 있는 전체 파일을 기준으로 나누므로,
+    다른 스크립트(run_all_251223.py)가 만든 파일도 같이 쪼개진다.
+    """
+    for filename in SHARDED_FILES:
+        path = os.path.join(out_dir, filename)
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        compact = payload.get("format") == DICT_ROWS_FORMAT
+        for airline in airlines:
+            write_json(out_dir, shard_filename(filename, airline), airline_shard(payload, airline), compact=compact)
 
 
 def in_placeholders(n: int) -> str:
@@ -51,6 +336,12 @@ def in_placeholders(n: int) -> str:
     return ",".join(["%s"] * n)
 
 
+def use_numpy(cfg: dict) -> bool:
+    # numpy 가 설치돼 있고 config 에서 끄지 않았으면 벡터 경로 사용
+    #   "etl": {"vectorized": false}  → 항상 파이썬 루프
+    return HAS_NUMPY and cfg.get("etl", {}).get("vectorized", True)
+
+
 def assert_cfg(cfg: dict) -> None:
     # 최소한의 안전장치(초보자 실수 방지)
     required = [
@@ -76,224 +367,31 @@ def assert_cfg(cfg: dict) -> None:
 
 
 # =========================
-# ETL: Section 1
+# SQL (ETL / export_facts.py 공용)
 # =========================
-def etl_section1(conn, cfg, date_from: int, date_to: int, out_dir: str, airlines: list) -> None:
+def build_saved_sql(date_from: int, date_to: int, airlines: list, with_date: bool = False):
     """
-    Section1:
-      - section1_counts.json
-      - section1_saved_points.json
-      - section1_saved_stats.json
+    Section1 절감시간 원본: (work_id, airline, aircraft, actual_sec[, work_yyyymmdd])
+    return: (sql, params)
     """
-    work_type_ids = set(cfg["work_types"]["cabin_cleaning"])
-
-    # 표준시간
-    standard_cfg = load_standard_times()
-    default_standard_sec = standard_cfg["default_standard_sec"]
-    standard_map = standard_cfg.get("by_airline_aircraft", {})
-
     ph_air = in_placeholders(len(airlines))
-
-    # 1) work_id -> work_type 매핑(필터링용)
-    with conn.cursor() as cur:
-        cur.execute("SELECT ex_srl, work_type FROM rx_air_work WHERE work_type IS NOT NULL;")
-        work_type_map = {r[0]: r[1] for r in cur.fetchall()}
-
-    # 2) 항공사별 청소 건수 (기내청소 work_type만)
-    sql_counts = f"""
-    SELECT v.work_id, o.airline_code
-    FROM v_work_time_clean v
-    JOIN rx_air_operation o ON o.ex_srl = v.operation_srl
-    WHERE v.quality='OK'
-      AND v.work_yyyymmdd BETWEEN {date_from} AND {date_to}
-      AND o.airline_code IN ({ph_air});
-    """
-    with conn.cursor() as cur:
-        cur.execute(sql_counts, airlines)
-        rows = cur.fetchall()
-
-    counter = Counter()
-    for work_id, airline in rows:
-        if work_type_map.get(work_id) in work_type_ids:
-            counter[airline] += 1
-
-    write_json(
-        out_dir,
-        "section1_counts.json",
-        {
-            "range": {"from": str(date_from), "to": str(date_to)},
-            "airlines": [{"code": k, "count": v} for k, v in counter.items()],
-        },
-    )
-
-    # 3) 절감시간 points/stats
+    date_col = ", b.work_yyyymmdd" if with_date else ""
     sql_saved = f"""
-    SELECT b.work_id, b.airline_code, b.aircraft_version_name, b.actual_sec
+    SELECT b.work_id, b.airline_code, b.aircraft_version_name, b.actual_sec{date_col}
     FROM v_dashboard_base b
     WHERE b.quality='OK'
       AND b.work_yyyymmdd BETWEEN {date_from} AND {date_to}
       AND b.airline_code IN ({ph_air})
       AND b.actual_sec IS NOT NULL;
     """
-    with conn.cursor() as cur:
-        cur.execute(sql_saved, airlines)
-        rows = cur.fetchall()
-
-    points = []
-    stats = defaultdict(list)
+    return sql_saved, list(airlines)
 
-    for work_id, airline, aircraft, actual_sec in rows:
-        if work_type_map.get(work_id) not in work_type_ids:
-            continue
-        key = f"{airline}|{aircraft}"
-        std = standard_map.get(key, default_standard_sec)
-        saved = std - actual_sec
-        points.append({"airline": airline, "saved_sec": float(saved)})
-        stats[airline].append(saved)
-
-    write_json(
-        out_dir,
-        "section1_saved_points.json",
-        {
-            "range": {"from": str(date_from), "to": str(date_to)},
-            "airlines": airlines,
-            "points": points,
-        },
-    )
 
-    write_json(
-        out_dir,
-        "section1_saved_stats.json",
-        {
-            "range": {"from": str(date_from), "to": str(date_to)},
-            "stats": [
-                {
-                    "code": a,
-                    "n": len(v),
-                    "avg_saved_sec": (sum(v) / len(v)) if v else 0,
-                    "min_saved_sec": min(v) if v else 0,
-                    "max_saved_sec": max(v) if v else 0,
-                }
-                for a, v in stats.items()
-            ],
-        },
-    )
-
-    print("====Section1 ETL 완료")
-
-
-# =========================
-# ETL: Section 2
-# =========================
-def etl_section2(conn, cfg, date_from: int, date_to: int, out_dir: str, airlines: list) -> None:
+def build_speed_sql(cfg: dict, date_from: int, date_to: int, airlines: list, with_work_type: bool = False):
     """
-    Section2:
-      - section2_aircraft_list.json
-      - section2_aircraft_timeseries.json
-    """
-    work_type_ids = set(cfg["work_types"]["cabin_cleaning"])
-    wt_list = sorted(work_type_ids)
-
-    # 표준시간
-    standard_cfg = load_standard_times()
-    default_standard_sec = standard_cfg["default_standard_sec"]
-    standard_map = standard_cfg.get("by_airline_aircraft", {})
-
-    ph_air = in_placeholders(len(airlines))
-    ph_wt = in_placeholders(len(wt_list))
-
-    # params 순서 주의: airlines 먼저, wt_list 나중 (SQL의 IN 순서와 맞춰야 함)
-    params = airlines + wt_list
-
-    sql_list = f"""
-    SELECT b.airline_code,
-           COALESCE(NULLIF(b.aircraft_version_name,''),'Unknown') AS aircraft,
-           COUNT(*) AS n
-    FROM v_dashboard_base b
-    JOIN rx_air_work w ON w.ex_srl = b.work_id
-    WHERE b.quality='OK'
-      AND b.work_yyyymmdd BETWEEN {date_from} AND {date_to}
-      AND b.airline_code IN ({ph_air})
-      AND w.work_type IN ({ph_wt})
-    GROUP BY b.airline_code, aircraft;
-    """
-
-    sql_ts = f"""
-    SELECT b.airline_code,
-           COALESCE(NULLIF(b.aircraft_version_name,''),'Unknown') AS aircraft,
-           b.work_yyyymmdd,
-           COUNT(*),
-           ROUND(AVG(b.actual_sec),1),
-           MIN(b.actual_sec),
-           MAX(b.actual_sec)
-    FROM v_dashboard_base b
-    JOIN rx_air_work w ON w.ex_srl = b.work_id
-    WHERE b.quality='OK'
-      AND b.work_yyyymmdd BETWEEN {date_from} AND {date_to}
-      AND b.airline_code IN ({ph_air})
-      AND w.work_type IN ({ph_wt})
-    GROUP BY b.airline_code, aircraft, b.work_yyyymmdd;
-    """
-
-    with conn.cursor() as cur:
-        cur.execute(sql_list, params)
-        rows_list = cur.fetchall()
-
-        cur.execute(sql_ts, params)
-        rows_ts = cur.fetchall()
-
-    by_airline = defaultdict(list)
-    for a, ac, n in rows_list:
-        std = standard_map.get(f"{a}|{ac}", default_standard_sec)
-        by_airline[a].append({"aircraft": ac, "n": int(n), "standard_sec": std})
-
-    write_json(
-        out_dir,
-        "section2_aircraft_list.json",
-        {
-            "range": {"from": str(date_from), "to": str(date_to)},
-            "airlines": airlines,
-            "aircraft_by_airline": dict(by_airline),
-        },
-    )
-
-    series = defaultdict(list)
-    for a, ac, d, n, avg, mn, mx in rows_ts:
-        std = standard_map.get(f"{a}|{ac}", default_standard_sec)
-        series[f"{a}|{ac}"].append(
-            {
-                "yyyymmdd": int(d),
-                "n": int(n),
-                "avg_actual_sec": float(avg),
-                "min_actual_sec": int(mn),
-                "max_actual_sec": int(mx),
-                "standard_sec": std,
-            }
-        )
-
-    write_json(
-        out_dir,
-        "section2_aircraft_timeseries.json",
-        {
-            "range": {"from": str(date_from), "to": str(date_to)},
-            "series": dict(series),
-        },
-    )
-
-    print("====Section2 ETL 완료")
-
-
-# =========================
-# ETL: Section 3-Speed
-# =========================
-def etl_section3_speed(conn, cfg, date_from: int, date_to: int, out_dir: str, airlines: list) -> None:
-    """
-    Section3-Speed:
-      - section3_speed_rows.json
-
-    핵심:
-      - SQL에서 이미 "role_label별 총 시간(백업 포함)"을 만들고,
-      - Python에서는 process/zone 매핑만 해서 JSON으로 저장
+    Section3-Speed 원본: role_label별 총 시간(백업 포함) 한 행씩
+      (date, airline, flight_title, role_label, member_srl, user_id, name, total_sec, total_min[, work_type])
+    return: (sql, params)
     """
     work_type_ids = set(cfg["work_types"]["cabin_cleaning"])
     wt_list = sorted(work_type_ids)
@@ -307,12 +405,16 @@ def etl_section3_speed(conn, cfg, date_from: int, date_to: int, out_dir: str, ai
     # IN (%s, %s) 형태로 바인딩
     ph_ex = in_placeholders(len(exclude_labels))
 
+    # run_batch.py: 여러 scope 의 work_type 합집합으로 한 번 받고 행마다 work_type 으로 나눔
+    wt_col = ",\n        tw.work_type" if with_work_type else ""
+
     sql_s3_speed = f"""
     WITH target_work AS (
         SELECT
             w.ex_srl,
             w.date,
             w.title,
+            w.work_type,
             o.airline_code
         FROM rx_air_work w
         JOIN rx_air_operation o ON o.ex_srl = w.operation_srl
@@ -397,7 +499,7 @@ def etl_section3_speed(conn, cfg, date_from: int, date_to: int, out_dir: str, ai
         m.user_id   AS member_user_id,
         COALESCE(NULLIF(m.nick_name,''), m.user_name) AS member_name,
         a.total_sec,
-        ROUND(a.total_sec / 60, 1) AS total_min
+        ROUND(a.total_sec / 60, 1) AS total_min{wt_col}
     FROM target_work tw
     JOIN agg a
       ON a.work_srl = tw.ex_srl
@@ -408,59 +510,656 @@ def etl_section3_speed(conn, cfg, date_from: int, date_to: int, out_dir: str, ai
       ON m.member_srl = mm.main_member_srl
     ORDER BY
         tw.date ASC,
-        flight_title ASC;
+        flight_title ASC,
+        role_label ASC,
+        mm.main_member_srl ASC;
     """
 
     # 파라미터 순서 = (wt_list...) + date_from + date_to + (airlines...) + (exclude_labels...)
-    params_s3_speed = wt_list + [str(date_from), str(date_to)] + airlines + exclude_labels
+    params_s3_speed = wt_list + [str(date_from), str(date_to)] + list(airlines) + exclude_labels
+    return sql_s3_speed, params_s3_speed
+
 
+def build_speed_log_sql(cfg: dict, date_from: int, date_to: int, airlines: list, with_work_type: bool = False):
+    """
+    Section3-Speed 원본 로그 (speed_engine "stream" 용): 집계 없이 work_srl 순서로
+      (work_srl, date, airline, flight_title, wdl_label, wdl_group_label, member_srl, wdl_duration[, work_type])
+    라벨 / 제외 라벨 조건은 build_speed_sql 의 log_norm 과 같음
+    return: (sql, params)
+    """
+    wt_list = sorted(set(cfg["work_types"]["cabin_cleaning"]))
+    exclude_labels = cfg.get("process_rules", {}).get("exclude_labels", ["무효", "OJT"])
+    labels = list(MAIN_LABELS) + list(BACKUP_LABELS)
+    wt_col = ",\n        w.work_type" if with_work_type else ""
+
+    sql_s3_log = f"""
+    SELECT
+        dl.work_srl,
+        w.date,
+        o.airline_code,
+        w.title AS flight_title,
+        dl.wdl_label,
+        dl.wdl_group_label,
+        COALESCE(dl.member_srl, wm.member_srl) AS member_srl,
+        dl.wdl_duration{wt_col}
+    FROM rx_air_work_duration_log dl
+    JOIN rx_air_work w ON w.ex_srl = dl.work_srl
+    JOIN rx_air_operation o ON o.ex_srl = w.operation_srl
+    LEFT JOIN rx_air_work_member wm ON wm.wm_srl = dl.wm_srl
+    WHERE
+        w.work_type IN ({in_placeholders(len(wt_list))})
+        AND w.date BETWEEN %s AND %s
+        AND o.airline_code IN ({in_placeholders(len(airlines))})
+        AND (
+          dl.wdl_label IN ({in_placeholders(len(labels))})
+          OR dl.wdl_group_label IN ({in_placeholders(len(MAIN_LABELS))})
+        )
+        AND dl.wdl_label NOT IN ({in_placeholders(len(exclude_labels))})
+    ORDER BY dl.work_srl;
+    """
+
+    params = (
+        wt_list
+        + [str(date_from), str(date_to)]
+        + list(airlines)
+        + labels
+        + list(MAIN_LABELS)
+        + list(exclude_labels)
+    )
+    return sql_s3_log, params
+
+
+def connect_db(cfg: dict, streaming: bool = False):
+    # streaming=True: 서버 측 커서(SSCursor) → fetchmany 로 조금씩 받음 (메모리 일정)
+    db = cfg["db"]
+    return pymysql.connect(
+        host=db["host"],
+        port=int(db["port"]),
+        user=db["user"],
+        password=db["password"],
+        database=db["database"],
+        charset="utf8mb4",
+        autocommit=True,
+        cursorclass=pymysql.cursors.SSCursor if streaming else pymysql.cursors.Cursor,
+    )
+
+
+# =========================
+# pipeline (DB 받기와 파이썬 처리를 겹치기)
+# =========================
+# "etl": {"pipeline": true, "pipeline_batch": 5000, "pipeline_queue": 8}
+#   - 쿼리마다 스레드 하나가 서버 측 커서로 batch 씩 받아 크기 제한 큐에 넣음
+#   - fetch_* 는 큐에서 나오는 대로 날짜별로 나눔 (fetchall 로 다 받은 뒤 나누지 않음)
+#   - run_sections 는 세 섹션 받기를 동시에 시작하고, 섹션 순서대로 JSON 을 만듦
+#   쿼리마다 DB 연결을 하나씩 더 씀 (기본은 꺼짐 → 예전처럼 fetchall 후 처리)
+def pipeline_enabled(cfg: dict) -> bool:
+    """
+    겹치는 것: 한 섹션의 JSON 만들기 ↔ 다른 섹션들의 DB 받기, 그리고 DB 받기 ↔ 날짜별 나누기
+    겹치지 않는 것: 한 섹션 안에서 DB 받기 ↔ 그 섹션의 JSON 만들기
+      - fetch_* 는 스트림을 끝까지 읽어 날짜별 dict 를 만든 뒤 돌려줌 → etl_section* 는 그 다음에 시작
+      - etl_section* 가 기간 전체를 날짜 순으로 봐야 하기 때문 (항공사/기종 순서, stats, 층화 표본, rollup)
+        → counts/saved/ts 쿼리는 ORDER BY 가 없어 마지막 행까지 와야 날짜 순이 정해짐
+      - 데몬도 이 날짜별 dict 를 캐시해서 최근 날짜만 바꿔 끼움
+    그래서 섹션 하나의 처리 시간은 그대로이고, 빨라지는 것은 섹션끼리 겹치는 만큼 + 받는 동안 나누기
+    """
+    return bool(cfg.get("etl", {}).get("pipeline", False))
+
+
+class RowStream:
+    """
+    for r in RowStream(...) → 행이 DB 에서 오는 대로 나옴
+      - 받는 쪽이 느리면 큐(max_batches)가 차서 받기 스레드가 기다림 → 메모리 일정
+      - 받기 스레드의 에러는 받는 쪽에서 다시 발생
+      - 받는 쪽이 중간에 멈추면(에러 등) 받기 스레드도 멈춤
+    """
+
+    _DONE = object()
+
+    def __init__(self, cfg: dict, sql: str, params, batch_size: int = 5000, max_batches: int = 8):
+        self.q = queue.Queue(maxsize=max_batches)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(
+            target=self._produce, args=(cfg, sql, params, batch_size), name="fetch-stream", daemon=True
+        )
+        self.thread.start()
+
+    def _put(self, item) -> bool:
+        while not self.stopped.is_set():
+            try:
+                self.q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, cfg, sql, params, batch_size) -> None:
+        try:
+            conn = connect_db(cfg, streaming=True)
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(sql, params)
+                    while True:
+                        batch = cur.fetchmany(batch_size)
+                        if not batch or not self._put(batch):
+                            break
+            finally:
+                conn.close()
+            self._put(self._DONE)
+        except BaseException as e:
+            self._put(e)
+
+    def __iter__(self):
+        try:
+            while True:
+                item = self.q.get()
+                if item is self._DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield from item
+        finally:
+            self.stopped.set()
+
+
+def query_rows(conn, cfg: dict, sql: str, params):
+    # pipeline 이면 바로 받기 시작한 RowStream, 아니면 conn 으로 fetchall 한 list
+    if pipeline_enabled(cfg):
+        etl = cfg.get("etl", {})
+        return RowStream(cfg, sql, params, int(etl.get("pipeline_batch", 5000)), int(etl.get("pipeline_queue", 8)))
     with conn.cursor() as cur:
-        cur.execute(sql_s3_speed, params_s3_speed)
-        speed_rows = cur.fetchall()
+        cur.execute(sql, params)
+        return cur.fetchall()
+
 
-    def role_to_process_zone(role_label: str):
-        role_label = (role_label or "").strip()
+# =========================
+# ETL: Section 1
+# =========================
+def section1_saved_py(rows, work_type_map: dict, work_type_ids: set, standard_map: dict, default_standard_sec):
+    """
+    절감시간 points/stats (파이썬 루프 경로, numpy 없을 때)
+      rows: (work_id, airline, aircraft, actual_sec)
+    """
+    # 행마다 dict/"항공사|기종" 문자열을 만들지 않고 코드 + array 열로 보관
+    #   - 표준시간은 (항공사 코드, 기종 코드) 조합당 한 번만 조회
+    #   - points 열: p_air(항공사 코드), p_saved(절감초)
+    #   - stats: 항공사 코드별 n / sum / min / max 칸
+    air_codes = DimCodes()
+    craft_codes = DimCodes()
+    std_cache = {}
+
+    p_air = array("B")
+    p_saved = array("d")
+    s_n = array("q")
+    s_sum = array("d")
+    s_min = array("d")
+    s_max = array("d")
 
-        # 소닉N
-        m = re.match(r"^소닉(\d+)$", role_label)
-        if m:
-            return "소닉", m.group(1)
+    for work_id, airline, aircraft, actual_sec in rows:
+        if work_type_map.get(work_id) not in work_type_ids:
+            continue
+        a = air_codes.code(airline)
+        pair = (a, craft_codes.code(aircraft))
+        std = std_cache.get(pair)
+        if std is None:
+            std = std_cache[pair] = standard_map.get(f"{airline}|{aircraft}", default_standard_sec)
+        saved = std - actual_sec
 
-        # 소닉* 기타 라벨은 일단 소닉으로 묶고 zone=0
-        if role_label.startswith("소닉"):
-            return "소닉", "0"
+        p_air.append(a)
+        p_saved.append(saved)
+
+        if a == len(s_n):
+            s_n.append(0)
+            s_sum.append(0.0)
+            s_min.append(saved)
+            s_max.append(saved)
+        s_n[a] += 1
+        s_sum[a] += saved
+        if saved < s_min[a]:
+            s_min[a] = saved
+        if saved > s_max[a]:
+            s_max[a] = saved
+
+    # dict 는 JSON 저장 직전에만 만든다
+    air_values = air_codes.values
+    points = [
+        {"airline": air_values[p_air[i]], "saved_sec": p_saved[i]}
+        for i in range(len(p_saved))
+    ]
+    stats = [
+        {
+            "code": code,
+            "n": s_n[a],
+            "avg_saved_sec": s_sum[a] / s_n[a],
+            "min_saved_sec": num_out(s_min[a]),
+            "max_saved_sec": num_out(s_max[a]),
+        }
+        for a, code in enumerate(air_values)
+    ]
+    return points, stats
 
-        if role_label.startswith("라바"):
-            return "라바", "0"
 
-        # 로보캅 (DB에서 role_label이 '로보캅'으로 나오도록 설계)
-        return "로보캅", "0"
+def fetch_section1(conn, cfg, date_from: int, date_to: int, airlines: list) -> dict:
+    """
+    Section1 원본 행 (날짜별로 나눠서)
+      - counts: (work_id, airline)
+      - saved:  (work_id, airline, aircraft, actual_sec)
+    """
+    ph_air = in_placeholders(len(airlines))
 
-    rows_out = []
-    for d, airline_code, flight_title, role_label, msrl, user_id, name, total_sec, total_min in speed_rows:
-        process, zone = role_to_process_zone(role_label)
+    # 항공사별 청소 건수 원본
+    sql_counts = f"""
+    SELECT v.work_id, o.airline_code, v.work_yyyymmdd
+    FROM v_work_time_clean v
+    JOIN rx_air_operation o ON o.ex_srl = v.operation_srl
+    WHERE v.quality='OK'
+      AND v.work_yyyymmdd BETWEEN {date_from} AND {date_to}
+      AND o.airline_code IN ({ph_air});
+    """
+    sql_saved, params_saved = build_saved_sql(date_from, date_to, airlines, with_date=True)
+
+    # pipeline 모드면 두 쿼리가 동시에 흘러들어옴 (아래 partition 이 받는 대로 나눔, 다 받은 뒤 return)
+    counts = query_rows(conn, cfg, sql_counts, airlines)
+    saved = query_rows(conn, cfg, sql_saved, params_saved)
+
+    # 날짜 열은 나누는 데만 쓰고 행에서는 뺀다
+    return {
+        "counts": {d: [r[:2] for r in rs] for d, rs in partition_by_day(counts, lambda r: day_int(r[2])).items()},
+        "saved": {d: [r[:4] for r in rs] for d, rs in partition_by_day(saved, lambda r: day_int(r[4])).items()},
+    }
+
+
+def etl_section1(conn, cfg, date_from: int, date_to: int, out_dir: str, airlines: list, data: dict = None) -> None:
+    """
+    Section1:
+      - section1_counts.json
+      - section1_saved_points.json
+      - section1_saved_stats.json
+    data: fetch_section1 결과 (없으면 여기서 받음, 데몬은 캐시한 것을 넘김)
+    """
+    if data is None:
+        data = fetch_section1(conn, cfg, date_from, date_to, airlines)
+
+    work_type_ids = set(cfg["work_types"]["cabin_cleaning"])
+
+    # 표준시간
+    standard_cfg = load_standard_times()
+    default_standard_sec = standard_cfg["default_standard_sec"]
+    standard_map = standard_cfg.get("by_airline_aircraft", {})
+
+    # 1) work_id -> work_type 매핑(필터링용)
+    work_type_map = load_work_type_map(conn)
+
+    # 2) 항공사별 청소 건수 (기내청소 work_type만)
+    rows = rows_in_day_order(data["counts"])
+
+    # 항공사 -> 정수 코드, 건수는 코드 위치의 int 칸에 누적
+    air_codes = DimCodes()
+    counts = array("q")
+    for work_id, airline in rows:
+        if work_type_map.get(work_id) in work_type_ids:
+            a = air_codes.code(airline)
+            if a == len(counts):
+                counts.append(0)
+            counts[a] += 1
+
+    write_json(
+        out_dir,
+        "section1_counts.json",
+        {
+            "range": {"from": str(date_from), "to": str(date_to)},
+            "airlines": [{"code": k, "count": counts[a]} for a, k in enumerate(air_codes.values)],
+        },
+    )
+
+    # 3) 절감시간 points/stats
+    rows = rows_in_day_order(data["saved"])
+
+    if use_numpy(cfg):
+        allowed = {wid for wid, wt in work_type_map.items() if wt in work_type_ids}
+        points, stats = section1_saved_np(rows, allowed, standard_map, default_standard_sec)
+    else:
+        points, stats = section1_saved_py(rows, work_type_map, work_type_ids, standard_map, default_standard_sec)
+
+    payload_points = {
+        "range": {"from": str(date_from), "to": str(date_to)},
+        "airlines": airlines,
+        "points": points,
+    }
+
+    # 점 개수 상한 (항공사별): (기종, 날짜) 층화 reservoir 표본만 저장, stats 는 위에서 전체로 계산됨
+    per_airline = int(cfg.get("etl", {}).get("saved_points_per_airline", 0))
+    if per_airline > 0:
+        # points 와 같은 순서(날짜 순 + 같은 work_type 필터)로 (기종, 날짜)
+        strata = [
+            (aircraft, d)
+            for d in sorted(data["saved"])
+            for work_id, _, aircraft, _ in data["saved"][d]
+            if work_type_map.get(work_id) in work_type_ids
+        ]
+        payload_points["points"], kept = sample_points(points, strata, per_airline)
+        payload_points["sampling"] = {
+            "method": "stratified_reservoir",
+            "strata": ["aircraft", "date"],
+            "per_airline": per_airline,
+            "airlines": kept,
+        }
+
+    write_json(out_dir, "section1_saved_points.json", payload_points)
+
+    write_json(
+        out_dir,
+        "section1_saved_stats.json",
+        {
+            "range": {"from": str(date_from), "to": str(date_to)},
+            "stats": stats,
+        },
+    )
+
+    print("====Section1 ETL 완료")
+
+
+# =========================
+# ETL: Section 2
+# =========================
+def fetch_section2(conn, cfg, date_from: int, date_to: int, airlines: list, by_work_type: bool = False) -> dict:
+    """
+    Section2 원본: (airline, aircraft, yyyymmdd, n, avg, min, max) 일별 집계 행 (날짜별로 나눠서)
+    by_work_type=True: work_type 별로 따로 묶고 뒤에 (work_type, sum_sec) 를 붙임
+      → run_batch.py 가 scope 마다 고른 work_type 만 다시 합침
+    """
+    work_type_ids = set(cfg["work_types"]["cabin_cleaning"])
+    wt_list = sorted(work_type_ids)
+
+    ph_air = in_placeholders(len(airlines))
+    ph_wt = in_placeholders(len(wt_list))
+
+    # params 순서 주의: airlines 먼저, wt_list 나중 (SQL의 IN 순서와 맞춰야 함)
+    params = list(airlines) + wt_list
+
+    wt_cols = ",\n           w.work_type,\n           SUM(b.actual_sec)" if by_work_type else ""
+    wt_group = ", w.work_type" if by_work_type else ""
+
+    sql_ts = f"""
+    SELECT b.airline_code,
+           COALESCE(NULLIF(b.aircraft_version_name,''),'Unknown') AS aircraft,
+           b.work_yyyymmdd,
+           COUNT(*),
+           ROUND(AVG(b.actual_sec),1),
+           MIN(b.actual_sec),
+           MAX(b.actual_sec){wt_cols}
+    FROM v_dashboard_base b
+    JOIN rx_air_work w ON w.ex_srl = b.work_id
+    WHERE b.quality='OK'
+      AND b.work_yyyymmdd BETWEEN {date_from} AND {date_to}
+      AND b.airline_code IN ({ph_air})
+      AND w.work_type IN ({ph_wt})
+    GROUP BY b.airline_code, aircraft, b.work_yyyymmdd{wt_group};
+    """
+
+    rows_ts = query_rows(conn, cfg, sql_ts, params)
+    return {"ts": partition_by_day(rows_ts, lambda r: day_int(r[2]))}
+
+
+def etl_section2(conn, cfg, date_from: int, date_to: int, out_dir: str, airlines: list, data: dict = None) -> None:
+    """
+    Section2:
+      - section2_aircraft_list.json
+      - section2_aircraft_timeseries.json
+    data: fetch_section2 결과 (없으면 여기서 받음)
+    """
+    if data is None:
+        data = fetch_section2(conn, cfg, date_from, date_to, airlines)
+
+    # 표준시간
+    standard_cfg = load_standard_times()
+    default_standard_sec = standard_cfg["default_standard_sec"]
+    standard_map = standard_cfg.get("by_airline_aircraft", {})
+
+    rows_ts = rows_in_day_order(data["ts"])
+
+    # 기종 목록의 n = 일별 n 의 합 (따로 GROUP BY 쿼리를 돌리지 않음 → 날짜별 캐시로도 만들 수 있음)
+    list_n = defaultdict(int)
+    for a, ac, d, n, avg, mn, mx in rows_ts:
+        list_n[(a, ac)] += int(n)
 
-        rows_out.append(
+    by_airline = defaultdict(list)
+    for (a, ac), n in sorted(list_n.items()):
+        std = standard_map.get(f"{a}|{ac}", default_standard_sec)
+        by_airline[a].append({"aircraft": ac, "n": n, "standard_sec": std})
+
+    write_json(
+        out_dir,
+        "section2_aircraft_list.json",
+        {
+            "range": {"from": str(date_from), "to": str(date_to)},
+            "airlines": airlines,
+            "aircraft_by_airline": dict(by_airline),
+        },
+    )
+
+    series = defaultdict(list)
+    for a, ac, d, n, avg, mn, mx in rows_ts:
+        std = standard_map.get(f"{a}|{ac}", default_standard_sec)
+        series[f"{a}|{ac}"].append(
             {
-                "date": str(d),
-                "airline": airline_code,
-                "flight_title": flight_title,
-                "role_label": role_label,      # 소닉1/2/.. 라바/로보캅
-                "process": process,            # 소닉/라바/로보캅
-                "zone": str(zone),             # 소닉은 1~6, 그 외 0
-                "member_srl": int(msrl),
-                "member_user_id": user_id or "",
-                "member_name": name or "",
-                "time_sec": int(total_sec or 0),
-                "backup_sec_attached": 0,      # 이미 SQL에서 합산했으므로 0
-                "total_min": float(total_min or 0),
+                "yyyymmdd": int(d),
+                "n": int(n),
+                "avg_actual_sec": float(avg),
+                "min_actual_sec": int(mn),
+                "max_actual_sec": int(mx),
+                "standard_sec": std,
             }
         )
 
+    write_json(
+        out_dir,
+        "section2_aircraft_timeseries.json",
+        {
+            "range": {"from": str(date_from), "to": str(date_to)},
+            "series": dict(series),
+            "rollups": series_rollups(series, "aircraft"),
+        },
+    )
+
+    print("====Section2 ETL 완료")
+
+
+# =========================
+# Section 2 rollups (주/월)
+# =========================
+# 일별 series 를 주(월요일 시작)/월 단위로 묶어서 같은 파일의 "rollups" 에 추가
+#   → 기간이 길어지면 대시보드가 주/월 막대를 골라 그림 (막대 수 일정)
+#   aircraft: etl_section2 / process: run_all_251223.py 가 파일을 쓰기 전에 같이 넣음 (한 번만 씀)
+
+
+def bucket_start(yyyymmdd: int, res: str) -> int:
+    d = datetime.strptime(str(yyyymmdd), "%Y%m%d").date()
+    if res == "week":
+        d = d - timedelta(days=d.weekday())
+    else:  # month
+        d = d.replace(day=1)
+    return int(d.strftime("%Y%m%d"))
+
+
+def rollup_rows(rows: list, kind: str, res: str) -> list:
+    """
+    일별 행 -> 주/월 행 (yyyymmdd = 구간 시작일, yyyymmdd_to = 구간 안 마지막 데이터 날짜)
+      aircraft: n 합계, avg_actual_sec 은 n 가중 평균, min/max 는 구간 최소/최대
+      process:  members/sum_sec 합계, avg_min = sum_sec / members (인원 가중), 일별 avg_min 의 최소/최대
+    """
+    buckets = {}
+    for r in sorted(rows, key=lambda r: r["yyyymmdd"]):
+        b = bucket_start(r["yyyymmdd"], res)
+        buckets.setdefault(b, []).append(r)
+
+    out = []
+    for b, rs in buckets.items():
+        row = {"yyyymmdd": b, "yyyymmdd_to": rs[-1]["yyyymmdd"], "days": len(rs)}
+        if kind == "aircraft":
+            n = sum(r["n"] for r in rs)
+            row.update(
+                {
+                    "n": n,
+                    "avg_actual_sec": round(sum(r["avg_actual_sec"] * r["n"] for r in rs) / n, 1) if n else 0.0,
+                    "min_actual_sec": min(r["min_actual_sec"] for r in rs),
+                    "max_actual_sec": max(r["max_actual_sec"] for r in rs),
+                    "standard_sec": rs[-1]["standard_sec"],
+                }
+            )
+        else:
+            members = sum(r["members"] for r in rs)
+            sum_sec = sum(r["sum_sec"] for r in rs)
+            row.update(
+                {
+                    "members": members,
+                    "sum_sec": sum_sec,
+                    "avg_min": round(sum_sec / members / 60, 2) if members else 0.0,
+                    "min_avg_min": min(r["avg_min"] for r in rs),
+                    "max_avg_min": max(r["avg_min"] for r in rs),
+                }
+            )
+        out.append(row)
+    return out
+
+
+def series_rollups(series: dict, kind: str) -> dict:
+    # {"week": {key: 주 행}, "month": {key: 월 행}}
+    return {res: {key: rollup_rows(rows, kind, res) for key, rows in series.items()} for res in ("week", "month")}
+
+
+# =========================
+# ETL: Section 3-Speed
+# =========================
+def role_to_process_zone(role_label: str):
+    role_label = (role_label or "").strip()
+
+    # 소닉N
+    m = re.match(r"^소닉(\d+)$", role_label)
+    if m:
+        return "소닉", m.group(1)
+
+    # 소닉* 기타 라벨은 일단 소닉으로 묶고 zone=0
+    if role_label.startswith("소닉"):
+        return "소닉", "0"
+
+    if role_label.startswith("라바"):
+        return "라바", "0"
+
+    # 로보캅 (DB에서 role_label이 '로보캅'으로 나오도록 설계)
+    return "로보캅", "0"
+
+
+MEMBER_LOOKUP_CHUNK = 1000  # rx_member IN (...) 한 번에 넣을 개수
+
+
+def lookup_members(conn, cfg: dict, member_srls) -> dict:
+    # member_srl -> (user_id, 표시 이름) (SQL 경로의 LEFT JOIN rx_member 와 같은 값)
+    srls = sorted(member_srls)
+    out = {}
+    for i in range(0, len(srls), MEMBER_LOOKUP_CHUNK):
+        chunk = srls[i : i + MEMBER_LOOKUP_CHUNK]
+        sql = f"""
+        SELECT member_srl, user_id, COALESCE(NULLIF(nick_name,''), user_name)
+        FROM rx_member
+        WHERE member_srl IN ({in_placeholders(len(chunk))});
+        """
+        for srl, user_id, name in query_rows(conn, cfg, sql, chunk):
+            out[srl] = (user_id, name)
+    return out
+
+
+def fetch_speed_stream(conn, cfg, date_from: int, date_to: int, airlines: list, by_work_type: bool = False) -> list:
+    """
+    speed_engine "stream": 로그를 work_srl 순서로 흘려 받으면서 attribution.attribute_backups 로 바로 합산
+      - DB 는 정렬 + 조인만, 백업 → 메인 귀속은 파이썬에서 work 하나씩 (메모리는 work 한 건 + 결과 행)
+      - 로그는 pipeline 설정과 상관없이 항상 RowStream (서버 측 커서) 으로 받음
+    return: build_speed_sql 과 같은 모양, 같은 순서의 행 (date, title, role, member 순)
+    """
+    pr = cfg.get("process_rules", {})
+    etl = cfg.get("etl", {})
+    sql, params = build_speed_log_sql(cfg, date_from, date_to, airlines, with_work_type=by_work_type)
+    logs = RowStream(cfg, sql, params, int(etl.get("pipeline_batch", 5000)), int(etl.get("pipeline_queue", 8)))
+
+    counters = Counter()
+    attributed = list(attribute_backups(logs, bool(pr.get("attach_backup_by_label", False)), counters))
+    members = lookup_members(conn, cfg, {r[4] for r in attributed})
+
+    rows = []
+    for d, airline, title, role, msrl, total_sec, total_min, *extra in attributed:
+        user_id, name = members.get(msrl, (None, None))
+        rows.append((d, airline, title, role, msrl, user_id, name, total_sec, total_min, *extra))
+    rows.sort(key=lambda r: (r[0], r[2], r[3], r[4]))  # SQL 의 ORDER BY date, flight_title, role_label, member
+
+    print(
+        f"[Section3-Speed] stream logs={counters['logs']} works={counters['works']} rows={counters['rows_out']} "
+        f"backup attached={counters['backup_attached']}, unattached={counters['unattached_backup']} "
+        f"({counters['unattached_sec']}s), orphan_label={counters['orphan_label']}, "
+        f"no_main_member={counters['no_main_member']}"
+    )
+    return rows
+
+
+def fetch_section3_speed(conn, cfg, date_from: int, date_to: int, airlines: list, by_work_type: bool = False) -> dict:
+    # Section3-Speed 원본 행 (날짜별로 나눠서)
+    #   by_work_type=True: 행 끝에 work_type (run_batch.py 용)
+    #   process_rules.speed_engine: "sql"(기본, build_speed_sql 에서 CTE 로 합산) / "stream"(fetch_speed_stream)
+    if cfg.get("process_rules", {}).get("speed_engine", "sql") == "stream":
+        speed_rows = fetch_speed_stream(conn, cfg, date_from, date_to, airlines, by_work_type=by_work_type)
+    else:
+        sql_s3_speed, params_s3_speed = build_speed_sql(cfg, date_from, date_to, airlines, with_work_type=by_work_type)
+        speed_rows = query_rows(conn, cfg, sql_s3_speed, params_s3_speed)
+    return {"speed": partition_by_day(speed_rows, lambda r: day_int(r[0]))}
+
+
+def etl_section3_speed(conn, cfg, date_from: int, date_to: int, out_dir: str, airlines: list, data: dict = None) -> None:
+    """
+    Section3-Speed:
+      - section3_speed_rows.json
+      - section3_speed_rows_dict.json (같은 rows, 문자열 테이블 + index)
+      - section3_speed_summary.json (airline/process/zone/member 요약)
+
+    핵심:
+      - SQL에서 이미 "role_label별 총 시간(백업 포함)"을 만들고,
+      - Python에서는 process/zone 매핑만 해서 JSON으로 저장
+    data: fetch_section3_speed 결과 (없으면 여기서 받음)
+    """
+    if data is None:
+        data = fetch_section3_speed(conn, cfg, date_from, date_to, airlines)
+    speed_rows = rows_in_day_order(data["speed"])
+
+    # 역할/작업자/편명 등은 정수 코드로, process/zone 은 역할 코드당 한 번만 계산
+    table = SpeedTable(role_to_process_zone)
+    for d, airline_code, flight_title, role_label, msrl, user_id, name, total_sec, total_min in speed_rows:
+        table.append(d, airline_code, flight_title, role_label, msrl, user_id, name, total_sec, total_min)
+
     write_json(
         out_dir,
         "section3_speed_rows.json",
-        {"range": {"from": str(date_from), "to": str(date_to)}, "rows": rows_out},
+        {"range": {"from": str(date_from), "to": str(date_to)}, "rows": list(table.to_dicts())},
+    )
+
+    # 같은 rows 를 문자열 테이블 + index 행으로 (작업자/편명/역할 문자열을 한 번씩만 저장)
+    #   브라우저는 app.js decodeDictRows 로 원래 행 모양으로 되돌려 씀
+    write_json(
+        out_dir,
+        "section3_speed_rows_dict.json",
+        {"range": {"from": str(date_from), "to": str(date_to)}, **table.to_dict_payload()},
+        compact=True,
+    )
+
+    # 차트용 요약 (브라우저는 이걸 그대로 그리고, rows는 드릴다운 때만 받음)
+    write_json(
+        out_dir,
+        "section3_speed_summary.json",
+        {
+            "range": {"from": str(date_from), "to": str(date_to)},
+            "rows": speed_summary_np(table) if use_numpy(cfg) else table.summarize(),
+            "meta": {
+                "group_by": ["airline", "process", "zone", "member_srl"],
+                "metric": "time_sec (백업 포함, SQL agg 합산)",
+                "quantile": "linear interpolation",
+            },
+        },
     )
 
     print("====Section3-Speed ETL 완료")
@@ -469,40 +1168,70 @@ def etl_section3_speed(conn, cfg, date_from: int, date_to: int, out_dir: str, ai
 # =========================
 # main
 # =========================
+def scope_range(cfg: dict):
+    # config scope -> (date_from, date_to) / "TODAY" 는 부를 때의 오늘
+    date_from = yyyymmdd_from_dash(cfg["scope"]["date_from"])
+    date_to = (
+        today_yyyymmdd()
+        if cfg["scope"]["date_to"] == "TODAY"
+        else yyyymmdd_from_dash(cfg["scope"]["date_to"])
+    )
+    return date_from, date_to
+
+
+SECTION_STEPS = [
+    (fetch_section1, etl_section1),
+    (fetch_section2, etl_section2),
+    (fetch_section3_speed, etl_section3_speed),
+]
+
+
+def run_sections(conn, cfg: dict, date_from: int, date_to: int, out_dir: str, airlines: list) -> None:
+    if not pipeline_enabled(cfg):
+        for fetch, build in SECTION_STEPS:
+            build(conn, cfg, date_from, date_to, out_dir, airlines)
+        return
+
+    # 받기는 섹션마다 스레드로 동시에, JSON 만들기는 이 스레드에서 순서대로
+    #   → Section1 을 만드는 동안 Section2/3 쿼리가 계속 받아짐
+    #   fut.result() 는 그 섹션의 쿼리를 끝까지 받은 뒤에 나옴 (pipeline_enabled 설명 참고)
+    #   (받기 스레드는 각자 연결을 쓰므로 conn 을 넘기지 않음, conn 은 work_type 매핑 등에만 사용)
+    with ThreadPoolExecutor(max_workers=len(SECTION_STEPS), thread_name_prefix="fetch") as ex:
+        futures = [ex.submit(fetch, None, cfg, date_from, date_to, airlines) for fetch, _ in SECTION_STEPS]
+        for (fetch, build), fut in zip(SECTION_STEPS, futures):
+            build(conn, cfg, date_from, date_to, out_dir, airlines, data=fut.result())
+
+
+def finish_outputs(out_dir: str, airlines: list) -> None:
+    # 항공사별 shard (탭별 on-demand 로딩용)
+    write_airline_shards(out_dir, airlines)
+
+    # 모든 섹션을 다 쓴 다음 마지막에 manifest 교체
+    write_manifest(out_dir)
+
+
 def main():
     print("### run_all.py 시작됨 ###")
 
     cfg = load_config()
     assert_cfg(cfg)
 
-    db = cfg["db"]
     airlines = cfg["scope"]["airlines"]
 
-    date_from = yyyymmdd_from_dash(cfg["scope"]["date_from"])
-    date_to = (
-        today_yyyymmdd()
-        if cfg["scope"]["date_to"] == "TODAY"
-        else yyyymmdd_from_dash(cfg["scope"]["date_to"])
-    )
+    date_from, date_to = scope_range(cfg)
 
     out_dir = ensure_out_dir()
 
-    conn = pymysql.connect(
-        host=db["host"],
-        port=int(db["port"]),
-        user=db["user"],
-        password=db["password"],
-        database=db["database"],
-        charset="utf8mb4",
-        autocommit=True,
-    )
+    conn = connect_db(cfg)
 
     try:
-        etl_section1(conn, cfg, date_from, date_to, out_dir, airlines)
-        etl_section2(conn, cfg, date_from, date_to, out_dir, airlines)
-        etl_section3_speed(conn, cfg, date_from, date_to, out_dir, airlines)
+        with etl_lock():
+            run_sections(conn, cfg, date_from, date_to, out_dir, airlines)
+            finish_outputs(out_dir, airlines)
 
         print("### run_all.py 끝까지 실행됨 ###")
+    except BlockingIOError as e:
+        print("⏩", e)
     finally:
         conn.close()
 
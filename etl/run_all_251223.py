@@ -5,6 +5,8 @@ from collections import defaultdict, Counter
 
 import pymysql
 
+from run_all import etl_lock, finish_outputs, series_rollups, write_json
+
 
 # -------------------------
 # helpers
@@ -34,13 +36,6 @@ def ensure_out_dir():
     return out_dir
 
 
-def write_json(out_dir, filename, payload):
-    path = os.path.join(out_dir, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
-    print("✅ wrote", path)
-
-
 def in_placeholders(n: int) -> str:
     return ",".join(["%s"] * n)
 
@@ -48,9 +43,7 @@ def in_placeholders(n: int) -> str:
 # -------------------------
 # main ETL
 # -------------------------
-def main():
-    print("### run_all.py 시작됨 ###")
-
+def run():
     cfg = load_config()
     db = cfg["db"]
     airlines = cfg["scope"]["airlines"]
@@ -484,6 +477,7 @@ def main():
             {
                 "range": {"from": str(date_from), "to": str(date_to)},
                 "series": dict(series),
+                "rollups": series_rollups(series, "process"),
                 "period_avg_min": period_avg,
                 "meta": {
                     "exclude_labels": sorted(list(exclude_labels)),
@@ -711,7 +705,8 @@ def main():
 
         # process 분류 함수 재사용
         def pick_process_and_zone(labels: set):
-            filtered = {lb for lb in labels if lb and lb not in exclude_labels}
+            # 정렬: 같은 공정 라벨이 여러 개면(예: 소닉1 + 소닉백업존1) 실행마다 같은 zone 이 나오도록
+            filtered = sorted({lb for lb in labels if lb and lb not in exclude_labels})
             for lb in filtered:
                 for p in sonic_prefixes:
                     if lb.startswith(p):
@@ -836,7 +831,9 @@ def main():
 
         print("====Section3-Speed ETL 완료")
 
-
+        # 항공사별 shard 다시 쪼갠 뒤 manifest 해시 갱신
+        #   (안 하면 app.js 가 지난 run_all 의 shard 나 같은 ?v= 주소의 옛 캐시를 계속 씀)
+        finish_outputs(out_dir, airlines)
 
         print("### run_all.py 끝까지 실행됨 ###")
 
@@ -844,5 +841,17 @@ def main():
         conn.close()
 
 
+def main():
+    print("### run_all.py 시작됨 ###")
+
+    # run_all.py / etl_daemon.py 와 같은 잠금 → web/data 를 동시에 쓰지 않음
+    #   (파일 쓰기도 run_all.write_json: 임시파일 + os.replace, 끝나면 manifest 갱신)
+    try:
+        with etl_lock():
+            run()
+    except BlockingIOError as e:
+        print("⏩", e)
+
+
 if __name__ == "__main__":
     main()
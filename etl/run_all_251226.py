@@ -6,6 +6,8 @@ import re
 
 import pymysql
 
+from run_all import etl_lock, finish_outputs, write_json
+
 
 # =========================
 # helpers
@@ -35,13 +37,6 @@ def ensure_out_dir():
     return out_dir
 
 
-def write_json(out_dir, filename, payload):
-    path = os.path.join(out_dir, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
-    print("✅ wrote", path)
-
-
 def in_placeholders(n: int) -> str:
     return ",".join(["%s"] * n)
 
@@ -49,9 +44,7 @@ def in_placeholders(n: int) -> str:
 # =========================
 # main ETL
 # =========================
-def main():
-    print("### run_all.py 시작됨 ###")
-
+def run():
     cfg = load_config()
     db = cfg["db"]
 
@@ -418,6 +411,9 @@ def main():
             },
         )
 
+        # 항공사별 shard 다시 쪼갠 뒤 manifest 해시 갱신
+        #   (안 하면 app.js 가 지난 run_all 의 shard 나 같은 ?v= 주소의 옛 캐시를 계속 씀)
+        finish_outputs(out_dir, airlines)
 
         print("### run_all.py 끝까지 실행됨 ###")
 
@@ -425,5 +421,17 @@ def main():
         conn.close()
 
 
+def main():
+    print("### run_all.py 시작됨 ###")
+
+    # run_all.py / etl_daemon.py 와 같은 잠금 → web/data 를 동시에 쓰지 않음
+    #   (파일 쓰기도 run_all.write_json: 임시파일 + os.replace, 끝나면 manifest 갱신)
+    try:
+        with etl_lock():
+            run()
+    except BlockingIOError as e:
+        print("⏩", e)
+
+
 if __name__ == "__main__":
     main()
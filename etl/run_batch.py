@@ -0,0 +1,257 @@
+# run_batch.py
+# 목적: 고객사별 / 기간별 대시보드 여러 벌을 한 번에 만들기
+#   - 예전: config.json 을 복사해서 scope 마다 run_all.py 를 다시 실행 → 같은 원본 행을 scope 수만큼 스캔
+#   - 지금: 모든 scope 의 합집합(기간 / 항공사 / work_type)을 DB 에서 한 번만 받고,
+#           scope 마다 자기 몫의 행만 골라서 run_all.py 의 etl_section* 에 넘김 (data=)
+#   → DB 비용은 scope 수가 아니라 합집합 크기에 비례
+#
+# 실행(etl 폴더에서):
+#   python run_batch.py               # config.json 의 "batch" 사용
+#   python run_batch.py scopes.json   # 따로 둔 파일 사용 ({"scopes": [...]})
+#
+# scope 형식:
+#   "batch": {
+#     "scopes": [
+#       {"name": "HH_2025Q4", "airlines": ["HH"], "date_from": "2025-10-01", "date_to": "2025-12-31"},
+#       {"name": "all_recent", "airlines": ["HH", "RF", "8M"], "date_from": "2025-12-01", "date_to": "TODAY",
+#        "work_types": [10, 11], "out_dir": "../web/scopes/all_recent/data"}
+#     ]
+#   }
+#   work_types 가 없으면 config 의 work_types.cabin_cleaning
+#   out_dir 가 없으면 ../web/scopes/<name>/data (web/ 화면 파일 옆에 두고 data/ 로 서빙)
+# section2_process_timeseries / section3_worker_process_counts (run_all_251223.py) 는 만들지 않음
+
+import json
+import os
+import sys
+from decimal import ROUND_HALF_UP, Decimal
+
+import run_all
+from run_all import (
+    MANIFEST_ENTRIES,
+    ROW_AIRLINE_COL,
+    assert_cfg,
+    connect_db,
+    etl_lock,
+    etl_section1,
+    etl_section2,
+    etl_section3_speed,
+    fetch_section1,
+    fetch_section2,
+    fetch_section3_speed,
+    finish_outputs,
+    load_config,
+    today_yyyymmdd,
+    yyyymmdd_from_dash,
+)
+
+
+# =========================
+# scope 읽기
+# =========================
+def load_scopes(cfg: dict, path: str = None) -> list:
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f).get("scopes", [])
+    else:
+        raw = cfg.get("batch", {}).get("scopes", [])
+    if not raw:
+        raise ValueError("scope 가 없습니다: config.json 의 batch.scopes 또는 scopes.json 의 scopes")
+
+    default_wt = cfg["work_types"]["cabin_cleaning"]
+    scopes = []
+    names = set()
+    for i, s in enumerate(raw):
+        for key in ("name", "airlines", "date_from", "date_to"):
+            if key not in s:
+                raise ValueError(f"scope #{i + 1}: {key} 누락")
+        if s["name"] in names:
+            raise ValueError(f"scope 이름 중복: {s['name']}")
+        names.add(s["name"])
+        if not isinstance(s["airlines"], list) or not s["airlines"]:
+            raise ValueError(f"scope {s['name']}: airlines 는 1개 이상 list 여야 합니다.")
+
+        date_from = yyyymmdd_from_dash(s["date_from"])
+        date_to = today_yyyymmdd() if s["date_to"] == "TODAY" else yyyymmdd_from_dash(s["date_to"])
+        if date_from > date_to:
+            raise ValueError(f"scope {s['name']}: date_from 이 date_to 보다 뒤입니다.")
+
+        scopes.append(
+            {
+                "name": s["name"],
+                "airlines": list(s["airlines"]),
+                "date_from": date_from,
+                "date_to": date_to,
+                "work_types": sorted(set(s.get("work_types") or default_wt)),
+                "out_dir": s.get("out_dir") or os.path.join("..", "web", "scopes", s["name"], "data"),
+            }
+        )
+    return scopes
+
+
+def union_extracts(scopes: list) -> list:
+    """
+    겹치는 기간끼리 묶어서 DB 에서 받을 구간 목록
+      [{"date_from", "date_to", "airlines", "work_types"}]
+    (1월 scope 와 6월 scope 처럼 떨어져 있으면 사이 기간은 받지 않음)
+    """
+    out = []
+    for s in sorted(scopes, key=lambda s: s["date_from"]):
+        last = out[-1] if out else None
+        if last and s["date_from"] <= last["date_to"] + 1:
+            last["date_to"] = max(last["date_to"], s["date_to"])
+            last["airlines"] |= set(s["airlines"])
+            last["work_types"] |= set(s["work_types"])
+        else:
+            out.append(
+                {
+                    "date_from": s["date_from"],
+                    "date_to": s["date_to"],
+                    "airlines": set(s["airlines"]),
+                    "work_types": set(s["work_types"]),
+                }
+            )
+    return out
+
+
+def with_work_types(cfg: dict, work_types) -> dict:
+    return {**cfg, "work_types": {**cfg["work_types"], "cabin_cleaning": sorted(work_types)}}
+
+
+# =========================
+# 합집합 한 번 받기
+# =========================
+def extract_union(conn, cfg: dict, scopes: list) -> dict:
+    """
+    return: {"counts"/"saved"/"ts"/"speed": {yyyymmdd: [rows]}}
+      ts / speed 는 by_work_type 행 (scope 별 work_type 으로 나누기 위해)
+    """
+    data = {"counts": {}, "saved": {}, "ts": {}, "speed": {}}
+    for ext in union_extracts(scopes):
+        airlines = sorted(ext["airlines"])
+        ucfg = with_work_types(cfg, ext["work_types"])
+        print(
+            f"📥 {ext['date_from']}~{ext['date_to']} 항공사 {','.join(airlines)} "
+            f"work_type {sorted(ext['work_types'])}"
+        )
+        parts = {}
+        parts.update(fetch_section1(conn, ucfg, ext["date_from"], ext["date_to"], airlines))
+        parts.update(fetch_section2(conn, ucfg, ext["date_from"], ext["date_to"], airlines, by_work_type=True))
+        parts.update(fetch_section3_speed(conn, ucfg, ext["date_from"], ext["date_to"], airlines, by_work_type=True))
+        for part, by_day in parts.items():
+            data[part].update(by_day)  # 구간끼리 날짜가 안 겹침
+    return data
+
+
+# =========================
+# scope 별로 나누기
+# =========================
+def pick_rows(by_day: dict, part: str, scope: dict) -> dict:
+    # scope 기간 + 항공사 행만 (빈 날짜는 뺌)
+    col = ROW_AIRLINE_COL[part]
+    airlines = set(scope["airlines"])
+    out = {}
+    for d, rs in by_day.items():
+        if not scope["date_from"] <= d <= scope["date_to"]:
+            continue
+        picked = [r for r in rs if r[col] in airlines]
+        if picked:
+            out[d] = picked
+    return out
+
+
+def combine_ts(rows: list, work_types: set) -> list:
+    """
+    (airline, aircraft, d, n, avg, min, max, work_type, sum_sec) 를 scope 의 work_type 만 골라
+    fetch_section2 기본 행 (airline, aircraft, d, n, avg, min, max) 로 다시 합침
+      avg = ROUND(sum_sec / n, 1) (MySQL ROUND 처럼 반올림)
+    """
+    acc = {}
+    for a, ac, d, n, avg, mn, mx, wt, sum_sec in rows:
+        if wt not in work_types:
+            continue
+        key = (a, ac, d)
+        cur = acc.get(key)
+        if cur is None:
+            acc[key] = [int(n), Decimal(sum_sec), mn, mx]
+        else:
+            cur[0] += int(n)
+            cur[1] += Decimal(sum_sec)
+            cur[2] = min(cur[2], mn)
+            cur[3] = max(cur[3], mx)
+    return [
+        (a, ac, d, n, (s / n).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP), mn, mx)
+        for (a, ac, d), (n, s, mn, mx) in acc.items()
+    ]
+
+
+def scope_data(data: dict, scope: dict) -> dict:
+    # etl_section* 에 넘길 data= (fetch_section* 기본 행 모양)
+    work_types = set(scope["work_types"])
+
+    ts = {}
+    for d, rs in pick_rows(data["ts"], "ts", scope).items():
+        combined = combine_ts(rs, work_types)
+        if combined:
+            ts[d] = combined
+
+    speed = {}
+    for d, rs in pick_rows(data["speed"], "speed", scope).items():
+        kept = [r[:-1] for r in rs if r[-1] in work_types]
+        if kept:
+            speed[d] = kept
+
+    return {
+        "section1": {"counts": pick_rows(data["counts"], "counts", scope), "saved": pick_rows(data["saved"], "saved", scope)},
+        "section2": {"ts": ts},
+        "section3_speed": {"speed": speed},
+    }
+
+
+def build_scope(conn, cfg: dict, scope: dict, data: dict) -> None:
+    scfg = with_work_types(cfg, scope["work_types"])
+    scfg["scope"] = {**cfg["scope"], "airlines": scope["airlines"]}
+    out_dir = scope["out_dir"]
+    os.makedirs(out_dir, exist_ok=True)
+
+    # manifest 항목은 scope(폴더)마다 따로
+    MANIFEST_ENTRIES.clear()
+
+    sdata = scope_data(data, scope)
+    args = (conn, scfg, scope["date_from"], scope["date_to"], out_dir, scope["airlines"])
+    etl_section1(*args, data=sdata["section1"])
+    etl_section2(*args, data=sdata["section2"])
+    etl_section3_speed(*args, data=sdata["section3_speed"])
+    finish_outputs(out_dir, scope["airlines"])
+
+
+# =========================
+# main
+# =========================
+def main():
+    print("### run_batch.py 시작됨 ###")
+
+    cfg = load_config()
+    assert_cfg(cfg)
+    scopes = load_scopes(cfg, sys.argv[1] if len(sys.argv) > 1 else None)
+
+    # work_type 매핑 / 표준시간은 scope 마다 다시 읽지 않음
+    run_all.DIM_CACHE_TTL_SEC = float("inf")
+
+    conn = connect_db(cfg)
+    try:
+        with etl_lock():
+            data = extract_union(conn, cfg, scopes)
+            for scope in scopes:
+                print(f"### scope {scope['name']} → {scope['out_dir']}")
+                build_scope(conn, cfg, scope, data)
+
+        print(f"### run_batch.py 끝까지 실행됨 (scope {len(scopes)}개) ###")
+    except BlockingIOError as e:
+        print("⏩", e)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# sampling.py
+# 목적: 기간이 길어져도 section1_saved_points.json 크기를 일정하게 (항공사별 점 개수 상한)
+#   - 항공사 안에서 (기종, 날짜) 칸(stratum)마다 크기에 비례해 몫을 나누고,
+#     칸마다 reservoir sampling(Algorithm R)으로 몫만큼만 남김
+#     → 특정 기종 / 특정 날짜에 점이 몰리지 않고 원래 분포 모양이 유지됨
+#   - 몫이 칸 수보다 넉넉하면 모든 칸이 최소 1점은 가짐 (드문 기종도 상자 그림에 보임)
+#   - 난수는 seed(항공사 이름 포함)로 고정 → 같은 데이터면 같은 결과 (write_json 이 안 바뀐 파일을 건너뜀)
+#   - 통계(n / 평균 / 최소 / 최대)는 여기서 건드리지 않음 → section1_saved_stats.json 은 항상 전체 기준
+# 사용: run_all.etl_section1 ("etl": {"saved_points_per_airline": 3000}, 0 또는 없으면 전체)
+
+import random
+from collections import Counter
+
+
+def allocate(sizes: dict, budget: int, rng: random.Random) -> dict:
+    """
+    sizes: stratum -> 점 개수 / budget: 남길 총 개수
+    return: stratum -> 남길 개수 (합 = min(budget, 전체))
+      칸 수 <= budget: 칸마다 1개 먼저, 나머지는 (크기 - 1) 에 비례
+      칸 수 >  budget: 크기에 비례 (작은 칸은 0개일 수 있음)
+      비례 몫의 나머지는 큰 나머지 순 (같으면 rng 순서)
+    """
+    total = sum(sizes.values())
+    if total <= budget:
+        return dict(sizes)
+
+    base = {k: 0 for k in sizes}
+    weight = dict(sizes)
+    left = budget
+    if len(sizes) <= budget:
+        base = {k: 1 for k in sizes}
+        weight = {k: c - 1 for k, c in sizes.items()}
+        left = budget - len(sizes)
+
+    w_sum = sum(weight.values())
+    quota = {}
+    rems = []
+    for k, w in weight.items():
+        q, r = divmod(left * w, w_sum) if w_sum else (0, 0)
+        quota[k] = base[k] + q
+        rems.append((r, rng.random(), k))
+    short = budget - sum(quota.values())
+    for _, _, k in sorted(rems, key=lambda t: (-t[0], t[1]))[:short]:
+        quota[k] += 1
+    return quota
+
+
+def stratified_reservoir(items, strata: list, budget: int, seed=0) -> list:
+    """
+    items[i] 의 stratum 이 strata[i] (같은 길이)
+    return: 남긴 item 의 위치 목록 (원래 순서)
+    """
+    rng = random.Random(seed)
+    quota = allocate(Counter(strata), budget, rng)
+
+    # stratum -> [본 개수, 남긴 위치들]
+    res = {}
+    for i, k in enumerate(strata):
+        cap = quota[k]
+        if cap == 0:
+            continue
+        slot = res.get(k)
+        if slot is None:
+            slot = res[k] = [0, []]
+        slot[0] += 1
+        if len(slot[1]) < cap:
+            slot[1].append(i)
+        else:
+            j = rng.randrange(slot[0])
+            if j < cap:
+                slot[1][j] = i
+    return sorted(i for _, kept in res.values() for i in kept)
+
+
+def sample_points(points: list, strata: list, per_airline: int, seed: str = "saved_points"):
+    """
+    points: [{"airline", "saved_sec"}] / strata: points 와 같은 순서의 (기종, 날짜)
+    return: (남긴 points, {항공사: {"n": 전체, "kept": 남김}})
+      항공사 사이 순서와 항공사 안의 원래 순서는 그대로
+    """
+    by_air = {}
+    for i, p in enumerate(points):
+        by_air.setdefault(p["airline"], []).append(i)
+
+    keep = []
+    info = {}
+    for airline, idx in by_air.items():
+        picked = stratified_reservoir(idx, [strata[i] for i in idx], per_airline, seed=f"{seed}|{airline}")
+        keep.extend(idx[j] for j in picked)
+        info[airline] = {"n": len(idx), "kept": len(picked)}
+    keep.sort()
+    return [points[i] for i in keep], info
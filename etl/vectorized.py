@@ -0,0 +1,216 @@
+# vectorized.py
+# 목적: Section1 절감시간 / Section3 속도 요약을 NumPy 배열 연산으로 계산 (선택 경로)
+#   - numpy 가 없으면 HAS_NUMPY=False → run_all.py 는 기존 파이썬 루프(compact.py)를 사용
+#   - 결과 JSON 은 파이썬 경로와 같게 만든다 (합계는 bincount = 행 순서대로 더함)
+# 벤치마크: python bench_vectorized.py  (100만 행 합성 데이터)
+
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:  # numpy 는 선택 의존성
+    np = None
+
+from compact import num_out
+
+HAS_NUMPY = np is not None
+
+
+# =========================
+# 공통: 그룹 코드 / 그룹 분위수
+# =========================
+def first_seen_codes(values):
+    """
+    values(ndarray) -> (codes, uniques, firsts)
+      - uniques 는 "처음 나온 순서" (DimCodes 와 같은 코드 순서)
+      - firsts[c]: 코드 c 가 처음 나온 행 index
+    """
+    uniq, first, inv = np.unique(values, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty(len(uniq), dtype=np.int64)
+    rank[order] = np.arange(len(uniq))
+    return rank[inv.ravel()], uniq[order], first[order]
+
+
+def dict_codes(values, n: int):
+    # 파이썬 값(문자열/None) 반복자 -> (int64 코드 배열, 코드 -> 값 목록)
+    index = {}
+    put = index.setdefault
+    codes = np.fromiter((put(v, len(index)) for v in values), dtype=np.int64, count=n)
+    return codes, list(index)
+
+
+def group_quantile(sorted_vals, starts, counts, q: float):
+    """
+    그룹별로 정렬된 값(sorted_vals)에서 선형 보간 분위수 (compact.quantile 과 같은 식)
+      starts[g]: 그룹 g 의 시작 위치, counts[g]: 개수
+    """
+    pos = (counts - 1) * q
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, counts - 1)
+    lo_v = sorted_vals[starts + lo]
+    hi_v = sorted_vals[starts + hi]
+    return lo_v + (hi_v - lo_v) * (pos - lo)
+
+
+def group_bounds(sorted_codes, n_groups: int):
+    # 그룹 코드 오름차순으로 정렬된 배열에서 그룹별 시작 위치 / 개수
+    counts = np.bincount(sorted_codes, minlength=n_groups)
+    starts = np.zeros(n_groups, dtype=np.int64)
+    np.cumsum(counts[:-1], out=starts[1:])
+    return starts, counts
+
+
+# =========================
+# Section1: 절감시간 points / stats
+# =========================
+def section1_saved_np(rows, allowed_work_ids, standard_map: dict, default_standard_sec):
+    """
+    rows: (work_id, airline, aircraft, actual_sec) 튜플 목록 (DB fetchall 그대로)
+    return: (points, stats) — section1_saved_points / section1_saved_stats 의 리스트
+    """
+    if not rows:
+        return [], []
+
+    # 튜플 목록 -> 열 (zip(*rows) 는 행이 많으면 느려서 열마다 itemgetter)
+    n_rows = len(rows)
+    work_id = np.fromiter(map(itemgetter(0), rows), dtype=np.int64, count=n_rows)
+    actual = np.fromiter(map(itemgetter(3), rows), dtype=np.float64, count=n_rows)
+    keep = np.isin(work_id, np.fromiter(allowed_work_ids, dtype=np.int64))
+    if not keep.any():
+        return [], []
+    actual = actual[keep]
+
+    # 문자열 -> 정수 코드 (dict 한 번), 코드 순서는 "남은 행에서 처음 나온 순서"로 다시 매김
+    raw_air, air_names = dict_codes(map(itemgetter(1), rows), n_rows)
+    raw_craft, craft_names = dict_codes(map(itemgetter(2), rows), n_rows)
+    a_code, a_raw, _ = first_seen_codes(raw_air[keep])
+    c_code, c_raw, _ = first_seen_codes(raw_craft[keep])
+    air_values = [air_names[c] for c in a_raw.tolist()]
+    craft_values = [craft_names[c] for c in c_raw.tolist()]
+
+    # 표준시간: (항공사, 기종) 조합당 한 번만 dict 조회 (None 기종도 기존 f"{airline}|{aircraft}" 와 같은 key)
+    n_craft = len(craft_values)
+    pairs, pair_inv = np.unique(a_code * n_craft + c_code, return_inverse=True)
+    std_of_pair = np.array(
+        [
+            standard_map.get(f"{air_values[p // n_craft]}|{craft_values[p % n_craft]}", default_standard_sec)
+            for p in pairs.tolist()
+        ],
+        dtype=np.float64,
+    )
+    saved = std_of_pair[pair_inv.ravel()] - actual
+
+    # 항공사별 n / sum / min / max
+    n_air = len(air_values)
+    n = np.bincount(a_code, minlength=n_air)
+    s_sum = np.bincount(a_code, weights=saved, minlength=n_air)
+
+    order = np.argsort(a_code, kind="stable")
+    starts, _ = group_bounds(a_code[order], n_air)
+    s_min = np.minimum.reduceat(saved[order], starts)
+    s_max = np.maximum.reduceat(saved[order], starts)
+
+    row_air = np.array(air_values, dtype=object)[a_code].tolist()
+    points = [{"airline": a, "saved_sec": v} for a, v in zip(row_air, saved.tolist())]
+    stats = [
+        {
+            "code": air_values[a],
+            "n": int(n[a]),
+            "avg_saved_sec": float(s_sum[a]) / int(n[a]),
+            "min_saved_sec": num_out(float(s_min[a])),
+            "max_saved_sec": num_out(float(s_max[a])),
+        }
+        for a in range(n_air)
+    ]
+    return points, stats
+
+
+# =========================
+# Section3: 속도 요약 (SpeedTable 열을 그대로 사용)
+# =========================
+def speed_summary_np(table, sample_n: int = 3) -> list:
+    """
+    compact.SpeedTable.summarize() 와 같은 결과를 배열 연산으로
+      - table 의 array 열은 np.frombuffer 로 복사 없이 읽음
+    """
+    if len(table) == 0:
+        return []
+
+    air = np.frombuffer(table.c_airline, dtype=np.uint8).astype(np.int64)
+    role = np.frombuffer(table.c_role, dtype=np.uint16).astype(np.int64)
+    member = np.frombuffer(table.c_member, dtype=np.uint32).astype(np.int64)
+    title = np.frombuffer(table.c_title, dtype=np.uint32).astype(np.int64)
+    time_sec = np.frombuffer(table.time_sec, dtype=np.int64)
+
+    # role 코드 -> (process, zone) 코드
+    pz_codes = {}
+    role_to_pz = np.array([pz_codes.setdefault(pz, len(pz_codes)) for pz in table.role_pz], dtype=np.int64)
+    pz_values = list(pz_codes)
+    pz = role_to_pz[role]
+
+    n_pz = len(pz_values)
+    n_mem = len(table.members)
+    group_key = (air * n_pz + pz) * n_mem + member
+    g, _, first_row = first_seen_codes(group_key)  # 그룹 번호 = 처음 나온 순서
+    n_groups = len(first_row)
+
+    # 그룹 안에서 time_sec 오름차순 → 분위수
+    #   (g, time_sec) 두 열 정렬 대신 하나의 int64 key 로 정렬 (lexsort 보다 빠름)
+    t_min = int(time_sec.min())
+    t_span = int(time_sec.max()) - t_min + 1
+    order = np.argsort(g * t_span + (time_sec - t_min))
+    starts, counts = group_bounds(g[order], n_groups)
+    ts_sorted = time_sec[order].astype(np.float64)
+    sums = np.bincount(g, weights=time_sec, minlength=n_groups)
+    median = group_quantile(ts_sorted, starts, counts, 0.5)
+    p90 = group_quantile(ts_sorted, starts, counts, 0.9)
+
+    # sample_flights: 그룹별 서로 다른 편명을 처음 나온 순서대로 sample_n개
+    n_titles = len(table.titles)
+    gt, gt_first = np.unique(g * n_titles + title, return_index=True)
+    gt_order = np.argsort((gt // n_titles) * len(g) + gt_first)
+    gt_group = (gt // n_titles)[gt_order]
+    gt_title = (gt % n_titles)[gt_order]
+    gt_starts, _ = group_bounds(gt_group, n_groups)
+    rank = np.arange(len(gt_group)) - gt_starts[gt_group]
+    pick = rank < sample_n
+    flights = [[] for _ in range(n_groups)]
+    for gg, t in zip(gt_group[pick].tolist(), gt_title[pick].tolist()):
+        flights[gg].append(table.titles.values[t])
+
+    # dict 는 여기서만 (그룹 수만큼)
+    out = []
+    counts_l = counts.tolist()
+    sums_l = sums.tolist()
+    median_l = median.tolist()
+    p90_l = p90.tolist()
+    for k, i in enumerate(first_row.tolist()):
+        process, zone = pz_values[pz[i]]
+        m = table.c_member[i]
+        user_id, name = table.member_info[m]
+        total = sums_l[k]
+        out.append(
+            {
+                "airline": table.airlines.values[table.c_airline[i]],
+                "process": process,
+                "zone": zone,
+                "member_srl": table.members.values[m],
+                "member_user_id": user_id,
+                "member_name": name,
+                "count": counts_l[k],
+                "sum_sec": int(total),
+                "mean_sec": round(total / counts_l[k], 1),
+                "median_sec": round(median_l[k], 1),
+                "p90_sec": round(p90_l[k], 1),
+                "sample": {
+                    "date": table.dates.values[table.c_date[i]],
+                    "flight_title": table.titles.values[table.c_title[i]],
+                    "time_sec": table.time_sec[i],
+                },
+                "sample_flights": flights[k],
+            }
+        )
+
+    out.sort(key=lambda r: (r["airline"], r["process"], r["zone"], r["mean_sec"]))
+    return out
@@ -14,10 +14,34 @@ const AIRLINE_COLOR = {
 // ================================
 // Utils (shared helpers)
 // ================================
-async function loadJson(path) {
-  const res = await fetch(path);
+/** ETL이 만든 data/manifest.json (파일별 sha256/size/generated_at) */
+const MANIFEST_PATH = "data/manifest.json";
+let manifestPromise = null;
+
+function loadManifest() {
+  // manifest는 항상 서버에 재확인 (작은 파일), 실패하면 null → 기존 방식으로 fetch
+  if (!manifestPromise) {
+    manifestPromise = fetch(MANIFEST_PATH, { cache: "no-cache" })
+      .then((res) => (res.ok ? res.json() : null))
+      .catch(() => null);
+  }
+  return manifestPromise;
+}
+
+/** 응답 본문(문자열)까지만 받음, JSON.parse 는 loadJsonTimed 에서 따로 재서 기록 */
+async function loadJsonText(path) {
+  const manifest = await loadManifest();
+  const filename = path.split("/").pop();
+  const entry = manifest?.files?.[filename];
+
+  // 해시를 쿼리로 붙이면 내용이 바뀐 파일만 새로 받고, 나머지는 브라우저 캐시 사용
+  const res = entry
+    ? await fetch(`${path}?v=${entry.sha256.slice(0, 16)}`, {
+        cache: "force-cache",
+      })
+    : await fetch(path);
   if (!res.ok) throw new Error(`Failed to load ${path}`);
-  return await res.json();
+  return await res.text();
 }
 
 function setDefaultDateToToday() {
@@ -31,30 +55,211 @@ function setDefaultDateToToday() {
   el.value = `${yyyy}-${mm}-${dd}`;
 }
 
-function yyyymmddToISO(yyyymmdd) {
-  const s = String(yyyymmdd);
-  return `${s.slice(0, 4)}-${s.slice(4, 6)}-${s.slice(6, 8)}`;
+// yyyymmddToISO / fmtMin / escapeHtml / secToMMSS 는 shaping.js
+
+// ================================
+// Per-airline shards (탭을 처음 열 때만 fetch, 이후 메모리 캐시)
+// ================================
+/** ETL이 항공사별로 나눠 쓰는 파일 (data/<base>.<airline>.json) */
+const SHARD_BASES = {
+  s2Ts: "section2_aircraft_timeseries",
+  s2Proc: "section2_process_timeseries",
+  s3Counts: "section3_worker_process_counts",
+  s3Speed: "section3_speed_rows",
+  s3SpeedDict: "section3_speed_rows_dict",
+  s3Summary: "section3_speed_summary",
+};
+
+const shardCache = new Map(); // "base|airline" 또는 "base" -> Promise<payload>
+
+function cachedLoad(key, load) {
+  if (!shardCache.has(key)) {
+    const p = load();
+    shardCache.set(key, p);
+    p.catch(() => shardCache.delete(key)); // 실패는 캐시하지 않음 (다음 탭 클릭 때 재시도)
+  }
+  return shardCache.get(key);
 }
 
-function fmtMin(sec) {
-  return `${(sec / 60).toFixed(1)}분`;
+// decodeDictRows / pickAirline (shard payload 변환) 은 shaping.js
+
+function loadAirlineShard(base, airline) {
+  return cachedLoad(`${base}|${airline}`, () =>
+    loadJsonTimed(`data/${base}.${airline}.json`).catch(() =>
+      // shard가 없으면(예전 ETL 결과) 전체 파일을 한 번만 받아서 잘라 씀
+      cachedLoad(base, () => loadJsonTimed(`data/${base}.json`)).then(
+        (full) => pickAirline(full, airline)
+      )
+    )
+  );
 }
 
-function escapeHtml(s) {
-  return String(s)
-    .replaceAll("&", "&amp;")
-    .replaceAll("<", "&lt;")
-    .replaceAll(">", "&gt;")
-    .replaceAll('"', "&quot;")
-    .replaceAll("'", "&#039;");
+// ================================
+// Chart pool (카드/차트 재사용)
+// ================================
+/**
+ * 컨테이너 안의 카드+차트를 key로 재사용한다.
+ * - 탭 전환 시 같은 key의 차트는 Plotly.react로 내용만 바꿈 (새로 만들지 않음)
+ * - 이번 그리기에서 안 쓴 카드는 Plotly.purge 후 제거
+ *
+ * 사용: pool.begin() → pool.card(key, title) 반복 → pool.end()
+ */
+function createChartPool(
+  containerEl,
+  { idPrefix, cardMinHeight, onRemove } = {}
+) {
+  const entries = new Map(); // key -> { card, titleEl, chartEl }
+  let nextId = 0; // 차트 div id 발급용 (key가 한글이어도 겹치지 않게)
+  let used = new Set();
+  let order = [];
+
+  function removeEntry(key) {
+    const e = entries.get(key);
+    if (!e) return;
+    if (onRemove) onRemove(e.chartEl);
+    Plotly.purge(e.chartEl);
+    e.card.remove();
+    entries.delete(key);
+  }
+
+  return {
+    begin() {
+      used = new Set();
+      order = [];
+    },
+
+    /** key에 해당하는 카드를 가져오거나 새로 만든다. 반환: 차트 div */
+    card(key, titleText) {
+      let e = entries.get(key);
+      if (!e) {
+        const card = document.createElement("div");
+        card.className = "card";
+        if (cardMinHeight) card.style.minHeight = cardMinHeight;
+
+        const titleEl = document.createElement("div");
+        titleEl.className = "cardTitle";
+        card.appendChild(titleEl);
+
+        const chartEl = document.createElement("div");
+        chartEl.id = `${idPrefix}_${nextId++}`;
+        chartEl.className = "chart";
+        card.appendChild(chartEl);
+
+        e = { card, titleEl, chartEl };
+        entries.set(key, e);
+      }
+      if (e.titleEl.textContent !== titleText) e.titleEl.textContent = titleText;
+
+      used.add(key);
+      order.push(e.card);
+      return e.chartEl;
+    },
+
+    end() {
+      Array.from(entries.keys())
+        .filter((key) => !used.has(key))
+        .forEach(removeEntry);
+
+      // 풀 밖의 내용(데이터 없음 카드 등) 제거
+      const poolCards = new Set(order);
+      Array.from(containerEl.children)
+        .filter((el) => !poolCards.has(el))
+        .forEach((el) => el.remove());
+
+      // 순서 맞추기 (이미 제자리면 DOM 이동 없음)
+      order.forEach((card, i) => {
+        if (containerEl.children[i] !== card) {
+          containerEl.insertBefore(card, containerEl.children[i] || null);
+        }
+      });
+    },
+
+    /** 모든 카드 제거 (빈 상태 메시지 표시 전에 사용) */
+    clear() {
+      Array.from(entries.keys()).forEach(removeEntry);
+    },
+  };
 }
 
-function secToMMSS(sec) {
-  if (sec == null || isNaN(sec)) return "-";
-  sec = Math.round(sec);
-  const m = Math.floor(sec / 60);
-  const s = sec % 60;
-  return `${m}분 ${String(s).padStart(2, "0")}초`;
+// ================================
+// Lazy charts (화면에 보일 때만 Plotly 생성)
+// ================================
+/**
+ * IntersectionObserver로 차트 div가 화면 근처에 올 때만 render를 호출한다.
+ * - 화면 밖으로 나가서 releaseAfterMs 동안 안 돌아오면 Plotly.purge로 메모리 반환
+ * - 다시 보이면 마지막으로 등록된 render로 다시 그림
+ * - IntersectionObserver가 없는 브라우저는 바로 그림
+ */
+function createLazyCharts({ rootMargin = "200px 0px", releaseAfterMs = 30000 } = {}) {
+  const state = new Map(); // el -> { render, visible, rendered, dirty, timer }
+
+  function draw(el, st) {
+    st.render(el);
+    st.rendered = true;
+    st.dirty = false;
+  }
+
+  function release(el, st) {
+    st.timer = null;
+    if (!st.rendered) return;
+    Plotly.purge(el);
+    st.rendered = false;
+  }
+
+  const io =
+    "IntersectionObserver" in window
+      ? new IntersectionObserver(
+          (entries) => {
+            entries.forEach((entry) => {
+              const el = entry.target;
+              const st = state.get(el);
+              if (!st) return;
+
+              st.visible = entry.isIntersecting;
+              if (st.visible) {
+                clearTimeout(st.timer);
+                st.timer = null;
+                if (!st.rendered || st.dirty) draw(el, st);
+              } else if (st.rendered && !st.timer) {
+                st.timer = setTimeout(() => release(el, st), releaseAfterMs);
+              }
+            });
+          },
+          { rootMargin }
+        )
+      : null;
+
+  return {
+    /** el에 그릴 함수를 등록 (이미 등록된 el이면 render만 교체) */
+    observe(el, render) {
+      if (!io) {
+        render(el);
+        return;
+      }
+
+      let st = state.get(el);
+      if (!st) {
+        st = { render, visible: false, rendered: false, dirty: false, timer: null };
+        state.set(el, st);
+        el.classList.add("lazyChart");
+        io.observe(el);
+        return;
+      }
+
+      st.render = render;
+      // 보이는 중이면 바로 갱신, 아니면 다음에 보일 때 갱신
+      if (st.visible) draw(el, st);
+      else st.dirty = true;
+    },
+
+    unobserve(el) {
+      const st = state.get(el);
+      if (!st) return;
+      clearTimeout(st.timer);
+      state.delete(el);
+      if (io) io.unobserve(el);
+    },
+  };
 }
 
 // ================================
@@ -91,7 +296,8 @@ function renderDonutCounts(data) {
     font: { size: 13, color: "#253036" },
   };
 
-  Plotly.newPlot("s1_chart_counts", [trace], layout, {
+  // react: 처음엔 새로 그리고, 실시간 갱신 때는 바뀐 값만 반영
+  plotTimed("S1 counts", "s1_chart_counts", [trace], layout, {
     responsive: true,
     displayModeBar: false,
   });
@@ -101,17 +307,17 @@ function renderDonutCounts(data) {
 // Section 1-2: 항공사 요약 (절감 시간)
 // ================================
 function renderSavedBox(pointsData, statsData) {
-  const points = pointsData.points;
+  // ETL 에서 점 개수 상한을 켰으면 points 는 (기종, 날짜) 층화 표본, n/평균은 stats(전체) 기준
+  const sampling = pointsData.sampling;
 
-  const traces = AIRLINE_ORDER.map((code) => {
-    const y = points
-      .filter((p) => p.airline === code)
-      .map((p) => p.saved_sec / 60); // 분
+  // 항공사별 절감시간(분) (points 한 번만 훑음)
+  const byAirline = savedMinutesByAirline(pointsData.points, AIRLINE_ORDER);
 
+  const traces = AIRLINE_ORDER.map((code) => {
     return {
       type: "box",
       name: code,
-      y,
+      y: byAirline.get(code),
       marker: { color: AIRLINE_COLOR[code] || "#B2C6D3" },
       line: { color: AIRLINE_COLOR[code] || "#B2C6D3" },
       boxpoints: "all",
@@ -122,17 +328,18 @@ function renderSavedBox(pointsData, statsData) {
   });
 
   // 요약 문구 순서 고정
-  const statsMap = new Map(statsData.stats.map((s) => [s.code, s]));
-  const statsLine = AIRLINE_ORDER.filter((code) => statsMap.has(code))
-    .map((code) => {
-      const s = statsMap.get(code);
-      return `${code}: 평균 ${fmtMin(s.avg_saved_sec)} (n=${s.n})`;
-    })
-    .join(" · ");
+  const statsLine = savedStatsLine(statsData.stats, AIRLINE_ORDER);
+
+  const sampled =
+    sampling &&
+    Object.values(sampling.airlines || {}).some((a) => a.kept < a.n);
+  const sampleNote = sampled
+    ? ` (점: 항공사별 최대 ${sampling.per_airline}개 표본)`
+    : "";
 
   document.getElementById(
     "s1_chart2_title"
-  ).textContent = `표준 대비 절감시간 분포 (분) — ${statsLine}`;
+  ).textContent = `표준 대비 절감시간 분포 (분) — ${statsLine}${sampleNote}`;
 
   const layout = {
     margin: { t: 10, l: 50, r: 10, b: 40 },
@@ -143,7 +350,7 @@ function renderSavedBox(pointsData, statsData) {
     font: { size: 13, color: "#253036" },
   };
 
-  Plotly.newPlot("s1_chart_saved", traces, layout, {
+  plotTimed("S1 saved", "s1_chart_saved", traces, layout, {
     responsive: true,
     displayModeBar: false,
   });
@@ -152,13 +359,13 @@ function renderSavedBox(pointsData, statsData) {
 // ================================
 // Section 2: 항공기/공정 타임시리즈 탭/카드/레이아웃
 // ================================
-function renderSection2(listJson, tsJson, procJson) {
+function renderSection2(listJson) {
   const tabsEl = document.getElementById("s2_tabs");
   const cardsEl = document.getElementById("s2_cards");
 
   if (!tabsEl || !cardsEl) return;
 
-  const airlines = listJson.airlines || ["HH", "RF", "8M"];
+  let airlines = listJson.airlines || ["HH", "RF", "8M"];
   let active = airlines[0];
 
   function drawTabs() {
@@ -170,104 +377,103 @@ function renderSection2(listJson, tsJson, procJson) {
       btn.onclick = () => {
         active = code;
         drawTabs();
-        drawCards();
+        timed("tab Section 2", drawCards).catch((err) => console.error("[Section 2]", err));
       };
       tabsEl.appendChild(btn);
     });
   }
 
-  function drawCards() {
-    cardsEl.innerHTML = "";
+  // 카드는 바로 만들고, 차트는 화면에 보일 때 생성 (항공기 수가 많아도 초기 비용 일정)
+  const lazy = createLazyCharts();
+  const pool = createChartPool(cardsEl, {
+    idPrefix: "s2_chart",
+    onRemove: (el) => lazy.unobserve(el),
+  });
 
-    const aircrafts = listJson.aircraft_by_airline?.[active] || [];
+  async function drawCards() {
+    const airline = active;
+    const aircrafts = listJson.aircraft_by_airline?.[airline] || [];
     if (aircrafts.length === 0) {
+      pool.clear();
       cardsEl.innerHTML = `<div class="card"><div class="cardTitle">데이터 없음</div></div>`;
       return;
     }
 
-    aircrafts.forEach((a, idx) => {
-      const card = document.createElement("div");
-      card.className = "card";
+    // 이 항공사의 시계열만 받음 (한 번 받으면 캐시)
+    const [tsJson, procJson] = await Promise.all([
+      loadAirlineShard(SHARD_BASES.s2Ts, airline),
+      loadAirlineShard(SHARD_BASES.s2Proc, airline).catch(() => null),
+    ]);
 
-      const title = document.createElement("div");
-      title.className = "cardTitle";
-      title.textContent = `${active} · 작업타입: ${a.aircraft} (n=${a.n})`;
+    // 받는 동안 다른 탭을 눌렀으면 버림
+    if (airline !== active) return;
 
-      card.appendChild(title);
+    pool.begin();
 
-      const div = document.createElement("div");
-      const chartId = `s2_chart_${active}_${a.aircraft}_${idx}`.replace(
-        /[^a-zA-Z0-9_]/g,
-        "_"
+    // 카드 key는 위치(슬롯) 기준 → 탭을 바꿔도 같은 슬롯의 차트를 재사용
+    aircrafts.forEach((a, idx) => {
+      const chartEl = pool.card(
+        `aircraft:${idx}`,
+        `${airline} · 작업타입: ${a.aircraft} (n=${a.n})`
       );
-      div.id = chartId;
-      div.className = "chart";
-      card.appendChild(div);
-
-      cardsEl.appendChild(card);
-
-      renderS2AircraftChart(chartId, active, a.aircraft, tsJson); // 2-1 그래프
+      lazy.observe(chartEl, (el) =>
+        renderS2AircraftChart(el, airline, a.aircraft, tsJson)
+      ); // 2-1 그래프
     });
 
     // 공정(소닉/라바/로보캅) 그래프 3개
     if (procJson && procJson.series) {
       const processes = ["소닉", "라바", "로보캅"];
 
-      processes.forEach((procName, pIdx) => {
-        const key = `${active}|${procName}`;
-        const rows = procJson.series?.[key] || [];
-
-        const card = document.createElement("div");
-        card.className = "card";
-
-        const title = document.createElement("div");
-        title.className = "cardTitle";
-        title.textContent = `${active} · 공정: ${procName}`;
-        card.appendChild(title);
-
-        const div = document.createElement("div");
-        const chartId = `s2_proc_${active}_${procName}_${pIdx}`.replace(
-          /[^a-zA-Z0-9_]/g,
-          "_"
-        );
-        div.id = chartId;
-        div.className = "chart";
-        card.appendChild(div);
-
-        cardsEl.appendChild(card);
-
-        renderS2ProcessChart(chartId, active, procName, procJson); //2-2 그래프
+      processes.forEach((procName) => {
+        const chartEl = pool.card(`proc:${procName}`, `${airline} · 공정: ${procName}`);
+        lazy.observe(chartEl, (el) =>
+          renderS2ProcessChart(el, airline, procName, procJson)
+        ); //2-2 그래프
       });
     }
+
+    pool.end();
   }
 
+  // 실시간 갱신: 목록을 바꾸고 지금 탭만 다시 그림 (같은 슬롯의 차트는 Plotly.react)
+  liveRedraw.set("Section 2", ([nextList]) => {
+    listJson = nextList;
+    airlines = listJson.airlines || ["HH", "RF", "8M"];
+    if (!airlines.includes(active)) active = airlines[0];
+    drawTabs();
+    return drawCards();
+  });
+
   drawTabs();
-  drawCards();
+  return drawCards();
+}
+
+// ================================
+// Section 2 확대/축소
+// ================================
+// 해상도 고르기(s2Resolution) / 시리즈 만들기(s2AircraftSeries, s2ProcessSeries) 는 shaping.js
+
+/** 확대/축소(plotly_relayout) → 보이는 구간으로 redraw(range) */
+function bindS2Zoom(el, redraw) {
+  // purge 후 다시 그리면 리스너가 사라지므로 그릴 때마다 새로 등록
+  el.removeAllListeners?.("plotly_relayout");
+  el.on?.("plotly_relayout", (ev) => {
+    if (ev["xaxis.autorange"]) redraw(null);
+    else if (ev["xaxis.range[0]"] != null)
+      redraw([String(ev["xaxis.range[0]"]), String(ev["xaxis.range[1]"])]);
+  });
 }
 
 // ================================
 // Section 2-1: 항공기 작업타입별 그래프
 // ================================
-function renderS2AircraftChart(elId, airline, aircraft, tsJson) {
+function renderS2AircraftChart(el, airline, aircraft, tsJson, range = null) {
   const key = `${airline}|${aircraft}`;
-  const rows = tsJson.series?.[key] || [];
-
-  const x = rows.map((r) => yyyymmddToISO(r.yyyymmdd));
-  const yBar = rows.map((r) => r.avg_actual_sec / 60); // 분
-  const barColors = rows.map((r) =>
-    r.avg_actual_sec > r.standard_sec ? "#E05A4F" : "#B2C6D3"
-  );
-
-  const stdSec = rows.length ? rows[0].standard_sec : null; // 초(고정)
-  const yStd = rows.map(() => (stdSec == null ? null : stdSec / 60)); // 분(선 그리기용)
-
-  const hover = rows.map(
-    (r) =>
-      `날짜: ${r.yyyymmdd}<br>` +
-      `평균: ${secToMMSS(r.avg_actual_sec)}<br>` +
-      `최단: ${secToMMSS(r.min_actual_sec)}<br>` +
-      `최장: ${secToMMSS(r.max_actual_sec)}<br>` +
-      `n=${r.n}<extra></extra>`
+  const { res, rows, x, yBar, barColors, stdSec, yStd, hover } = s2AircraftSeries(
+    tsJson,
+    key,
+    range
   );
 
   const bar = {
@@ -293,30 +499,37 @@ function renderS2AircraftChart(elId, airline, aircraft, tsJson) {
   const layout = {
     margin: { t: 10, l: 50, r: 10, b: 40 },
     barmode: "group",
+    uirevision: key, // 같은 series 를 다시 그릴 때 확대 상태 유지
     yaxis: { title: "시간(분)", gridcolor: "rgba(0,0,0,.06)" },
-    xaxis: { title: "날짜", gridcolor: "rgba(0,0,0,.04)" },
+    xaxis: {
+      title: `날짜 (${S2_RES_LABEL[res]})`,
+      gridcolor: "rgba(0,0,0,.04)",
+      ...(range ? { range } : {}),
+    },
     paper_bgcolor: "rgba(0,0,0,0)",
     plot_bgcolor: "rgba(0,0,0,0)",
     font: { size: 13, color: "#253036" },
   };
 
-  Plotly.newPlot(elId, [bar, line], layout, {
+  plotTimed("S2 aircraft", el, [bar, line], layout, {
     responsive: true,
     displayModeBar: false,
   });
+  bindS2Zoom(el, (r) => renderS2AircraftChart(el, airline, aircraft, tsJson, r));
 }
 
 // ================================
 // Section 2-2: 항공기 공정별 그래프
 // ================================
-function renderS2ProcessChart(elId, airline, processName, procJson) {
+function renderS2ProcessChart(el, airline, processName, procJson, range = null) {
   const key = `${airline}|${processName}`;
-  const rows = procJson.series?.[key] || [];
+  const { res, rows, x, y, colors, hover, avg } = s2ProcessSeries(procJson, key, range);
 
   if (rows.length === 0) {
     // 데이터 없으면 빈 그래프 대신 텍스트 처리
-    Plotly.newPlot(
-      elId,
+    plotTimed(
+      "S2 process",
+      el,
       [],
       {
         annotations: [
@@ -334,33 +547,11 @@ function renderS2ProcessChart(elId, airline, processName, procJson) {
       },
       { responsive: true, displayModeBar: false }
     );
+    // 확대한 구간에 데이터가 없을 때도 더블클릭(autorange)으로 전체 보기로 돌아가게
+    if (range) bindS2Zoom(el, (r) => renderS2ProcessChart(el, airline, processName, procJson, r));
     return;
   }
 
-  // x: 날짜, y: 1인당 평균(분)
-  const x = rows.map((r) => yyyymmddToISO(r.yyyymmdd));
-  const y = rows.map((r) => Number(r.avg_min));
-
-  // 최대/최소 색상
-  const maxVal = Math.max(...y);
-  const minVal = Math.min(...y);
-  const colors = y.map((v) => {
-    if (v === maxVal) return "#ecab86"; // 빨강
-    if (v === minVal) return "#69C6DD"; // 파랑
-    return "#B2C6D3"; // 기본 회색
-  });
-
-  const hover = rows.map((r) => {
-    const avgSec = Number(r.avg_min) * 60;
-
-    return (
-      `날짜: ${r.yyyymmdd}<br>` +
-      `평균(1인): ${secToMMSS(avgSec)}<br>` +
-      `인원: ${r.members}명<br>` +
-      `총합: ${secToMMSS(r.sum_sec)}<extra></extra>`
-    );
-  });
-
   const bar = {
     type: "bar",
     x,
@@ -371,7 +562,6 @@ function renderS2ProcessChart(elId, airline, processName, procJson) {
   };
 
   // 점선: 기간 평균
-  const avg = procJson.period_avg_min?.[key];
   const avgSec = avg * 60;
 
   const line =
@@ -410,8 +600,13 @@ function renderS2ProcessChart(elId, airline, processName, procJson) {
   const layout = {
     margin: { t: 10, l: 50, r: 10, b: 40 },
     barmode: "group",
+    uirevision: key,
     yaxis: { title: "시간(분)", gridcolor: "rgba(0,0,0,.06)" },
-    xaxis: { title: "날짜", gridcolor: "rgba(0,0,0,.04)" },
+    xaxis: {
+      title: `날짜 (${S2_RES_LABEL[res]})`,
+      gridcolor: "rgba(0,0,0,.04)",
+      ...(range ? { range } : {}),
+    },
     paper_bgcolor: "rgba(0,0,0,0)",
     plot_bgcolor: "rgba(0,0,0,0)",
     font: { size: 13, color: "#253036" },
@@ -420,24 +615,47 @@ function renderS2ProcessChart(elId, airline, processName, procJson) {
 
   const traces = line ? [bar, line] : [bar];
 
-  Plotly.newPlot(elId, traces, layout, {
+  plotTimed("S2 process", el, traces, layout, {
     responsive: true,
     displayModeBar: false,
   });
+  bindS2Zoom(el, (r) => renderS2ProcessChart(el, airline, processName, procJson, r));
 }
 
 // ================================
 // Section 3-1: 작업자별 공정 수행 횟수 (테이블)
 // ================================
-function renderSection3(data) {
+/** 가상 스크롤 테이블 한 줄 높이(px) 기본값 (첫 렌더 후 실제 높이로 보정) */
+const S3_ROW_HEIGHT = 46;
+/** 화면 밖 위/아래로 미리 그려둘 줄 수 */
+const S3_OVERSCAN = 8;
+
+function renderSection3() {
   const tabsEl = document.getElementById("s3_tabs");
   const tableEl = document.getElementById("s3_table");
+  const filterEl = document.getElementById("s3_filter");
+  const countEl = document.getElementById("s3_table_count");
 
   if (!tabsEl || !tableEl) return;
 
+  const wrapEl = tableEl.parentElement; // .tableWrap = 스크롤 컨테이너
+  wrapEl.classList.add("virtual");
+
   const AIRLINES = ["ALL", "HH", "RF", "8M"];
+  const PROCS = S3_PROCS;
   let active = "ALL";
 
+  // 정렬/필터 상태 (탭을 바꿔도 유지)
+  let sortKey = "_total";
+  let sortDir = -1; // -1: 내림차순
+  let filterText = "";
+
+  // 탭별 피벗 결과 캐시: tab -> rows[]
+  const pivotCache = new Map();
+  // 현재 화면 인덱스 (정렬+필터 적용된 rows)
+  let viewRows = [];
+  let rowHeight = S3_ROW_HEIGHT;
+
   function badgeHtml(proc) {
     if (proc === "소닉") return `<span class="badge sonic">소닉</span>`;
     if (proc === "라바") return `<span class="badge lava">라바</span>`;
@@ -453,102 +671,197 @@ function renderSection3(data) {
       btn.onclick = () => {
         active = code;
         drawTabs();
-        drawTable();
+        timed("tab Section 3-1", () => drawTable()).catch((err) =>
+          console.error("[Section 3-1]", err)
+        );
       };
       tabsEl.appendChild(btn);
     });
   }
 
-  function drawTable() {
-    // 1) 항공사 필터
-    const baseRows =
-      active === "ALL"
-        ? data.rows
-        : (data.rows || []).filter((r) => r.airline === active);
-
-    if (!baseRows || baseRows.length === 0) {
-      tableEl.innerHTML = `<thead><tr><th>데이터 없음</th></tr></thead><tbody></tbody>`;
-      return;
-    }
-
-    // 2) member 단위로 피벗 집계: { member => {소닉: n, 로보캅: n, 라바: n} }
-    const map = new Map();
-
-    baseRows.forEach((r) => {
-      const name = r.member_name || String(r.member_srl); // 이름 없으면 srl
-      const proc = r.process;
-      const cnt = Number(r.aircraft_cnt || 0);
-
-      if (!map.has(name)) {
-        map.set(name, {
-          member_name: name,
-          소닉: 0,
-          로보캅: 0,
-          라바: 0,
-          _total: 0,
-        });
-      }
-
-      const row = map.get(name);
+  // 정렬 + 필터 → viewRows (DOM은 건드리지 않음, 피벗/정렬은 shaping.js)
+  function buildIndex(rows) {
+    viewRows = sortFilterRows(rows, filterText, sortKey, sortDir);
+  }
 
-      // 예상 외 라벨이 들어오면 스킵
-      if (proc === "소닉" || proc === "로보캅" || proc === "라바") {
-        row[proc] += cnt;
-        row._total += cnt;
-      }
-    });
+  // 4) 테이블 헤더 (작업자 / 소닉 / 로보캅 / 라바) - 한 번만 만들고 정렬 표시만 갱신
+  let theadEl = null;
+  let tbodyEl = null;
 
-    // 3) 정렬: 총합(_total) 내림차순
-    const finalRows = Array.from(map.values()).sort(
-      (a, b) => b._total - a._total
-    );
+  function ensureTable() {
+    if (theadEl && tableEl.contains(theadEl)) return;
 
-    // 4) 테이블 헤더 (작업자 / 소닉 / 로보캅 / 라바)
-    const thead = `
+    tableEl.innerHTML = `
       <thead>
         <tr>
-          <th style="width: 40%;">작업자</th>
-          <th class="num" style="width: 20%;">${badgeHtml("소닉")}</th>
-          <th class="num" style="width: 20%;">${badgeHtml("로보캅")}</th>
-          <th class="num" style="width: 20%;">${badgeHtml("라바")}</th>
-          <th class="num" style="width: 20%;">합계</th>
+          <th data-key="member_name" style="width: 40%;">작업자</th>
+          ${PROCS.map(
+            (p) => `<th data-key="${p}" class="num" style="width: 20%;">${badgeHtml(p)}</th>`
+          ).join("")}
+          <th data-key="_total" class="num" style="width: 20%;">합계</th>
         </tr>
       </thead>
+      <tbody></tbody>
     `;
+    theadEl = tableEl.querySelector("thead");
+    tbodyEl = tableEl.querySelector("tbody");
+
+    // 헤더 클릭: 같은 칼럼이면 방향 전환, 다른 칼럼이면 그 칼럼 기준(숫자는 내림차순)
+    theadEl.querySelectorAll("th").forEach((th) => {
+      th.classList.add("sortable");
+      th.onclick = () => {
+        const key = th.dataset.key;
+        if (sortKey === key) sortDir = -sortDir;
+        else {
+          sortKey = key;
+          sortDir = key === "member_name" ? 1 : -1;
+        }
+        refresh();
+      };
+    });
+  }
 
-    // 5) 바디
-    const tbodyRows = finalRows
-      .map((r) => {
-        const sonic = r["소닉"] || 0;
-        const robo = r["로보캅"] || 0;
-        const lava = r["라바"] || 0;
-        const total = sonic + robo + lava;
-        return `
-          <tr>
-            <td>${escapeHtml(r.member_name)}</td>
-            <td class="num">${sonic.toLocaleString("ko-KR")}</td>
-            <td class="num">${robo.toLocaleString("ko-KR")}</td>
-            <td class="num">${lava.toLocaleString("ko-KR")}</td>
-            <td class="num"><strong>${total.toLocaleString(
-              "ko-KR"
-            )}</strong></td>
-            
-          </tr>
-        `;
-      })
-      .join("");
+  function updateSortMarks() {
+    theadEl.querySelectorAll("th").forEach((th) => {
+      th.dataset.sort =
+        th.dataset.key === sortKey ? (sortDir < 0 ? "desc" : "asc") : "";
+    });
+  }
+
+  function makeRow(r, i) {
+    const tr = document.createElement("tr");
+    if (i % 2 === 0) tr.className = "odd"; // spacer 때문에 nth-child 대신 index로 줄무늬
+
+    const nameTd = document.createElement("td");
+    nameTd.textContent = r.member_name;
+    tr.appendChild(nameTd);
 
-    tableEl.innerHTML = thead + `<tbody>${tbodyRows}</tbody>`;
+    PROCS.forEach((p) => {
+      const td = document.createElement("td");
+      td.className = "num";
+      td.textContent = (r[p] || 0).toLocaleString("ko-KR");
+      tr.appendChild(td);
+    });
+
+    const totalTd = document.createElement("td");
+    totalTd.className = "num";
+    const strong = document.createElement("strong");
+    strong.textContent = r._total.toLocaleString("ko-KR");
+    totalTd.appendChild(strong);
+    tr.appendChild(totalTd);
+
+    return tr;
+  }
+
+  function spacer(height) {
+    const tr = document.createElement("tr");
+    tr.className = "spacer";
+    const td = document.createElement("td");
+    td.colSpan = PROCS.length + 2;
+    td.style.height = `${height}px`;
+    tr.appendChild(td);
+    return tr;
   }
 
+  // 5) 바디: 보이는 구간(+여유분)만 DOM으로 만들고 위/아래는 빈 줄 높이로 채움
+  let renderedRange = "";
+
+  function drawWindow(force) {
+    const total = viewRows.length;
+    const headH = theadEl.offsetHeight || 0;
+    const top = Math.max(0, wrapEl.scrollTop - headH);
+    const viewH = wrapEl.clientHeight || 560;
+
+    const start = Math.max(0, Math.floor(top / rowHeight) - S3_OVERSCAN);
+    const end = Math.min(total, Math.ceil((top + viewH) / rowHeight) + S3_OVERSCAN);
+
+    const range = `${start}:${end}:${total}`;
+    if (!force && range === renderedRange) return;
+    renderedRange = range;
+
+    const frag = document.createDocumentFragment();
+    if (start > 0) frag.appendChild(spacer(start * rowHeight));
+    for (let i = start; i < end; i++) frag.appendChild(makeRow(viewRows[i], i));
+    if (end < total) frag.appendChild(spacer((total - end) * rowHeight));
+
+    tbodyEl.replaceChildren(frag);
+
+    // 실제 줄 높이로 보정 (폰트/모바일 패딩 차이)
+    const first = tbodyEl.querySelector("tr:not(.spacer)");
+    if (first && first.offsetHeight && Math.abs(first.offsetHeight - rowHeight) > 1) {
+      rowHeight = first.offsetHeight;
+      drawWindow(true);
+    }
+  }
+
+  let scrollPending = false;
+  wrapEl.addEventListener("scroll", () => {
+    if (scrollPending) return;
+    scrollPending = true;
+    requestAnimationFrame(() => {
+      scrollPending = false;
+      if (tbodyEl) drawWindow(false);
+    });
+  });
+
+  function refresh() {
+    const rows = pivotCache.get(active);
+    if (!rows) return;
+
+    buildIndex(rows);
+    updateSortMarks();
+    if (countEl) countEl.textContent = `${viewRows.length.toLocaleString("ko-KR")}명`;
+    drawWindow(true);
+  }
+
+  if (filterEl) {
+    filterEl.addEventListener("input", () => {
+      filterText = filterEl.value;
+      wrapEl.scrollTop = 0;
+      refresh();
+    });
+  }
+
+  async function drawTable(keepScroll = false) {
+    // 1) 항공사 필터 = 해당 항공사 shard만 받기 (전체 탭은 모든 항공사 shard 합침)
+    const tab = active;
+    if (!pivotCache.has(tab)) {
+      const codes = tab === "ALL" ? AIRLINE_ORDER : [tab];
+      const parts = await Promise.all(
+        codes.map((code) => loadAirlineShard(SHARD_BASES.s3Counts, code))
+      );
+      // 2) 피벗 (탭당 한 번)
+      pivotCache.set(tab, pivotProcessCounts(parts.flatMap((p) => p.rows || [])));
+    }
+    if (tab !== active) return;
+
+    if (pivotCache.get(tab).length === 0) {
+      theadEl = tbodyEl = null;
+      tableEl.innerHTML = `<thead><tr><th>데이터 없음</th></tr></thead><tbody></tbody>`;
+      if (countEl) countEl.textContent = "";
+      return;
+    }
+
+    // 3) 정렬/필터 인덱스만 다시 만들고 보이는 줄만 갱신
+    ensureTable();
+    if (!keepScroll) wrapEl.scrollTop = 0;
+    refresh();
+  }
+
+  // 실시간 갱신: 피벗을 버리고 지금 탭만 다시 (스크롤/정렬/검색은 유지)
+  liveRedraw.set("Section 3-1", () => {
+    pivotCache.clear();
+    return drawTable(true);
+  });
+
   drawTabs();
-  drawTable();
+  return drawTable();
 }
 
 // ================================
 // Section 3-2: 공정별 소요시간 순위
 // ================================
-function renderSection3SpeedChart(data) {
+function renderSection3SpeedChart() {
   const chartEl = document.getElementById("s3_speed_charts");
   const airlineTabsEl = document.getElementById("s3_speed_tabs_airline");
 
@@ -566,148 +879,197 @@ function renderSection3SpeedChart(data) {
       btn.onclick = () => {
         activeAirline = code;
         drawAirlineTabs();
-        drawCharts();
+        timed("tab Section 3-2", drawCharts).catch((err) => console.error("[Section 3-2]", err));
       };
       airlineTabsEl.appendChild(btn);
     });
   }
 
-  function safeId(s) {
-    return String(s).replace(/[^a-zA-Z0-9_]/g, "_");
-  }
+  // 작업자별 평균 집계(aggregateByMember) / 요약 변환(rolesFromSummary) 은 shaping.js
+
+  // 항공사별 speed rows (shard를 받은 항공사만 들어있음)
+  const rowsByAirline = new Map();
 
-  // display_sec에서 백업존 시간은 미리 계산되니까 제외 (time + attached backup)
-  function calcDisplaySec(r) {
-    return Number(r.time_sec || 0);
-    // return Number(r.time_sec || 0) + Number(r.backup_sec_attached || 0);
+  // Worker를 못 쓰는 환경용: 메인 스레드에서 같은 모양의 결과를 만든다
+  function aggregateRolesSync(airline) {
+    return aggregateRolesByMember(rowsByAirline.get(airline) || [], airline, (rows) =>
+      timedSync("aggregateByMember", () => aggregateByMember(rows))
+    );
   }
 
-  // 작업자별 평균(편명 1건당 평균) 집계
-  function aggregateByMember(rows) {
-    const map = new Map(); // key: member_srl or name
-    rows.forEach((r) => {
-      const key =
-        r.member_srl != null
-          ? String(r.member_srl)
-          : String(r.member_name || "");
-      const name = r.member_name || key;
+  // 필터/집계 엔진
+  // 1) ETL 요약 shard가 있으면 그대로 사용 (집계 없음)
+  // 2) 없으면(예전 ETL 결과) raw rows를 Web Worker(s3_speed_worker.js)에서 집계, 안 되면 동기 fallback
+  function createSpeedEngine() {
+    let worker = null;
+    let workerTried = false;
+
+    let seq = 0;
+    const pending = new Map(); // id -> {resolve, airline}
+
+    function getWorker() {
+      if (workerTried) return worker;
+      workerTried = true;
+      try {
+        worker = new Worker("s3_speed_worker.js");
+      } catch (err) {
+        console.warn("[Section 3-2] Worker 사용 불가, 메인 스레드 집계", err);
+        return (worker = null);
+      }
 
-      const displaySec = calcDisplaySec(r);
+      worker.onmessage = (ev) => {
+        const msg = ev.data || {};
+        const p = pending.get(msg.id);
+        if (!p) return;
+        pending.delete(msg.id);
+        p.resolve(msg.roles || []);
+      };
+      worker.onerror = (ev) => {
+        // 스크립트 로드 실패 등 → fallback으로 전환하고 대기 중인 요청도 처리
+        console.warn("[Section 3-2] Worker 오류, 메인 스레드 집계로 전환", ev);
+        worker.terminate();
+        worker = null;
+        pending.forEach((p) => p.resolve(aggregateRolesSync(p.airline)));
+        pending.clear();
+      };
+      return worker;
+    }
 
-      if (!map.has(key)) {
-        map.set(key, {
-          member_key: key,
-          member_name: name,
-          count: 0,
-          sum_display_sec: 0,
-          sum_time_sec: 0,
-          sample: r,
-          // sum_backup_sec는 내부 계산용으로 필요하면 남겨도 되지만,
-          // hover에서 안 보여줄 거라면 굳이 안 모아도 됩니다.
-        });
+    // raw rows shard를 받아서 Worker에 넘김 (항공사당 1번)
+    const loaded = new Map(); // airline -> Promise
+    function ensureRowsLoaded(airline) {
+      if (!loaded.has(airline)) {
+        // 문자열 테이블 형식(작은 파일)을 먼저, 없으면 예전 rows 파일
+        const p = loadAirlineShard(SHARD_BASES.s3SpeedDict, airline)
+          .then(decodeDictRows)
+          .catch(() => loadAirlineShard(SHARD_BASES.s3Speed, airline))
+          .then((payload) => {
+            const rows = payload.rows || [];
+            rowsByAirline.set(airline, rows);
+            const w = getWorker();
+            if (w) w.postMessage({ type: "load", id: ++seq, airline, rows });
+            return rows;
+          });
+        loaded.set(airline, p);
+        p.catch(() => loaded.delete(airline));
       }
-      const a = map.get(key);
-      a.count += 1;
-      a.sum_display_sec += displaySec;
-      a.sum_time_sec += Number(r.time_sec || 0);
-    });
+      return loaded.get(airline);
+    }
+
+    async function queryRows(airline) {
+      await ensureRowsLoaded(airline);
+      if (!worker) return aggregateRolesSync(airline);
+      const id = ++seq;
+      return timed(
+        "aggregate (worker)",
+        () =>
+          new Promise((resolve) => {
+            pending.set(id, { resolve, airline });
+            worker.postMessage({ type: "query", id, airline });
+          })
+      );
+    }
 
-    const out = Array.from(map.values()).map((a) => ({
-      ...a,
-      avg_display_sec: a.count ? a.sum_display_sec / a.count : null,
-    }));
+    return {
+      // 실시간 갱신: 받아 둔 raw rows 를 버림 (다음 드릴다운 때 새 shard 로)
+      reset() {
+        loaded.clear();
+        rowsByAirline.clear();
+      },
 
-    // 속도는 빠를수록 좋으니까 오름차순
-    out.sort(
-      (x, y) => (x.avg_display_sec ?? 1e18) - (y.avg_display_sec ?? 1e18)
-    );
-    return out;
-  }
+      async query(airline) {
+        const summary = await loadAirlineShard(SHARD_BASES.s3Summary, airline).catch(
+          () => null
+        );
+        return summary ? rolesFromSummary(summary) : queryRows(airline);
+      },
 
-  function getAirlineFromRow(r) {
-    // airline 필드가 없으면 flight_title 앞 2글자 사용
-    return r.airline || String(r.flight_title || "").slice(0, 2);
+      // 드릴다운: 한 작업자/카드의 원본 rows (요청할 때만 raw shard를 받음)
+      async rowsFor(airline, role, memberKey) {
+        const rows = await ensureRowsLoaded(airline);
+        return speedRowsFor(rows, role, memberKey);
+      },
+    };
   }
 
-  function drawCharts() {
-    chartEl.innerHTML = "";
+  const engine = createSpeedEngine();
+  const pool = createChartPool(chartEl, {
+    idPrefix: "s3_speed",
+    cardMinHeight: "420px",
+  });
 
-    // 1) 항공사만 필터 (zone 무시)
-    const rows = (data.rows || []).filter(
-      (r) => getAirlineFromRow(r) === activeAirline
-    );
+  // 차트 div -> 현재 그려진 {airline, agg} (클릭 드릴다운용)
+  const drawnState = new WeakMap();
 
-    if (rows.length === 0) {
-      chartEl.innerHTML = `<div class="card" style="min-height:220px;">
-        <div class="cardTitle">${activeAirline} — 데이터 없음</div>
-        <div class="chart" style="height:160px;display:flex;align-items:center;justify-content:center;color:#63666a;">데이터 없음</div>
-      </div>`;
-      return;
+  function drillEl(chartDiv) {
+    const card = chartDiv.parentElement;
+    let el = card.querySelector(".drill");
+    if (!el) {
+      el = document.createElement("div");
+      el.className = "drill";
+      card.appendChild(el);
     }
+    return el;
+  }
 
-    // 2) role_label별로 그룹핑 (존/공정 카드 제거)
-    const roleMap = new Map(); // key = role_label
-    rows.forEach((r) => {
-      const role = r.role_label || "(unknown)";
-      if (!roleMap.has(role)) roleMap.set(role, []);
-      roleMap.get(role).push(r);
-    });
+  // 막대 클릭 → 그 작업자의 원본 rows를 (필요할 때만) 받아서 카드 아래에 표시
+  async function showDrill(chartDiv, pointIndex) {
+    const st = drawnState.get(chartDiv);
+    if (!st) return;
+    const { airline, agg } = st;
+    const name = agg.names[pointIndex];
+
+    const el = drillEl(chartDiv);
+    el.innerHTML = `<div class="drillHead">${escapeHtml(name)} · ${escapeHtml(agg.role)} — 불러오는 중…</div>`;
+
+    const rows = await engine.rowsFor(airline, agg.role, agg.keys[pointIndex]);
+    if (drawnState.get(chartDiv) !== st) return; // 그 사이 탭 전환
+
+    const body = rows
+      .map(
+        (r) =>
+          `<tr><td>${escapeHtml(r.date || "")}</td><td>${escapeHtml(
+            r.flight_title || ""
+          )}</td><td class="num">${secToMMSS(Number(r.time_sec || 0))}</td></tr>`
+      )
+      .join("");
+    el.innerHTML =
+      `<div class="drillHead">${escapeHtml(name)} · ${escapeHtml(agg.role)} (${rows.length}건)` +
+      `<button class="drillClose" type="button">닫기</button></div>` +
+      `<table class="dataTable drillTable"><thead><tr><th>날짜</th><th>편명</th><th class="num">시간</th></tr></thead>` +
+      `<tbody>${body}</tbody></table>`;
+    el.querySelector(".drillClose").onclick = () => el.remove();
+  }
+
+  async function drawCharts() {
+    const airline = activeAirline;
+    const roles = await engine.query(airline);
+
+    // 응답 오기 전에 다른 탭을 눌렀으면 버림
+    if (airline !== activeAirline) return;
 
-    // 3) role_label 카드+차트 생성 (존 없음)
-    const roles = Array.from(roleMap.keys())
-      .filter((x) => x && x !== "(unknown)")
-      .sort();
+    // 이전 탭의 드릴다운 패널 닫기
+    chartEl.querySelectorAll(".drill").forEach((el) => el.remove());
 
-    // 혹시 role_label이 비어있는 데이터만 있는 경우 대비
     if (roles.length === 0) {
+      // 항공사 데이터가 없거나, role_label이 비어있는 데이터만 있는 경우
+      pool.clear();
       chartEl.innerHTML = `<div class="card" style="min-height:220px;">
-        <div class="cardTitle">${activeAirline} — role_label 데이터 없음</div>
+        <div class="cardTitle">${airline} — 데이터 없음</div>
         <div class="chart" style="height:160px;display:flex;align-items:center;justify-content:center;color:#63666a;">데이터 없음</div>
       </div>`;
       return;
     }
 
-    roles.forEach((role, idx) => {
-      const rowsInRole = roleMap.get(role) || [];
-
-      const card = document.createElement("div");
-      card.className = "card";
-      card.style.minHeight = "420px";
-
-      const title = document.createElement("div");
-      title.className = "cardTitle";
-      title.textContent = `${activeAirline} · ${role}`;
-      card.appendChild(title);
-
-      const chartDiv = document.createElement("div");
-      const chartId = safeId(`s3_speed_${activeAirline}_${role}_${idx}`);
-      chartDiv.id = chartId;
-      chartDiv.className = "chart";
-      card.appendChild(chartDiv);
-
-      chartEl.appendChild(card);
-
-      // 작업자별 평균으로 1인 1막대
-      const agg = aggregateByMember(rowsInRole);
-
-      const y = agg.map((a) => a.member_name);
-      const x = agg.map((a) => (a.avg_display_sec ?? 0) / 60); // 분
-
-      // hover에서 backup합 제거
-      const hover = agg.map((a) => {
-        const avg = a.avg_display_sec ?? 0;
-        const s = a.sample || {};
-        return (
-          `${escapeHtml(a.member_name)}<br>` +
-          `샘플: ${escapeHtml(s.date || "")} ${escapeHtml(
-            s.flight_title || ""
-          )}<br>` +
-          `샘플 time_sec: ${Number(s.time_sec || 0)}초<br>` +
-          `평균: ${(avg / 60).toFixed(2)}분<br>` +
-          `건수: ${a.count}건<br>` +
-          `time합: ${secToMMSS(a.sum_time_sec)}<extra></extra>`
-        );
-      });
+    pool.begin();
+
+    // role_label 카드+차트 (key = role_label → 항공사 탭을 바꿔도 같은 카드 재사용)
+    roles.forEach((agg) => {
+      const role = agg.role;
+      const chartDiv = pool.card(role, `${airline} · ${role}`);
+
+      // 작업자별 평균으로 1인 1막대 (hover 포함, shaping.js)
+      const { x, y, hover } = speedBarData(agg);
 
       const trace = {
         type: "bar",
@@ -730,56 +1092,591 @@ function renderSection3SpeedChart(data) {
         font: { size: 13, color: "#253036" },
       };
 
-      Plotly.newPlot(chartId, [trace], layout, {
+      plotTimed("S3 speed", chartDiv, [trace], layout, {
         responsive: true,
         displayModeBar: false,
       });
+
+      drawnState.set(chartDiv, { airline, agg });
+      if (!chartDiv.dataset.drillBound) {
+        chartDiv.dataset.drillBound = "1";
+        chartDiv.on("plotly_click", (ev) => {
+          const idx = ev.points?.[0]?.pointIndex;
+          if (idx != null) showDrill(chartDiv, idx).catch((err) => console.error(err));
+        });
+      }
     });
+
+    pool.end();
   }
 
+  liveRedraw.set("Section 3-2", () => {
+    engine.reset();
+    return drawCharts();
+  });
+
   drawAirlineTabs();
-  drawCharts();
+  return drawCharts();
+}
+
+// ================================
+// Plotly 로드 대기
+// ================================
+/** index.html <head> 의 Plotly 부분 번들 주소 (처음 받기가 실패했을 때 한 번 더 시도) */
+const PLOTLY_SRC = "./vendor/plotly-dash.min.js";
+
+function loadScript(src) {
+  return new Promise((resolve, reject) => {
+    const s = document.createElement("script");
+    s.src = src;
+    s.onload = resolve;
+    s.onerror = () => reject(new Error(`Failed to load ${src}`));
+    document.head.appendChild(s);
+  });
+}
+
+/**
+ * Plotly 는 <head> 에서 defer 로 app.js 보다 먼저 실행됨 → 보통 이미 window.Plotly 가 있음
+ * (네트워크 문제로 못 받았으면 다시 시도, 그래도 실패하면 섹션마다 에러 표시)
+ */
+const plotlyReady = window.Plotly
+  ? Promise.resolve(window.Plotly)
+  : loadScript(PLOTLY_SRC).then(() => window.Plotly);
+
+// ================================
+// Perf instrumentation (느린 기기에서 어디가 느린지)
+// ================================
+// timed()/timedSync() 로 감싼 구간마다 performance.measure + 라벨별 통계(n / 평균 / 최대 / 최근)
+//   - 라벨: "fetch <파일>" / "parse <파일>" / "render <섹션>" / "tab <섹션>" / "plot <차트>" / "aggregateByMember" ...
+//   - long task(메인 스레드를 50ms 넘게 막은 작업)는 그때 돌던 가장 짧은 구간 라벨에 붙여서 셈
+//   - 메모리: performance.memory (Chrome 계열만) 를 주기적으로 읽고 최대값 보관
+// 화면 표시: 주소에 ?perf=1 (또는 localStorage.dashPerf = "1") → 오른쪽 아래 오버레이
+// 수집: index.html 의 <meta name="perf-collector" content="http://호스트:8765/perf"> 가 있으면
+//       첫 그리기가 끝난 뒤 + 페이지를 숨길/떠날 때 요약 JSON 을 POST (기기별 device_id 포함)
+
+/** long task 와 맞춰 볼 최근 구간 수 */
+const PERF_SPAN_KEEP = 300;
+const PERF_MEMORY_SAMPLE_MS = 5000;
+const PERF_OVERLAY_ROWS = 25;
+
+const perf = {
+  stats: new Map(), // label -> {n, sum, max, last}
+  spans: [], // 끝난 구간 {label, start, end} (최근 PERF_SPAN_KEEP 개)
+  open: new Set(), // 아직 안 끝난 구간
+  longTasks: { n: 0, sum: 0, max: 0, byLabel: new Map() },
+  memory: null, // {used_mb, total_mb, limit_mb, peak_mb}
+  overlay: null,
+  overlayTimer: 0,
+  deviceId: "",
+};
+
+function perfBegin(label) {
+  const span = { label, start: performance.now(), end: null };
+  perf.open.add(span);
+  return span;
+}
+
+function perfEnd(span) {
+  span.end = performance.now();
+  perf.open.delete(span);
+  perfRecord(span);
+}
+
+function perfRecord(span) {
+  const ms = span.end - span.start;
+  let s = perf.stats.get(span.label);
+  if (!s) perf.stats.set(span.label, (s = { n: 0, sum: 0, max: 0, last: 0 }));
+  s.n += 1;
+  s.sum += ms;
+  s.last = ms;
+  if (ms > s.max) s.max = ms;
+
+  perf.spans.push(span);
+  if (perf.spans.length > PERF_SPAN_KEEP) perf.spans.shift();
+
+  // DevTools Performance 탭 녹화에 남김 (User Timing L3 없는 브라우저는 생략)
+  //   녹화에는 만들 때 찍히므로 바로 지움 → performance 버퍼가 세션 내내 쌓이지 않음 (통계는 perf.stats)
+  try {
+    performance.measure(span.label, { start: span.start, end: span.end });
+    performance.clearMeasures(span.label);
+  } catch (err) {
+    // 통계는 위에서 이미 기록됨
+  }
+  perfOverlayUpdate();
+}
+
+/** long task 구간과 겹친 측정 구간 중 가장 짧은 것 (= 가장 안쪽 작업) */
+function perfBlame(taskStart, taskEnd) {
+  let best = null;
+  const consider = (span) => {
+    const end = span.end ?? Infinity;
+    if (span.start >= taskEnd || end <= taskStart) return;
+    if (!best || end - span.start < (best.end ?? Infinity) - best.start) best = span;
+  };
+  perf.spans.forEach(consider);
+  perf.open.forEach(consider);
+  return best ? best.label : "(측정 밖)";
+}
+
+function perfObserveLongTasks() {
+  if (!(PerformanceObserver.supportedEntryTypes || []).includes("longtask")) return;
+
+  new PerformanceObserver((list) => {
+    const lt = perf.longTasks;
+    list.getEntries().forEach((e) => {
+      lt.n += 1;
+      lt.sum += e.duration;
+      if (e.duration > lt.max) lt.max = e.duration;
+      const label = perfBlame(e.startTime, e.startTime + e.duration);
+      const b = lt.byLabel.get(label) || { n: 0, sum: 0 };
+      b.n += 1;
+      b.sum += e.duration;
+      lt.byLabel.set(label, b);
+    });
+    perfOverlayUpdate();
+  }).observe({ type: "longtask", buffered: true });
+}
+
+function perfSampleMemory() {
+  const m = performance.memory;
+  if (!m) return;
+  const mb = (v) => Math.round((v / 1048576) * 10) / 10;
+  const used = mb(m.usedJSHeapSize);
+  perf.memory = {
+    used_mb: used,
+    total_mb: mb(m.totalJSHeapSize),
+    limit_mb: mb(m.jsHeapSizeLimit),
+    peak_mb: Math.max(used, perf.memory?.peak_mb || 0),
+  };
+}
+
+/** 기기 구분용 id (localStorage 에 한 번 만들어 둠, 못 쓰면 페이지마다 새로) */
+function perfDeviceId() {
+  if (perf.deviceId) return perf.deviceId;
+  const make = () => `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 10)}`;
+  try {
+    let id = localStorage.getItem("dashDeviceId");
+    if (!id) localStorage.setItem("dashDeviceId", (id = make()));
+    perf.deviceId = id;
+  } catch (err) {
+    perf.deviceId = make();
+  }
+  return perf.deviceId;
+}
+
+function perfSummary() {
+  perfSampleMemory();
+  const round = (v) => Math.round(v * 10) / 10;
+  const nav = performance.getEntriesByType?.("navigation")?.[0];
+  const fcp = performance.getEntriesByName?.("first-contentful-paint")?.[0];
+  const lt = perf.longTasks;
+
+  return {
+    device_id: perfDeviceId(),
+    sent_at: new Date().toISOString(),
+    page: location.pathname,
+    device: {
+      user_agent: navigator.userAgent,
+      screen: `${screen.width}x${screen.height}`,
+      dpr: window.devicePixelRatio || 1,
+      cores: navigator.hardwareConcurrency ?? null,
+      memory_gb: navigator.deviceMemory ?? null,
+    },
+    navigation: nav
+      ? {
+          dom_content_loaded_ms: round(nav.domContentLoadedEventEnd),
+          load_ms: round(nav.loadEventEnd),
+          transfer_bytes: nav.transferSize ?? null,
+        }
+      : null,
+    first_contentful_paint_ms: fcp ? round(fcp.startTime) : null,
+    uptime_ms: round(performance.now()),
+    measures: Object.fromEntries(
+      Array.from(perf.stats, ([label, s]) => [
+        label,
+        { n: s.n, avg_ms: round(s.sum / s.n), max_ms: round(s.max), last_ms: round(s.last), sum_ms: round(s.sum) },
+      ])
+    ),
+    long_tasks: {
+      n: lt.n,
+      sum_ms: round(lt.sum),
+      max_ms: round(lt.max),
+      by_label: Object.fromEntries(
+        Array.from(lt.byLabel, ([label, b]) => [label, { n: b.n, sum_ms: round(b.sum) }])
+      ),
+    },
+    memory: perf.memory,
+  };
+}
+
+function perfCollectorUrl() {
+  return document.querySelector('meta[name="perf-collector"]')?.content || "";
+}
+
+/** 요약 POST: text/plain 이라 CORS preflight 없음, sendBeacon 은 페이지를 닫는 중에도 보냄 */
+function perfSend(reason) {
+  const url = perfCollectorUrl();
+  if (!url) return false;
+
+  const body = JSON.stringify({ reason, ...perfSummary() });
+  const type = "text/plain;charset=UTF-8";
+  if (navigator.sendBeacon?.(url, new Blob([body], { type }))) return true;
+  fetch(url, { method: "POST", body, keepalive: true, headers: { "Content-Type": type } }).catch(
+    (err) => console.warn("[perf] 전송 실패", err)
+  );
+  return true;
+}
+
+function perfOverlayEnabled() {
+  if (new URLSearchParams(location.search).get("perf") === "1") return true;
+  try {
+    return localStorage.getItem("dashPerf") === "1";
+  } catch (err) {
+    return false;
+  }
+}
+
+/** 오버레이 다시 그리기 (측정이 몰려도 0.5초에 한 번) */
+function perfOverlayUpdate() {
+  if (!perf.overlay || perf.overlayTimer) return;
+  perf.overlayTimer = setTimeout(() => {
+    perf.overlayTimer = 0;
+    perfOverlayDraw();
+  }, 500);
+}
+
+function perfOverlayDraw() {
+  const el = perf.overlay;
+  if (!el) return;
+  perfSampleMemory();
+
+  const fmt = (ms) => (ms >= 100 ? ms.toFixed(0) : ms.toFixed(1));
+  const rows = Array.from(perf.stats)
+    .sort((a, b) => b[1].sum - a[1].sum)
+    .slice(0, PERF_OVERLAY_ROWS)
+    .map(
+      ([label, s]) =>
+        `<tr><td>${escapeHtml(label)}</td><td class="num">${s.n}</td>` +
+        `<td class="num">${fmt(s.sum / s.n)}</td><td class="num">${fmt(s.max)}</td>` +
+        `<td class="num">${fmt(s.last)}</td></tr>`
+    )
+    .join("");
+
+  const lt = perf.longTasks;
+  const blame = Array.from(lt.byLabel)
+    .sort((a, b) => b[1].sum - a[1].sum)
+    .slice(0, 3)
+    .map(([label, b]) => `${escapeHtml(label)} ${fmt(b.sum)}ms`)
+    .join(" · ");
+  const mem = perf.memory
+    ? `메모리 ${perf.memory.used_mb}MB (최대 ${perf.memory.peak_mb}MB)`
+    : "메모리: 이 브라우저는 제공 안 함";
+
+  el.querySelector(".perfBody").innerHTML =
+    `<div>long task ${lt.n}회 · 합 ${fmt(lt.sum)}ms · 최대 ${fmt(lt.max)}ms</div>` +
+    (blame ? `<div class="perfBlame">${blame}</div>` : "") +
+    `<div>${mem}</div>` +
+    `<table><thead><tr><th>구간</th><th class="num">n</th><th class="num">평균</th>` +
+    `<th class="num">최대</th><th class="num">최근(ms)</th></tr></thead><tbody>${rows}</tbody></table>`;
+}
+
+function perfShowOverlay() {
+  const el = document.createElement("div");
+  el.id = "perfOverlay";
+  el.className = "perfOverlay";
+  el.innerHTML =
+    `<div class="perfHead">성능 측정` +
+    (perfCollectorUrl() ? `<button type="button" data-act="send">전송</button>` : "") +
+    `<button type="button" data-act="reset">초기화</button>` +
+    `<button type="button" data-act="close">닫기</button></div>` +
+    `<div class="perfBody"></div>`;
+
+  el.querySelector(".perfHead").addEventListener("click", (ev) => {
+    const act = ev.target.dataset?.act;
+    if (act === "send") perfSend("manual");
+    if (act === "reset") {
+      perf.stats.clear();
+      perf.longTasks = { n: 0, sum: 0, max: 0, byLabel: new Map() };
+      perfOverlayDraw();
+    }
+    if (act === "close") {
+      el.remove();
+      perf.overlay = null;
+    }
+  });
+
+  document.body.appendChild(el);
+  perf.overlay = el;
+  perfOverlayDraw();
+}
+
+function setupPerf() {
+  if ("PerformanceObserver" in window) perfObserveLongTasks();
+  if (performance.memory) setInterval(perfSampleMemory, PERF_MEMORY_SAMPLE_MS);
+  if (perfOverlayEnabled()) perfShowOverlay();
+
+  // 탭을 숨기거나 닫을 때 지금까지의 요약을 보냄 (태블릿은 pagehide 없이 숨겨지기만 하는 경우가 많음)
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "hidden") perfSend("hidden");
+  });
+}
+
+// ================================
+// Loading pipeline (병렬 fetch + 섹션별 즉시 렌더)
+// ================================
+/** 구간 측정 래퍼 (비동기): 기록은 아래 Perf instrumentation 의 perfRecord */
+async function timed(label, fn) {
+  const span = perfBegin(label);
+  try {
+    return await fn();
+  } finally {
+    perfEnd(span);
+  }
+}
+
+/** 구간 측정 래퍼 (동기): JSON.parse / 집계처럼 메인 스레드를 잡고 있는 계산 */
+function timedSync(label, fn) {
+  const span = perfBegin(label);
+  try {
+    return fn();
+  } finally {
+    perfEnd(span);
+  }
+}
+
+/** 받기(네트워크)와 JSON.parse 를 따로 잼 → 느린 원인이 전송인지 파싱인지 구분 */
+async function loadJsonTimed(path) {
+  const text = await timed(`fetch ${path}`, () => loadJsonText(path));
+  return timedSync(`parse ${path}`, () => JSON.parse(text));
+}
+
+/** Plotly.react + 측정 (레이아웃/그리기 비용은 "plot <이름>" 라벨로 모임) */
+function plotTimed(name, el, data, layout, config) {
+  return timed(`plot ${name}`, () => Plotly.react(el, data, layout, config));
+}
+
+/** 렌더 대상 영역에 로딩/에러 상태 표시 (table이면 tbody 한 줄로) */
+function setLoadState(elId, state, message) {
+  const el = document.getElementById(elId);
+  if (!el) return;
+
+  el.dataset.loadState = state;
+  if (state === "done") return;
+
+  const text =
+    state === "loading" ? "불러오는 중…" : `로딩 실패: ${message || ""}`;
+  const cls = `loadState ${state}`;
+
+  if (el.tagName === "TABLE") {
+    el.innerHTML = `<tbody><tr><td class="${cls}">${escapeHtml(text)}</td></tr></tbody>`;
+  } else {
+    el.innerHTML = `<div class="${cls}">${escapeHtml(text)}</div>`;
+  }
+}
+
+/**
+ * 섹션별 로딩 작업
+ * - files: 필요한 JSON (같은 경로는 한 번만 fetch)
+ * - targets: 로딩/에러 상태를 보여줄 엘리먼트 id
+ * - shards: render 안에서 받는 항공사 shard (실시간 갱신 때 어느 섹션을 다시 그릴지 판단용)
+ */
+const SECTION_TASKS = [
+  {
+    name: "Section 1-1",
+    files: ["data/section1_counts.json"],
+    targets: ["s1_chart_counts"],
+    render: ([counts]) => renderDonutCounts(counts),
+  },
+  {
+    name: "Section 1-2",
+    files: ["data/section1_saved_points.json", "data/section1_saved_stats.json"],
+    targets: ["s1_chart_saved"],
+    render: ([points, stats]) => renderSavedBox(points, stats),
+  },
+  {
+    name: "Section 2",
+    // 시계열은 탭을 열 때 항공사 shard로 받음 (renderSection2 안에서)
+    files: ["data/section2_aircraft_list.json"],
+    shards: [SHARD_BASES.s2Ts, SHARD_BASES.s2Proc],
+    targets: ["s2_cards"],
+    render: ([s2List]) => renderSection2(s2List),
+  },
+  {
+    name: "Section 3-1",
+    files: [], // 항공사 shard (renderSection3 안에서)
+    shards: [SHARD_BASES.s3Counts],
+    targets: ["s3_table"],
+    render: () => renderSection3(),
+  },
+  {
+    name: "Section 3-2",
+    files: [], // 항공사 shard (renderSection3SpeedChart 안에서)
+    shards: [SHARD_BASES.s3Summary, SHARD_BASES.s3SpeedDict, SHARD_BASES.s3Speed],
+    targets: ["s3_speed_charts"],
+    render: () => renderSection3SpeedChart(),
+  },
+];
+
+async function runSectionTask(task, fetchOnce) {
+  task.targets.forEach((id) => setLoadState(id, "loading"));
+  try {
+    const [payloads] = await Promise.all([
+      Promise.all(task.files.map(fetchOnce)),
+      plotlyReady,
+    ]);
+    // render는 shard를 기다릴 수도 있으므로 로딩 표시는 그린 뒤에 정리
+    await timed(`render ${task.name}`, () => task.render(payloads));
+    task.targets.forEach((id) => {
+      const el = document.getElementById(id);
+      if (!el) return;
+      el.querySelectorAll(":scope > .loadState").forEach((n) => n.remove());
+      setLoadState(id, "done");
+    });
+  } catch (err) {
+    console.error(`[${task.name}]`, err);
+    task.targets.forEach((id) => setLoadState(id, "error", err.message));
+  }
+}
+
+// ================================
+// Live updates (ETL 데몬 → Server-Sent Events)
+// ================================
+// etl_daemon.py 가 갱신을 끝내면 바뀐 파일의 manifest 항목을 보냄
+//   - 바뀐 파일만 ?v=<새 해시> 로 다시 받고, 그 파일을 쓰는 섹션만 다시 그림 (페이지 새로고침 없음)
+//   - 연결될 때마다 manifest 전체가 먼저 오므로, 끊긴 동안 바뀐 것도 해시 비교로 찾음
+//   - index.html 의 <meta name="etl-events" content="http://호스트:8765/events"> 가 비어 있으면 끔
+
+/** 섹션 이름 -> (payloads) => 지금 보고 있는 탭만 다시 그리는 함수 (render 안에서 등록) */
+const liveRedraw = new Map();
+
+/** "section2_aircraft_timeseries.HH.json" -> "section2_aircraft_timeseries" */
+function fileBase(filename) {
+  const parts = filename.replace(/\.json$/, "").split(".");
+  if (parts.length > 1 && AIRLINE_ORDER.includes(parts[parts.length - 1])) parts.pop();
+  return parts.join(".");
+}
+
+async function applyLiveUpdate(msg) {
+  const manifest = (await loadManifest()) || { files: {} };
+  const changed = Object.entries(msg.files || {}).filter(
+    ([name, entry]) => manifest.files?.[name]?.sha256 !== entry.sha256
+  );
+  if (changed.length === 0) return;
+
+  // 1) 새 해시로 교체 → loadJsonText 가 바뀐 파일만 새 주소로 받음
+  manifestPromise = Promise.resolve({
+    ...manifest,
+    generated_at: msg.generated_at || manifest.generated_at,
+    files: { ...manifest.files, ...Object.fromEntries(changed) },
+  });
+
+  // 2) 바뀐 파일의 shard 캐시 버리기
+  const bases = new Set(changed.map(([name]) => fileBase(name)));
+  Array.from(shardCache.keys())
+    .filter((key) => bases.has(key.split("|")[0]))
+    .forEach((key) => shardCache.delete(key));
+
+  // 3) 그 파일을 쓰는 섹션만 다시 그림 (순서대로, 로딩 표시 없이)
+  for (const task of SECTION_TASKS) {
+    const uses = [...task.files.map((path) => fileBase(path.split("/").pop())), ...(task.shards || [])];
+    if (!uses.some((b) => bases.has(b))) continue;
+
+    try {
+      const payloads = await Promise.all(task.files.map(loadJsonTimed));
+      const redraw = liveRedraw.get(task.name) || task.render;
+      await timed(`live ${task.name}`, () => redraw(payloads));
+    } catch (err) {
+      console.error(`[live ${task.name}]`, err);
+    }
+  }
+}
+
+function connectLiveUpdates() {
+  const url = document.querySelector('meta[name="etl-events"]')?.content;
+  if (!url || !("EventSource" in window)) return;
+
+  // 끊기면 EventSource 가 알아서 다시 연결 (서버가 retry 간격을 줌)
+  const es = new EventSource(url);
+  let chain = Promise.resolve(); // 이벤트가 몰려도 한 번에 하나씩 적용
+  es.addEventListener("update", (ev) => {
+    let msg;
+    try {
+      msg = JSON.parse(ev.data);
+    } catch (err) {
+      console.warn("[live] 잘못된 메시지", err);
+      return;
+    }
+    chain = chain
+      .then(() => applyLiveUpdate(msg))
+      .catch((err) => console.error("[live]", err));
+  });
 }
 
 // ================================
 // Boot / entry
 // ================================
+// ================================
+// Service Worker (오프라인/즉시 표시 캐시, sw.js)
+// ================================
+function registerServiceWorker() {
+  if (!("serviceWorker" in navigator)) return;
+
+  // 처음 설치(컨트롤러 없음 → 있음)는 새 버전이 아니므로 알림 안 함
+  const hadController = !!navigator.serviceWorker.controller;
+
+  navigator.serviceWorker.register("sw.js").catch((err) => {
+    console.warn("[sw] 등록 실패 (캐시 없이 동작)", err);
+  });
+
+  // 캐시로 먼저 그린 뒤 뒤에서 새 데이터 / 새 화면 파일이 확인되면 알림
+  navigator.serviceWorker.addEventListener("message", (ev) => {
+    if (ev.data?.type === "data-updated") showUpdateBanner();
+    if (ev.data?.type === "shell-updated") showUpdateBanner("새 버전이 있습니다 · 새로고침");
+  });
+
+  // sw.js 자체가 바뀌어 새 서비스 워커가 이 페이지를 넘겨받음
+  navigator.serviceWorker.addEventListener("controllerchange", () => {
+    if (hadController) showUpdateBanner("새 버전이 있습니다 · 새로고침");
+  });
+}
+
+function showUpdateBanner(text = "새 데이터가 있습니다 · 새로고침") {
+  if (document.getElementById("updateBanner")) return;
+
+  const btn = document.createElement("button");
+  btn.id = "updateBanner";
+  btn.className = "updateBanner";
+  btn.textContent = text;
+  btn.onclick = () => location.reload();
+  document.querySelector(".topbar")?.appendChild(btn);
+}
+
 async function boot() {
   // 1) UI초기화
+  setupPerf();
   setDefaultDateToToday();
+  registerServiceWorker();
 
   document.getElementById("btnReload").addEventListener("click", () => {
     alert("기간 선택은 아직 안됨");
   });
 
-  // 2) 데이터 로드
+  // 2) 데이터 로드 + 렌더
   // let module_path = "./modules/bestturn/skins/new_dashboard/";
+  // 모든 파일을 동시에 요청하고, 섹션은 자기 데이터가 도착하는 대로 바로 렌더
+  const inflight = new Map();
+  const fetchOnce = (path) => {
+    if (!inflight.has(path)) inflight.set(path, loadJsonTimed(path));
+    return inflight.get(path);
+  };
 
-  // Section 1
-  const counts = await loadJson("data/section1_counts.json");
-  const points = await loadJson("data/section1_saved_points.json");
-  const stats = await loadJson("data/section1_saved_stats.json");
-
-  // Section2
-  const s2List = await loadJson("data/section2_aircraft_list.json");
-  const s2Ts = await loadJson("data/section2_aircraft_timeseries.json");
-  const s2Proc = await loadJson("data/section2_process_timeseries.json");
-
-  // Section3
-  const s3 = await loadJson("data/section3_worker_process_counts.json");
-  const s3Speed = await loadJson("data/section3_speed_rows.json");
+  await Promise.all(SECTION_TASKS.map((task) => runSectionTask(task, fetchOnce)));
+  perfSend("boot"); // 첫 화면까지의 fetch / parse / render 시간
 
-  // 렌더
-  renderDonutCounts(counts); //Section 1-1
-  renderSavedBox(points, stats); //Section 1-2
-  renderSection2(s2List, s2Ts, s2Proc); //Section2
-  renderSection3(s3); //Section 3-1
-  renderSection3SpeedChart(s3Speed); //Section 3-2
+  // 3) 처음 그리기가 끝난 뒤부터 ETL 데몬의 변경 알림 받기
+  connectLiveUpdates();
 }
 
-document.addEventListener("DOMContentLoaded", () => {
-  boot().catch((err) => {
-    console.error(err);
-    alert("대시보드 로딩 실패.." + err);
-  });
-});
+// app.js는 defer로 로드되므로 DOM은 이미 준비됨 (Plotly도 head의 defer라 먼저 실행됨) → 바로 시작
+// 섹션별 에러는 runSectionTask에서 화면에 표시, 여기는 예상 못한 에러만
+boot().catch((err) => console.error(err));
@@ -0,0 +1,389 @@
+// ================================
+// bench_shaping.js
+// 목적: shaping.js (대시보드 데이터 모양 만들기) 속도 / 메모리 측정 — 합성 payload, 브라우저 불필요
+// 실행(web 폴더에서):
+//   node --expose-gc bench_shaping.js                    # 1× / 10× / 100×
+//   node --expose-gc bench_shaping.js 1 10               # 배율 지정
+//   node --expose-gc bench_shaping.js --json > base.json # 결과 저장
+//   node --expose-gc bench_shaping.js --baseline base.json [--tolerance 0.3]
+//     → 저장한 결과보다 ops/sec 가 tolerance(기본 30%) 넘게 떨어진 항목이 있으면 exit 1
+// --expose-gc 가 있으면 측정 전에 GC 를 돌려서 heap 값이 덜 흔들림
+// ================================
+
+const fs = require("fs");
+const path = require("path");
+const S = require(path.join(__dirname, "shaping.js"));
+
+const AIRLINES = ["HH", "RF", "8M"];
+const AIRCRAFT = ["A320", "A321", "B737", "B777", "A330", "B787"];
+const ROLES = [
+  ["소닉1", "소닉", "1"],
+  ["소닉2", "소닉", "2"],
+  ["소닉3", "소닉", "3"],
+  ["소닉4", "소닉", "4"],
+  ["소닉5", "소닉", "5"],
+  ["소닉6", "소닉", "6"],
+  ["라바", "라바", "0"],
+  ["로보캅", "로보캅", "0"],
+];
+const PROCS = ["소닉", "라바", "로보캅"];
+
+// 1× 크기 (배율만큼 늘림)
+const BASE = {
+  speedRows: 5000, // section3_speed_rows
+  members: 300,
+  countRows: 2000, // section3_worker_process_counts
+  savedPoints: 3000, // section1_saved_points
+  days: 90, // section2_* 일별 series 길이
+};
+
+const MIN_TIME_MS = 300; // 항목마다 최소 측정 시간
+const MIN_ITERS = 3;
+
+// ================================
+// 합성 데이터 (seed 고정 → 매번 같은 payload)
+// ================================
+function rng(seed) {
+  // mulberry32
+  return () => {
+    seed |= 0;
+    seed = (seed + 0x6d2b79f5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+function dayList(n) {
+  const out = [];
+  const d = new Date(Date.UTC(2024, 0, 1));
+  for (let i = 0; i < n; i++) {
+    out.push(Number(d.toISOString().slice(0, 10).replaceAll("-", "")));
+    d.setUTCDate(d.getUTCDate() + 1);
+  }
+  return out;
+}
+
+function makeSpeedDict(scale, rand) {
+  const pick = (arr) => arr[Math.floor(rand() * arr.length)];
+  const n = BASE.speedRows * scale;
+  const nMembers = BASE.members * Math.ceil(Math.sqrt(scale));
+  const dates = dayList(BASE.days * scale).map((d) => S.yyyymmddToISO(d));
+  const flights = Array.from({ length: 2000 }, (_, i) => `${pick(AIRLINES)}${1000 + i}`);
+  const members = Array.from({ length: nMembers }, (_, i) => [i + 1, `user${i + 1}`, `작업자${i + 1}`]);
+
+  const rows = [];
+  for (let i = 0; i < n; i++) {
+    const f = Math.floor(rand() * flights.length);
+    const sec = 60 + Math.floor(rand() * 1800);
+    rows.push([
+      Math.floor(rand() * dates.length),
+      AIRLINES.indexOf(flights[f].slice(0, 2)),
+      f,
+      Math.floor(rand() * ROLES.length),
+      Math.floor(rand() * nMembers),
+      sec,
+      Math.round((sec / 60) * 10) / 10,
+    ]);
+  }
+  return {
+    format: "dict-v1",
+    range: { from: "20240101", to: "20241231" },
+    tables: { dates, airlines: AIRLINES, flights, roles: ROLES, members },
+    rows,
+  };
+}
+
+function makeSpeedSummary(rows) {
+  // ETL speed_summary 와 같은 모양 (airline, process, zone, member 별)
+  const acc = new Map();
+  rows.forEach((r) => {
+    const key = `${r.airline}|${r.process}|${r.zone}|${r.member_srl}`;
+    let a = acc.get(key);
+    if (!a) {
+      a = { airline: r.airline, process: r.process, zone: r.zone, member_srl: r.member_srl, member_name: r.member_name, secs: [], sample: r };
+      acc.set(key, a);
+    }
+    a.secs.push(r.time_sec);
+  });
+  return {
+    rows: Array.from(acc.values(), (a) => {
+      const s = a.secs.sort((x, y) => x - y);
+      const sum = s.reduce((x, y) => x + y, 0);
+      return {
+        airline: a.airline,
+        process: a.process,
+        zone: a.zone,
+        member_srl: a.member_srl,
+        member_name: a.member_name,
+        count: s.length,
+        sum_sec: sum,
+        mean_sec: sum / s.length,
+        median_sec: s[Math.floor(s.length / 2)],
+        p90_sec: s[Math.floor(s.length * 0.9)],
+        sample: { date: a.sample.date, flight_title: a.sample.flight_title, time_sec: a.sample.time_sec },
+      };
+    }),
+  };
+}
+
+function makeCounts(scale, rand) {
+  const nMembers = BASE.members * Math.ceil(Math.sqrt(scale));
+  return Array.from({ length: BASE.countRows * scale }, () => {
+    const m = 1 + Math.floor(rand() * nMembers);
+    return {
+      member_srl: m,
+      member_name: `작업자${m}`,
+      process: PROCS[Math.floor(rand() * PROCS.length)],
+      aircraft_cnt: 1 + Math.floor(rand() * 20),
+    };
+  });
+}
+
+function makeSavedPoints(scale, rand) {
+  return Array.from({ length: BASE.savedPoints * scale }, () => ({
+    airline: AIRLINES[Math.floor(rand() * AIRLINES.length)],
+    saved_sec: Math.round((rand() - 0.3) * 1200),
+  }));
+}
+
+/** 일별 series + 주/월 rollup (ETL finish_outputs 와 같은 모양) */
+function withRollups(series, sumRow) {
+  const rollups = { week: {}, month: {} };
+  const bucketOf = {
+    week: (d) => {
+      const t = Date.UTC(+String(d).slice(0, 4), +String(d).slice(4, 6) - 1, +String(d).slice(6, 8));
+      return Math.floor((t / 86400000 + 3) / 7); // 월요일 시작 주 번호
+    },
+    month: (d) => Math.floor(d / 100),
+  };
+  Object.entries(series).forEach(([key, rows]) => {
+    for (const res of ["week", "month"]) {
+      const groups = new Map();
+      rows.forEach((r) => {
+        const b = bucketOf[res](r.yyyymmdd);
+        if (!groups.has(b)) groups.set(b, []);
+        groups.get(b).push(r);
+      });
+      rollups[res][key] = Array.from(groups.values(), (g) => ({
+        ...sumRow(g),
+        yyyymmdd: g[0].yyyymmdd,
+        yyyymmdd_to: g[g.length - 1].yyyymmdd,
+        days: g.length,
+      }));
+    }
+  });
+  return rollups;
+}
+
+function makeS2Timeseries(scale, rand) {
+  const days = dayList(BASE.days * scale);
+  const series = {};
+  AIRLINES.forEach((a) =>
+    AIRCRAFT.forEach((ac) => {
+      const std = 1500 + Math.floor(rand() * 900);
+      series[`${a}|${ac}`] = days.map((d) => {
+        const avg = std * (0.7 + rand() * 0.6);
+        return {
+          yyyymmdd: d,
+          n: 1 + Math.floor(rand() * 12),
+          avg_actual_sec: Math.round(avg * 10) / 10,
+          min_actual_sec: Math.round(avg * 0.8),
+          max_actual_sec: Math.round(avg * 1.3),
+          standard_sec: std,
+        };
+      });
+    })
+  );
+  const rollups = withRollups(series, (g) => {
+    const n = g.reduce((x, r) => x + r.n, 0);
+    return {
+      n,
+      avg_actual_sec: g.reduce((x, r) => x + r.avg_actual_sec * r.n, 0) / n,
+      min_actual_sec: Math.min(...g.map((r) => r.min_actual_sec)),
+      max_actual_sec: Math.max(...g.map((r) => r.max_actual_sec)),
+      standard_sec: g[0].standard_sec,
+    };
+  });
+  return { series, rollups };
+}
+
+function makeS2Process(scale, rand) {
+  const days = dayList(BASE.days * scale);
+  const series = {};
+  const period = {};
+  AIRLINES.forEach((a) =>
+    PROCS.forEach((p) => {
+      const rows = days.map((d) => {
+        const members = 1 + Math.floor(rand() * 8);
+        const avgMin = 5 + rand() * 20;
+        return { yyyymmdd: d, avg_min: Math.round(avgMin * 10) / 10, members, sum_sec: Math.round(avgMin * 60 * members) };
+      });
+      series[`${a}|${p}`] = rows;
+      period[`${a}|${p}`] = rows.reduce((x, r) => x + r.avg_min, 0) / rows.length;
+    })
+  );
+  const rollups = withRollups(series, (g) => ({
+    avg_min: g.reduce((x, r) => x + r.avg_min, 0) / g.length,
+    min_avg_min: Math.min(...g.map((r) => r.avg_min)),
+    max_avg_min: Math.max(...g.map((r) => r.avg_min)),
+    members: g.reduce((x, r) => x + r.members, 0),
+    sum_sec: g.reduce((x, r) => x + r.sum_sec, 0),
+  }));
+  return { series, rollups, period_avg_min: period };
+}
+
+// ================================
+// 측정
+// ================================
+function gc() {
+  if (global.gc) global.gc();
+}
+
+function measure(fn) {
+  // 1) 한 번 돌려서 JIT 예열 + 결과가 붙잡는 heap
+  gc();
+  const before = process.memoryUsage().heapUsed;
+  let keep = fn();
+  const heapDelta = process.memoryUsage().heapUsed - before;
+  keep = null;
+
+  // 2) 최소 시간 / 최소 횟수만큼 반복
+  gc();
+  let iters = 0;
+  let sink = 0;
+  const t0 = process.hrtime.bigint();
+  let elapsed = 0;
+  while (elapsed < MIN_TIME_MS || iters < MIN_ITERS) {
+    const out = fn();
+    sink ^= out ? 1 : 0; // 결과를 버리지 않게 (최적화로 호출이 사라지는 것 방지)
+    iters += 1;
+    elapsed = Number(process.hrtime.bigint() - t0) / 1e6;
+  }
+  const heapUsed = process.memoryUsage().heapUsed;
+  return {
+    ops_per_sec: (iters * 1000) / elapsed,
+    ms_per_op: elapsed / iters,
+    heap_delta_mb: heapDelta / 1048576,
+    heap_used_mb: heapUsed / 1048576,
+    iters,
+    sink,
+  };
+}
+
+function makeCases(scale) {
+  const rand = rng(42 + scale);
+  const dictPayload = makeSpeedDict(scale, rand);
+  const speedRows = S.decodeDictRows(dictPayload).rows;
+  const summary = makeSpeedSummary(speedRows);
+  const hhSummary = S.pickAirline(summary, "HH");
+  const roles = S.aggregateRolesByMember(speedRows, "HH");
+  const roleRows = speedRows.filter((r) => r.airline === "HH" && r.role_label === "소닉1");
+  const counts = makeCounts(scale, rand);
+  const pivoted = S.pivotProcessCounts(counts);
+  const points = makeSavedPoints(scale, rand);
+  const stats = AIRLINES.map((code) => ({ code, n: 1, avg_saved_sec: 0 }));
+  const ts = makeS2Timeseries(scale, rand);
+  const proc = makeS2Process(scale, rand);
+  const lastDay = S.yyyymmddToISO(dayList(BASE.days * scale).pop());
+  const zoom = ["2024-02-01", "2024-03-15"];
+
+  return [
+    ["S3 decodeDictRows", dictPayload.rows.length, () => S.decodeDictRows(dictPayload)],
+    ["S3 aggregateRolesByMember", speedRows.length, () => S.aggregateRolesByMember(speedRows, "HH")],
+    ["S3 aggregateByMember (1 role)", roleRows.length, () => S.aggregateByMember(roleRows)],
+    ["S3 rolesFromSummary", hhSummary.rows.length, () => S.rolesFromSummary(hhSummary)],
+    ["S3 speedBarData (all cards)", roles.length, () => roles.map(S.speedBarData)],
+    ["S3 speedRowsFor (drill)", speedRows.length, () => S.speedRowsFor(speedRows, "소닉1", roles[0].keys[0])],
+    ["S3-1 pivotProcessCounts", counts.length, () => S.pivotProcessCounts(counts)],
+    ["S3-1 sortFilterRows (total)", pivoted.length, () => S.sortFilterRows(pivoted, "", "_total", -1)],
+    ["S3-1 sortFilterRows (name+q)", pivoted.length, () => S.sortFilterRows(pivoted, "작업자1", "member_name", 1)],
+    [
+      "S1 savedBox (by airline)",
+      points.length,
+      () => [S.savedMinutesByAirline(points, AIRLINES), S.savedStatsLine(stats, AIRLINES)],
+    ],
+    ["S2 pickAirline (timeseries)", Object.keys(ts.series).length, () => S.pickAirline(ts, "HH")],
+    [
+      "S2 aircraftSeries (all)",
+      BASE.days * scale,
+      () => AIRCRAFT.map((ac) => S.s2AircraftSeries(ts, `HH|${ac}`, null)),
+    ],
+    [
+      "S2 aircraftSeries (zoom)",
+      BASE.days * scale,
+      () => AIRCRAFT.map((ac) => S.s2AircraftSeries(ts, `HH|${ac}`, [zoom[0], lastDay < zoom[1] ? lastDay : zoom[1]])),
+    ],
+    ["S2 processSeries (all)", BASE.days * scale, () => PROCS.map((p) => S.s2ProcessSeries(proc, `HH|${p}`, null))],
+  ];
+}
+
+// ================================
+// main
+// ================================
+function parseArgs(argv) {
+  const opts = { scales: [], json: false, baseline: null, tolerance: 0.3 };
+  for (let i = 0; i < argv.length; i++) {
+    const a = argv[i];
+    if (a === "--json") opts.json = true;
+    else if (a === "--baseline") opts.baseline = argv[++i];
+    else if (a === "--tolerance") opts.tolerance = Number(argv[++i]);
+    else if (/^\d+$/.test(a)) opts.scales.push(Number(a));
+    else throw new Error(`알 수 없는 인자: ${a}`);
+  }
+  if (opts.scales.length === 0) opts.scales = [1, 10, 100];
+  return opts;
+}
+
+function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  const log = opts.json ? () => {} : (s) => console.log(s);
+  if (!global.gc) log("(--expose-gc 없이 실행: heap 값이 GC 시점에 따라 흔들릴 수 있음)");
+
+  const results = {};
+  for (const scale of opts.scales) {
+    log(`\n### ${scale}× (speed rows ${(BASE.speedRows * scale).toLocaleString()}, days ${BASE.days * scale})`);
+    log(`  ${"항목".padEnd(32)}${"입력".padStart(10)}${"ops/sec".padStart(12)}${"ms/op".padStart(11)}${"heapΔ MB".padStart(10)}${"heap MB".padStart(9)}`);
+
+    for (const [name, n, fn] of makeCases(scale)) {
+      const r = measure(fn);
+      results[`${scale}x ${name}`] = {
+        scale,
+        input: n,
+        ops_per_sec: Math.round(r.ops_per_sec * 10) / 10,
+        ms_per_op: Math.round(r.ms_per_op * 1000) / 1000,
+        heap_delta_mb: Math.round(r.heap_delta_mb * 100) / 100,
+        heap_used_mb: Math.round(r.heap_used_mb * 10) / 10,
+      };
+      log(
+        `  ${name.padEnd(32)}${String(n).padStart(10)}${r.ops_per_sec.toFixed(1).padStart(12)}` +
+          `${r.ms_per_op.toFixed(3).padStart(11)}${r.heap_delta_mb.toFixed(2).padStart(10)}${r.heap_used_mb.toFixed(1).padStart(9)}`
+      );
+    }
+  }
+
+  if (opts.json) {
+    process.stdout.write(
+      JSON.stringify({ node: process.version, generated_at: new Date().toISOString(), results }, null, 2) + "\n"
+    );
+  }
+
+  if (opts.baseline) {
+    const base = JSON.parse(fs.readFileSync(opts.baseline, "utf8")).results || {};
+    const slower = Object.entries(results)
+      .filter(([key]) => base[key])
+      .map(([key, r]) => [key, r.ops_per_sec / base[key].ops_per_sec])
+      .filter(([, ratio]) => ratio < 1 - opts.tolerance);
+
+    const out = opts.json ? (s) => console.error(s) : log;
+    if (slower.length) {
+      out(`\n❌ 기준(${opts.baseline})보다 ${Math.round(opts.tolerance * 100)}% 넘게 느려진 항목`);
+      slower.forEach(([key, ratio]) => out(`  ${key}: x${ratio.toFixed(2)}`));
+      process.exitCode = 1;
+    } else {
+      out(`\n✅ 기준(${opts.baseline}) 대비 느려진 항목 없음 (허용 ${Math.round(opts.tolerance * 100)}%)`);
+    }
+  }
+}
+
+main();
@@ -0,0 +1,182 @@
+// ================================
+// Section 3-2 Web Worker: 작업자별 공정 속도 집계
+// - 항공사 shard를 받을 때마다 rows를 typed array(열 단위)로 한 번만 변환해서 보관
+// - 항공사별로 role_label -> row index 목록을 미리 만들어 둠
+// - 탭 클릭마다 필터/집계는 여기서 하고, 메인 스레드는 그리기만
+// ================================
+
+/** 문자열 -> 정수 코드 (사전 인코딩) */
+function makeDict() {
+  const codes = new Map();
+  const values = [];
+  return {
+    values,
+    code(v) {
+      let c = codes.get(v);
+      if (c === undefined) {
+        c = values.length;
+        codes.set(v, c);
+        values.push(v);
+      }
+      return c;
+    },
+  };
+}
+
+// 항공사별 열 저장소 (load 때 채움): airline -> store
+const stores = new Map();
+
+function buildStore(rows) {
+  const n = rows.length;
+
+  const memberDict = makeDict(); // member_key
+  const dateDict = makeDict();
+  const titleDict = makeDict();
+
+  const memberNames = []; // member code -> 표시 이름 (항공사별)
+  const member = new Uint32Array(n);
+  const date = new Uint32Array(n);
+  const title = new Uint32Array(n);
+  const timeSec = new Float64Array(n);
+
+  // role -> row index(number[]) → 마지막에 Int32Array로
+  const groups = new Map();
+
+  for (let i = 0; i < n; i++) {
+    const r = rows[i];
+
+    const role = r.role_label || "(unknown)";
+
+    const key =
+      r.member_srl != null ? String(r.member_srl) : String(r.member_name || "");
+    const m = memberDict.code(key);
+    if (m === memberNames.length) memberNames.push(r.member_name || key);
+
+    member[i] = m;
+    date[i] = dateDict.code(r.date || "");
+    title[i] = titleDict.code(r.flight_title || "");
+    timeSec[i] = Number(r.time_sec || 0);
+
+    if (!groups.has(role)) groups.set(role, []);
+    groups.get(role).push(i);
+  }
+
+  const index = new Map();
+  groups.forEach((idx, role) => index.set(role, Int32Array.from(idx)));
+
+  // 집계용 버퍼 (member 수만큼 한 번만 할당, 매 쿼리 재사용)
+  const nMembers = memberNames.length;
+
+  return {
+    memberKeys: memberDict.values,
+    memberNames,
+    dates: dateDict.values,
+    titles: titleDict.values,
+    member,
+    date,
+    title,
+    timeSec,
+    index,
+    count: new Int32Array(nMembers),
+    sum: new Float64Array(nMembers),
+    firstRow: new Int32Array(nMembers).fill(-1),
+  };
+}
+
+/**
+ * 한 그룹(항공사 store 안의 role)의 작업자별 평균
+ * - 원래 aggregateByMember와 같은 결과 (count, sum, avg, 첫 행 샘플)
+ * - 평균 오름차순 정렬
+ */
+function aggregateGroup(store, rowIdx) {
+  const { member, timeSec, count, sum, firstRow } = store;
+  const touched = [];
+
+  for (let k = 0; k < rowIdx.length; k++) {
+    const i = rowIdx[k];
+    const m = member[i];
+    if (count[m] === 0) {
+      touched.push(m);
+      firstRow[m] = i;
+    }
+    count[m] += 1;
+    sum[m] += timeSec[i];
+  }
+
+  touched.sort((a, b) => sum[a] / count[a] - sum[b] / count[b]);
+
+  const len = touched.length;
+  const out = {
+    keys: new Array(len),
+    names: new Array(len),
+    avgSec: new Float64Array(len),
+    count: new Int32Array(len),
+    sumTimeSec: new Float64Array(len),
+    sampleDate: new Array(len),
+    sampleTitle: new Array(len),
+    sampleTimeSec: new Float64Array(len),
+  };
+
+  for (let j = 0; j < len; j++) {
+    const m = touched[j];
+    const s = firstRow[m];
+    out.keys[j] = store.memberKeys[m];
+    out.names[j] = store.memberNames[m];
+    out.avgSec[j] = sum[m] / count[m];
+    out.count[j] = count[m];
+    out.sumTimeSec[j] = sum[m];
+    out.sampleDate[j] = store.dates[store.date[s]];
+    out.sampleTitle[j] = store.titles[store.title[s]];
+    out.sampleTimeSec[j] = timeSec[s];
+
+    // 다음 쿼리를 위해 버퍼 초기화 (건드린 칸만)
+    count[m] = 0;
+    sum[m] = 0;
+    firstRow[m] = -1;
+  }
+
+  return out;
+}
+
+function queryAirline(airline) {
+  const store = stores.get(airline);
+  if (!store) return [];
+
+  return Array.from(store.index.keys())
+    .filter((role) => role && role !== "(unknown)")
+    .sort()
+    .map((role) => ({ role, ...aggregateGroup(store, store.index.get(role)) }));
+}
+
+self.onmessage = (ev) => {
+  const msg = ev.data || {};
+
+  if (msg.type === "load") {
+    // shard는 이미 한 항공사 rows만 들어있음
+    stores.set(msg.airline, buildStore(msg.rows || []));
+    self.postMessage({
+      id: msg.id,
+      type: "loaded",
+      airline: msg.airline,
+      n: (msg.rows || []).length,
+    });
+    return;
+  }
+
+  if (msg.type === "query") {
+    const roles = queryAirline(msg.airline);
+    const transfer = [];
+    roles.forEach((r) =>
+      transfer.push(
+        r.avgSec.buffer,
+        r.count.buffer,
+        r.sumTimeSec.buffer,
+        r.sampleTimeSec.buffer
+      )
+    );
+    self.postMessage(
+      { id: msg.id, type: "result", airline: msg.airline, roles },
+      transfer
+    );
+  }
+};
@@ -0,0 +1,467 @@
+// ================================
+// 대시보드 데이터 모양 만들기 (DOM / Plotly 없는 순수 함수)
+// - 브라우저: index.html 에서 app.js 보다 먼저 <script defer> → 전역 함수로 씀
+// - Node: require("./shaping.js") → bench_shaping.js 에서 속도/메모리 측정
+// - 화면(app.js)은 여기 결과를 Plotly trace / 테이블 DOM 으로 옮기기만 함
+// ================================
+
+// ================================
+// 공통 포맷
+// ================================
+function yyyymmddToISO(yyyymmdd) {
+  const s = String(yyyymmdd);
+  return `${s.slice(0, 4)}-${s.slice(4, 6)}-${s.slice(6, 8)}`;
+}
+
+function fmtMin(sec) {
+  return `${(sec / 60).toFixed(1)}분`;
+}
+
+function escapeHtml(s) {
+  return String(s)
+    .replaceAll("&", "&amp;")
+    .replaceAll("<", "&lt;")
+    .replaceAll(">", "&gt;")
+    .replaceAll('"', "&quot;")
+    .replaceAll("'", "&#039;");
+}
+
+function secToMMSS(sec) {
+  if (sec == null || isNaN(sec)) return "-";
+  sec = Math.round(sec);
+  const m = Math.floor(sec / 60);
+  const s = sec % 60;
+  return `${m}분 ${String(s).padStart(2, "0")}초`;
+}
+
+// ================================
+// Shard payload
+// ================================
+/**
+ * section3_speed_rows_dict (format "dict-v1") -> section3_speed_rows 와 같은 rows
+ * - 행: [date, airline, flight, role, member, time_sec, total_min] (앞 5개는 tables index)
+ * - 같은 작업자/편명 문자열은 tables 의 값 하나를 모든 행이 같이 씀 (메모리 절약)
+ */
+function decodeDictRows(payload) {
+  if (payload?.format !== "dict-v1") return payload; // 이미 rows 형식
+
+  const t = payload.tables;
+  const rows = payload.rows.map(([d, a, f, ro, m, timeSec, totalMin]) => {
+    const [roleLabel, process, zone] = t.roles[ro];
+    const [memberSrl, userId, name] = t.members[m];
+    return {
+      date: t.dates[d],
+      airline: t.airlines[a],
+      flight_title: t.flights[f],
+      role_label: roleLabel,
+      process,
+      zone,
+      member_srl: memberSrl,
+      member_user_id: userId,
+      member_name: name,
+      time_sec: timeSec,
+      backup_sec_attached: 0,
+      total_min: totalMin,
+    };
+  });
+
+  return { range: payload.range, airline: payload.airline, rows };
+}
+
+/** 전체 payload에서 한 항공사 몫만 (ETL airline_shard와 같은 규칙) */
+function pickAirline(payload, airline) {
+  payload = decodeDictRows(payload);
+  const prefix = `${airline}|`;
+  const filterKeys = (obj) =>
+    obj &&
+    Object.fromEntries(
+      Object.entries(obj).filter(([k]) => k.startsWith(prefix))
+    );
+
+  return {
+    ...payload,
+    airline,
+    rows: payload.rows?.filter(
+      (r) => (r.airline || String(r.flight_title || "").slice(0, 2)) === airline
+    ),
+    series: filterKeys(payload.series),
+    period_avg_min: filterKeys(payload.period_avg_min),
+    rollups:
+      payload.rollups &&
+      Object.fromEntries(
+        Object.entries(payload.rollups).map(([res, byKey]) => [res, filterKeys(byKey)])
+      ),
+  };
+}
+
+// ================================
+// Section 1-2: 절감시간 상자 그림
+// ================================
+/** points 를 한 번만 돌면서 항공사별 절감시간(분) 배열 (order 에 없는 항공사는 버림) */
+function savedMinutesByAirline(points, order) {
+  const byAirline = new Map(order.map((code) => [code, []]));
+  for (const p of points) {
+    const list = byAirline.get(p.airline);
+    if (list) list.push(p.saved_sec / 60);
+  }
+  return byAirline;
+}
+
+/** 요약 문구: order 순서로 "HH: 평균 3.2분 (n=120)" */
+function savedStatsLine(stats, order) {
+  const statsMap = new Map(stats.map((s) => [s.code, s]));
+  return order
+    .filter((code) => statsMap.has(code))
+    .map((code) => {
+      const s = statsMap.get(code);
+      return `${code}: 평균 ${fmtMin(s.avg_saved_sec)} (n=${s.n})`;
+    })
+    .join(" · ");
+}
+
+// ================================
+// Section 2: 해상도 (일/주/월) + 차트 시리즈
+// ================================
+// 보이는 구간의 막대가 S2_MAX_BARS 이하가 되는 가장 촘촘한 단위를 고름
+//   - ETL이 series(일) + rollups.week / rollups.month 를 같이 줌 (예전 파일은 일별만)
+//   - 확대(zoom)하면 그 구간 기준으로 다시 골라서 그림
+const S2_MAX_BARS = 90;
+const S2_RES_LABEL = { day: "일", week: "주", month: "월" };
+
+function s2Resolution(json, key, range) {
+  const levels = [
+    ["day", json.series?.[key]],
+    ["week", json.rollups?.week?.[key]],
+    ["month", json.rollups?.month?.[key]],
+  ].filter(([, rows]) => rows);
+
+  // range: ["YYYY-MM-DD", "YYYY-MM-DD"] (확대 구간) 또는 null(전체)
+  const inRange = (r) => {
+    if (!range) return true;
+    const from = yyyymmddToISO(r.yyyymmdd);
+    const to = yyyymmddToISO(r.yyyymmdd_to || r.yyyymmdd);
+    return to >= range[0].slice(0, 10) && from <= range[1].slice(0, 10);
+  };
+
+  let picked = { res: "day", rows: [] };
+  for (const [res, rows] of levels) {
+    picked = { res, rows: rows.filter(inRange) };
+    if (picked.rows.length <= S2_MAX_BARS) break;
+  }
+  return picked;
+}
+
+function s2PeriodLabel(r, res) {
+  if (res === "day") return `날짜: ${r.yyyymmdd}`;
+  return `${S2_RES_LABEL[res]}: ${r.yyyymmdd}~${r.yyyymmdd_to} (${r.days}일)`;
+}
+
+/** Section 2-1 (항공기 작업타입): 막대(실제 평균) + 선(표준) 데이터 */
+function s2AircraftSeries(tsJson, key, range) {
+  const { res, rows } = s2Resolution(tsJson, key, range);
+
+  const x = rows.map((r) => yyyymmddToISO(r.yyyymmdd));
+  const yBar = rows.map((r) => r.avg_actual_sec / 60); // 분
+  const barColors = rows.map((r) =>
+    r.avg_actual_sec > r.standard_sec ? "#E05A4F" : "#B2C6D3"
+  );
+
+  const stdSec = rows.length ? rows[0].standard_sec : null; // 초(고정)
+  const yStd = rows.map(() => (stdSec == null ? null : stdSec / 60)); // 분(선 그리기용)
+
+  const hover = rows.map(
+    (r) =>
+      `${s2PeriodLabel(r, res)}<br>` +
+      `평균: ${secToMMSS(r.avg_actual_sec)}<br>` +
+      `최단: ${secToMMSS(r.min_actual_sec)}<br>` +
+      `최장: ${secToMMSS(r.max_actual_sec)}<br>` +
+      `n=${r.n}<extra></extra>`
+  );
+
+  return { res, rows, x, yBar, barColors, stdSec, yStd, hover };
+}
+
+/** Section 2-2 (공정): 1인당 평균(분) 막대 + 최대/최소 색 + 기간 평균 */
+function s2ProcessSeries(procJson, key, range) {
+  const { res, rows } = s2Resolution(procJson, key, range);
+
+  // x: 날짜, y: 1인당 평균(분)
+  const x = rows.map((r) => yyyymmddToISO(r.yyyymmdd));
+  const y = rows.map((r) => Number(r.avg_min));
+
+  // 최대/최소 색상 (spread 대신 loop: 막대가 많아도 인자 개수 제한 없음)
+  let maxVal = -Infinity;
+  let minVal = Infinity;
+  for (const v of y) {
+    if (v > maxVal) maxVal = v;
+    if (v < minVal) minVal = v;
+  }
+  const colors = y.map((v) => {
+    if (v === maxVal) return "#ecab86"; // 빨강
+    if (v === minVal) return "#69C6DD"; // 파랑
+    return "#B2C6D3"; // 기본 회색
+  });
+
+  const hover = rows.map((r) => {
+    const avgSec = Number(r.avg_min) * 60;
+
+    return (
+      `${s2PeriodLabel(r, res)}<br>` +
+      `평균(1인): ${secToMMSS(avgSec)}<br>` +
+      `인원: ${r.members}명<br>` +
+      (res === "day"
+        ? ""
+        : `일별 평균 범위: ${secToMMSS(r.min_avg_min * 60)} ~ ${secToMMSS(r.max_avg_min * 60)}<br>`) +
+      `총합: ${secToMMSS(r.sum_sec)}<extra></extra>`
+    );
+  });
+
+  // 점선: 기간 평균
+  const avg = procJson.period_avg_min?.[key];
+
+  return { res, rows, x, y, colors, hover, avg };
+}
+
+// ================================
+// Section 3-1: 작업자별 공정 수행 횟수
+// ================================
+const S3_PROCS = ["소닉", "로보캅", "라바"];
+
+/** member 단위로 피벗 집계: [{member_name, 소닉: n, 로보캅: n, 라바: n, _total}] */
+function pivotProcessCounts(baseRows) {
+  const map = new Map();
+
+  baseRows.forEach((r) => {
+    const name = r.member_name || String(r.member_srl); // 이름 없으면 srl
+    const proc = r.process;
+    const cnt = Number(r.aircraft_cnt || 0);
+
+    if (!map.has(name)) {
+      map.set(name, {
+        member_name: name,
+        소닉: 0,
+        로보캅: 0,
+        라바: 0,
+        _total: 0,
+      });
+    }
+
+    const row = map.get(name);
+
+    // 예상 외 라벨이 들어오면 스킵
+    if (proc === "소닉" || proc === "로보캅" || proc === "라바") {
+      row[proc] += cnt;
+      row._total += cnt;
+    }
+  });
+
+  return Array.from(map.values());
+}
+
+/** 검색(작업자 이름) + 정렬 → 새 배열 (rows 는 그대로) */
+function sortFilterRows(rows, filterText, sortKey, sortDir) {
+  const q = filterText.trim().toLowerCase();
+  const filtered = q
+    ? rows.filter((r) => r.member_name.toLowerCase().includes(q))
+    : rows.slice();
+
+  filtered.sort((a, b) => {
+    if (sortKey === "member_name") {
+      return sortDir * a.member_name.localeCompare(b.member_name, "ko");
+    }
+    return sortDir * (a[sortKey] - b[sortKey]);
+  });
+  return filtered;
+}
+
+// ================================
+// Section 3-2: 공정별 소요시간 순위
+// ================================
+// display_sec에서 백업존 시간은 미리 계산되니까 제외 (time + attached backup)
+function speedDisplaySec(r) {
+  return Number(r.time_sec || 0);
+  // return Number(r.time_sec || 0) + Number(r.backup_sec_attached || 0);
+}
+
+/** 작업자 key: member_srl, 없으면 이름 */
+function speedMemberKey(r) {
+  return r.member_srl != null ? String(r.member_srl) : String(r.member_name || "");
+}
+
+function speedRowAirline(r) {
+  // airline 필드가 없으면 flight_title 앞 2글자 사용
+  return r.airline || String(r.flight_title || "").slice(0, 2);
+}
+
+/** 요약(section3_speed_summary) 한 행의 카드 key: 소닉1..6 / 라바 / 로보캅 (= role_label) */
+function speedRoleKey(process, zone) {
+  return zone && zone !== "0" ? `${process}${zone}` : process;
+}
+
+// 작업자별 평균(편명 1건당 평균) 집계
+function aggregateByMember(rows) {
+  const map = new Map(); // key: member_srl or name
+  rows.forEach((r) => {
+    const key = speedMemberKey(r);
+    const name = r.member_name || key;
+
+    const displaySec = speedDisplaySec(r);
+
+    if (!map.has(key)) {
+      map.set(key, {
+        member_key: key,
+        member_name: name,
+        count: 0,
+        sum_display_sec: 0,
+        sum_time_sec: 0,
+        sample: r,
+      });
+    }
+    const a = map.get(key);
+    a.count += 1;
+    a.sum_display_sec += displaySec;
+    a.sum_time_sec += Number(r.time_sec || 0);
+  });
+
+  const out = Array.from(map.values()).map((a) => ({
+    ...a,
+    avg_display_sec: a.count ? a.sum_display_sec / a.count : null,
+  }));
+
+  // 속도는 빠를수록 좋으니까 오름차순
+  out.sort(
+    (x, y) => (x.avg_display_sec ?? 1e18) - (y.avg_display_sec ?? 1e18)
+  );
+  return out;
+}
+
+/** raw rows → role 카드별 작업자 평균 (Worker 결과와 같은 모양), aggregate 는 바꿔 끼울 수 있음(측정용) */
+function aggregateRolesByMember(rows, airline, aggregate = aggregateByMember) {
+  // 1) 항공사만 필터 (zone 무시)
+  const mine = rows.filter((r) => speedRowAirline(r) === airline);
+
+  // 2) role_label별로 그룹핑
+  const roleMap = new Map(); // key = role_label
+  mine.forEach((r) => {
+    const role = r.role_label || "(unknown)";
+    if (!roleMap.has(role)) roleMap.set(role, []);
+    roleMap.get(role).push(r);
+  });
+
+  return Array.from(roleMap.keys())
+    .filter((x) => x && x !== "(unknown)")
+    .sort()
+    .map((role) => {
+      const agg = aggregate(roleMap.get(role));
+      return {
+        role,
+        keys: agg.map((a) => a.member_key),
+        names: agg.map((a) => a.member_name),
+        avgSec: agg.map((a) => a.avg_display_sec ?? 0),
+        count: agg.map((a) => a.count),
+        sumTimeSec: agg.map((a) => a.sum_time_sec),
+        sampleDate: agg.map((a) => a.sample?.date || ""),
+        sampleTitle: agg.map((a) => a.sample?.flight_title || ""),
+        sampleTimeSec: agg.map((a) => Number(a.sample?.time_sec || 0)),
+      };
+    });
+}
+
+// ETL 요약 → 차트용 배열 (Worker 결과와 같은 모양)
+function rolesFromSummary(payload) {
+  const byRole = new Map();
+  (payload.rows || []).forEach((r) => {
+    const role = speedRoleKey(r.process, r.zone);
+    if (!byRole.has(role)) byRole.set(role, []);
+    byRole.get(role).push(r);
+  });
+
+  return Array.from(byRole.keys())
+    .sort()
+    .map((role) => {
+      const list = byRole.get(role).sort((x, y) => x.mean_sec - y.mean_sec);
+      return {
+        role,
+        keys: list.map((r) => String(r.member_srl)),
+        names: list.map((r) => r.member_name || String(r.member_srl)),
+        avgSec: list.map((r) => r.mean_sec),
+        medianSec: list.map((r) => r.median_sec),
+        p90Sec: list.map((r) => r.p90_sec),
+        count: list.map((r) => r.count),
+        sumTimeSec: list.map((r) => r.sum_sec),
+        sampleDate: list.map((r) => r.sample?.date || ""),
+        sampleTitle: list.map((r) => r.sample?.flight_title || ""),
+        sampleTimeSec: list.map((r) => Number(r.sample?.time_sec || 0)),
+      };
+    });
+}
+
+/** 드릴다운: 한 작업자/카드의 원본 rows */
+function speedRowsFor(rows, role, memberKey) {
+  return rows.filter((r) => {
+    const rRole = r.role_label || speedRoleKey(r.process, r.zone);
+    return (
+      speedMemberKey(r) === memberKey &&
+      (rRole === role || speedRoleKey(r.process, r.zone) === role)
+    );
+  });
+}
+
+/** 카드 하나의 가로 막대 데이터: 작업자별 평균(분) + hover */
+function speedBarData(agg) {
+  // 작업자별 평균으로 1인 1막대
+  const y = Array.from(agg.names);
+  const x = Array.from(agg.avgSec, (sec) => sec / 60); // 분
+
+  // hover에서 backup합 제거
+  const hover = y.map(
+    (name, i) =>
+      `${escapeHtml(name)}<br>` +
+      `샘플: ${escapeHtml(agg.sampleDate[i])} ${escapeHtml(
+        agg.sampleTitle[i]
+      )}<br>` +
+      `샘플 time_sec: ${agg.sampleTimeSec[i]}초<br>` +
+      `평균: ${(agg.avgSec[i] / 60).toFixed(2)}분<br>` +
+      (agg.medianSec
+        ? `중앙값: ${secToMMSS(agg.medianSec[i])} · p90: ${secToMMSS(
+            agg.p90Sec[i]
+          )}<br>`
+        : "") +
+      `건수: ${agg.count[i]}건<br>` +
+      `time합: ${secToMMSS(agg.sumTimeSec[i])}<extra></extra>`
+  );
+
+  return { x, y, hover };
+}
+
+// Node(bench_shaping.js)에서 require 할 때만
+if (typeof module !== "undefined" && module.exports) {
+  module.exports = {
+    yyyymmddToISO,
+    fmtMin,
+    escapeHtml,
+    secToMMSS,
+    decodeDictRows,
+    pickAirline,
+    savedMinutesByAirline,
+    savedStatsLine,
+    S2_MAX_BARS,
+    S2_RES_LABEL,
+    s2Resolution,
+    s2PeriodLabel,
+    s2AircraftSeries,
+    s2ProcessSeries,
+    S3_PROCS,
+    pivotProcessCounts,
+    sortFilterRows,
+    speedDisplaySec,
+    speedMemberKey,
+    speedRowAirline,
+    speedRoleKey,
+    aggregateByMember,
+    aggregateRolesByMember,
+    rolesFromSummary,
+    speedRowsFor,
+    speedBarData,
+  };
+}
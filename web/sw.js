@@ -0,0 +1,183 @@
+// ================================
+// Service Worker: 대시보드 오프라인/즉시 표시용 캐시
+// - 화면 파일(html/css/js, vendor/ 의 Plotly 포함)과 data/*.json 을 Cache Storage에 보관
+// - 캐시가 있으면 바로 응답하고, 뒤에서 ETag(If-None-Match)로 재검증
+// - data/*.json?v=<hash> (manifest 해시가 붙은 주소)는 내용이 안 바뀌므로 재검증 없이 캐시 사용
+//   단, 받은 내용의 sha256 이 v 와 맞을 때만 저장 (서버는 주소와 상관없이 디스크에 있는 파일을 주므로)
+// - manifest.json 이나 파일 내용이 바뀌면 열린 페이지에 "data-updated" 메시지
+// - 화면 파일이 바뀌면 "shell-updated" 메시지 (다음 새로고침부터 새 파일)
+// ================================
+
+const SHELL_CACHE = "dash-shell-v1";
+const DATA_CACHE = "dash-data-v1";
+
+const SHELL_FILES = [
+  "./",
+  "./index.html",
+  "./app.css",
+  "./shaping.js",
+  "./app.js",
+  "./s3_speed_worker.js",
+  "./vendor/plotly-dash.min.js", // 차트 라이브러리도 같은 출처 → 오프라인에서도 그림 가능
+];
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    caches
+      .open(SHELL_CACHE)
+      // 하나라도 못 받으면 설치 실패 → 예전 서비스 워커가 그대로 동작 (반쪽 캐시로 바뀌지 않게)
+      .then((cache) => cache.addAll(SHELL_FILES))
+      .then(() => self.skipWaiting())
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches
+      .keys()
+      .then((keys) =>
+        Promise.all(
+          keys
+            .filter((k) => k !== SHELL_CACHE && k !== DATA_CACHE)
+            .map((k) => caches.delete(k))
+        )
+      )
+      .then(() => self.clients.claim())
+  );
+});
+
+async function notifyClients(msg) {
+  const list = await self.clients.matchAll({ type: "window" });
+  list.forEach((c) => c.postMessage(msg));
+}
+
+/**
+ * 캐시된 응답의 ETag/Last-Modified로 조건부 요청
+ * - 304: 캐시 그대로
+ * - 200: 캐시 교체, 내용이 바뀌었으면 changed=true
+ */
+async function revalidate(cacheName, request, cached) {
+  const headers = new Headers();
+  const etag = cached?.headers.get("ETag");
+  const lastModified = cached?.headers.get("Last-Modified");
+  if (etag) headers.set("If-None-Match", etag);
+  if (lastModified) headers.set("If-Modified-Since", lastModified);
+
+  const res = await fetch(request.url, { headers, cache: "no-store" });
+  if (res.status === 304 && cached) return { response: cached, changed: false };
+  if (!res.ok) return { response: cached || res, changed: false };
+
+  let changed = !cached;
+  if (cached) {
+    const [a, b] = await Promise.all([cached.clone().text(), res.clone().text()]);
+    changed = a !== b;
+  }
+
+  const cache = await caches.open(cacheName);
+  await cache.put(request, res.clone());
+  return { response: res, changed };
+}
+
+/** 캐시 우선 + 백그라운드 재검증 */
+async function staleWhileRevalidate(event, cacheName, onChanged) {
+  const request = event.request;
+  const cache = await caches.open(cacheName);
+  const cached = await cache.match(request);
+
+  // cached는 바로 응답으로 나가므로, 재검증에는 복사본을 넘김
+  const network = revalidate(cacheName, request, cached && cached.clone()).then(async (r) => {
+    if (r.changed && cached && onChanged) await onChanged(r.response.clone());
+    return r.response;
+  });
+
+  if (cached) {
+    event.waitUntil(network.catch(() => {})); // 오프라인이면 조용히 캐시 유지
+    return cached;
+  }
+  return network;
+}
+
+/** 응답 본문의 sha256(hex)이 v(앞 16자리)로 시작하는지 */
+async function bodyMatchesHash(res, v) {
+  const digest = await crypto.subtle.digest("SHA-256", await res.clone().arrayBuffer());
+  const hex = Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, "0")).join("");
+  return hex.startsWith(v);
+}
+
+/**
+ * ?v=<hash> 주소: 캐시에 있으면 그대로 (내용 불변)
+ * - 새로 받은 내용이 v 와 맞을 때만 캐시에 넣음
+ * - 안 맞으면(manifest 와 파일이 어긋난 순간 등) HTTP 캐시를 건너뛰고 한 번 더 받고, 그래도 안 맞으면 저장 없이 응답만
+ * - 해시를 못 구하는 환경(crypto.subtle 없음)은 일반 data 와 같이 재검증
+ */
+async function cacheFirst(event) {
+  const request = event.request;
+  const cache = await caches.open(DATA_CACHE);
+  const cached = await cache.match(request);
+  if (cached) return cached;
+
+  const v = new URL(request.url).searchParams.get("v");
+  if (!self.crypto?.subtle) {
+    return staleWhileRevalidate(event, DATA_CACHE, () => notifyClients({ type: "data-updated" }));
+  }
+
+  let res = await fetch(request);
+  if (res.ok && !(await bodyMatchesHash(res, v))) {
+    res = await fetch(request.url, { cache: "no-store" });
+  }
+  if (res.ok && (await bodyMatchesHash(res, v))) await cache.put(request, res.clone());
+  return res;
+}
+
+/** manifest가 바뀌면 예전 해시 버전 data 캐시를 정리하고 페이지에 알림 */
+async function onManifestChanged(res) {
+  const manifest = await res.json().catch(() => null);
+  const files = manifest?.files || {};
+
+  const cache = await caches.open(DATA_CACHE);
+  const keys = await cache.keys();
+  await Promise.all(
+    keys.map((req) => {
+      const url = new URL(req.url);
+      const v = url.searchParams.get("v");
+      if (!v) return null;
+      const name = url.pathname.split("/").pop();
+      const entry = files[name];
+      return entry && entry.sha256.startsWith(v) ? null : cache.delete(req);
+    })
+  );
+
+  await notifyClients({ type: "data-updated", generated_at: manifest?.generated_at });
+}
+
+self.addEventListener("fetch", (event) => {
+  const request = event.request;
+  if (request.method !== "GET") return;
+
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) return; // 다른 출처는 브라우저에 맡김 (Plotly 는 vendor/ 에서 받음)
+
+  if (url.pathname.endsWith("/data/manifest.json")) {
+    event.respondWith(staleWhileRevalidate(event, DATA_CACHE, onManifestChanged));
+    return;
+  }
+
+  if (url.pathname.includes("/data/")) {
+    if (url.searchParams.has("v")) {
+      event.respondWith(cacheFirst(event));
+    } else {
+      event.respondWith(
+        staleWhileRevalidate(event, DATA_CACHE, () =>
+          notifyClients({ type: "data-updated" })
+        )
+      );
+    }
+    return;
+  }
+
+  event.respondWith(
+    staleWhileRevalidate(event, SHELL_CACHE, () =>
+      notifyClients({ type: "shell-updated" })
+    )
+  );
+});